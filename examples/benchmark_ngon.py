@@ -0,0 +1,60 @@
+"""Times the flag, mark and break rules of the n-gon production family for
+several element sizes on a strip of independent elements."""
+
+import os
+import sys
+import time
+
+proj_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.append(str(proj_root))
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.productions.ngon import BreakElement, FlagElement, MarkElement
+
+
+ELEMENT_TYPES = {4: EdgeType.Q, 5: EdgeType.P, 6: EdgeType.S, 7: EdgeType.T}
+
+
+def create_strip(size: int, count: int, r: int, broken: bool = False) -> Hypergraph:
+    """`count` disjoint elements of `size` corners, sides split when `broken`."""
+    hg = Hypergraph()
+    for n in range(count):
+        corners = [f"v{n}_{i}" for i in range(size)]
+        for i, v in enumerate(corners):
+            hg.set_vertex_parameter(v, {"x": float(n + i), "y": float(i % 2)})
+            nxt = corners[(i + 1) % size]
+            if broken:
+                midpoint = f"h{n}_{i}"
+                hg.add_edge(Edge(EdgeType.E, frozenset({v, midpoint}), {"R": 0, "B": 1}))
+                hg.add_edge(Edge(EdgeType.E, frozenset({midpoint, nxt}), {"R": 0, "B": 1}))
+                hg.register_midpoint(v, nxt, midpoint)
+            else:
+                hg.add_edge(Edge(EdgeType.E, frozenset({v, nxt}), {"R": 0, "B": 1}))
+        hg.add_edge(Edge(ELEMENT_TYPES[size], frozenset(corners), {"R": r}))
+    return hg
+
+
+def run_to_fixpoint(production, graph: Hypergraph) -> tuple[int, float]:
+    start = time.perf_counter()
+    steps = 0
+    while production.apply(graph) is not None:
+        steps += 1
+    return steps, time.perf_counter() - start
+
+
+def main(count: int = 200) -> None:
+    print(f"{'k':>3} {'rule':>6} {'steps':>6} {'time [s]':>10}")
+    for size, edge_type in ELEMENT_TYPES.items():
+        rules = [
+            ("flag", FlagElement(edge_type, size), create_strip(size, count, r=0)),
+            ("mark", MarkElement(edge_type, size), create_strip(size, count, r=1)),
+            ("break", BreakElement(edge_type, size), create_strip(size, count, r=1, broken=True)),
+        ]
+        for name, production, graph in rules:
+            steps, elapsed = run_to_fixpoint(production, graph)
+            print(f"{size:>3} {name:>6} {steps:>6} {elapsed:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
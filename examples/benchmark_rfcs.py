@@ -0,0 +1,70 @@
+"""Times the built-in RFCs on a large quadrilateral mesh, evaluated in one
+batch and one element at a time."""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+proj_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.append(str(proj_root))
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.rfcs import (
+    ErrorIndicatorRFC,
+    MaxDiameterRFC,
+    PointRadiusRFC,
+    PolygonRFC,
+    VertexSetRFC,
+)
+
+
+def create_mesh(n: int) -> Hypergraph:
+    """n x n quadrilaterals on the unit square, jittered so diameters differ."""
+    hg = Hypergraph()
+    rng = np.random.default_rng(0)
+    names = [f"v{i}_{j}" for i in range(n + 1) for j in range(n + 1)]
+    grid = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing="ij"), axis=-1)
+    xy = (grid.reshape(-1, 2) + rng.uniform(-0.2, 0.2, size=(len(names), 2))) / n
+    hg.set_vertex_positions(names, xy)
+    for i in range(n):
+        for j in range(n):
+            corners = frozenset(
+                {f"v{i}_{j}", f"v{i + 1}_{j}", f"v{i + 1}_{j + 1}", f"v{i}_{j + 1}"}
+            )
+            hg.add_edge(Edge(EdgeType.Q, corners, {"R": 0}))
+    return hg
+
+
+def main(n: int = 200) -> None:
+    hg = create_mesh(n)
+    elements = hg.get_edges_of_type(EdgeType.Q)
+    rfcs = {
+        "vertex set": VertexSetRFC({f"v{i}_{i}" for i in range(n + 1)}),
+        "point radius": PointRadiusRFC((0.5, 0.5), radius=0.25),
+        "polygon": PolygonRFC([(0.1, 0.1), (0.9, 0.2), (0.5, 0.9)]),
+        "max diameter": MaxDiameterRFC(1.4 / n),
+        "error indicator": ErrorIndicatorRFC(
+            lambda x, y: np.exp(-50 * ((x - 0.3) ** 2 + (y - 0.7) ** 2)), threshold=0.5
+        ),
+    }
+
+    print(f"{len(elements)} elements")
+    print(f"{'rfc':>16} {'accepted':>9} {'batch [s]':>10} {'per edge [s]':>13}")
+    for name, rfc in rfcs.items():
+        start = time.perf_counter()
+        mask = rfc.is_valid_batch(elements, hg)
+        batch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = [rfc.is_valid(edge, hg) for edge in elements]
+        single_time = time.perf_counter() - start
+
+        assert mask.tolist() == single
+        print(f"{name:>16} {int(mask.sum()):>9} {batch_time:>10.4f} {single_time:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,6 @@ from PIL import Image
 import os
 import sys
 from pathlib import Path
-import tempfile
 
 proj_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 sys.path.append(str(proj_root))
@@ -16,25 +15,21 @@ sys.path.append(str(proj_root))
 
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
-from hypergrammar.productions.prod_0 import Prod0
-from hypergrammar.productions.prod_1 import Prod1
-from hypergrammar.productions.prod_2 import Prod2
-from hypergrammar.productions.prod_3 import Prod3
-from hypergrammar.productions.prod_4 import Prod4
-from hypergrammar.productions.prod_5 import Prod5
-from hypergrammar.productions.prod_6 import Prod6
-from hypergrammar.productions.prod_7 import Prod7
-from hypergrammar.productions.prod_8 import Prod8
-from hypergrammar.productions.prod_9 import Prod9
-from hypergrammar.productions.prod_10 import Prod10
-from hypergrammar.productions.prod_11 import Prod11
-from hypergrammar.productions.prod_12 import Prod12
-from hypergrammar.rfc import RFC
+from hypergrammar.engine import (
+    DerivationEngine,
+    DerivationHook,
+    FrameRenderer,
+    Phase,
+    default_phases,
+)
 
 
 class VertexBasedRFC:
     """RFC that filters edges based on a target vertex."""
 
+    # a single set membership test
+    cost = 1.0
+
     def __init__(self, target_vertex: Optional[str] = None):
         self.target_vertex = target_vertex
 
@@ -51,6 +46,10 @@ class VertexBasedRFC:
     def set_target_vertex(self, vertex: Optional[str]) -> None:
         self.target_vertex = vertex
 
+    def cache_token(self) -> Optional[str]:
+        # cached results are only valid for the same target
+        return self.target_vertex
+
 
 def create_initial_graph() -> Hypergraph:
     """Create the initial hypergraph with the shape from the image."""
@@ -110,6 +109,19 @@ def create_initial_graph() -> Hypergraph:
     return hg
 
 
+class PrintingHook(DerivationHook):
+    """Logs phases and applied productions to stdout."""
+
+    def phase_started(self, phase: Phase, graph: Hypergraph) -> None:
+        print(f"\n--- Phase: {phase.name} ---")
+
+    def production_applied(self, step: int, phase: Phase, production, graph: Hypergraph) -> None:
+        print(f"✓ {production.__class__.__name__} applied successfully")
+
+    def phase_finished(self, phase: Phase, graph: Hypergraph, steps: int) -> None:
+        print(f"No more {phase.name} productions can be applied.")
+
+
 def apply_all_productions_automatically(
     hg: Hypergraph,
     target_vertex: Optional[str] = None,
@@ -118,113 +130,25 @@ def apply_all_productions_automatically(
     output_dir: str = "./output"
 ) -> Hypergraph:
     rfc = VertexBasedRFC(target_vertex=target_vertex)
-    
-    refining_productions = [
-        Prod0(rfc=rfc),
-        Prod6(rfc=rfc),
-        Prod9(rfc=rfc),
-        Prod12(rfc=rfc)
-    ]
-    
-    modifying_productions = [
-        Prod1(),
-        Prod2(),
-        Prod3(),
-        Prod4(),
-        Prod5(),
-        Prod7(),
-        Prod8(),
-        Prod10(),
-        Prod11(),
-    ]
-    
-    # Temporary directory for storing frames for GIF
-    temp_dir = "output"
-    frame_list = []
-    if save_images:
-        # temp_dir = tempfile.mkdtemp()
-        ...
 
-    image_id = 0
-    big_iteration = 0
-    
     # Main loop: repeatedly apply refinement then modification phases
-    while big_iteration < depth:
-        big_iteration += 1
-        print(f"\n=== Big Iteration {big_iteration} ===")
-        
-        # Phase 1: Apply all refining productions
-        print("\n--- Phase 1: Applying Refining Productions ---")
-        phase1_any_applied = False
-        while True:
-            any_applied = False
-            
-            for prod in refining_productions:
-                new_hg = prod.apply(hg)
-                if new_hg:
-                    image_id += 1
-                    prod_name = prod.__class__.__name__
-                    print(f"✓ {prod_name} applied successfully")
-                    hg = new_hg
-                    any_applied = True
-                    phase1_any_applied = True
-
-                    if save_images and temp_dir:
-                        plt.figure(figsize=(14, 10))
-                        plt.suptitle(f"Production: {prod_name}", fontsize=16, fontweight='bold')
-                        hg.draw(use_positional_parameters=True)
-                        frame_path = os.path.join(temp_dir, f"frame_{image_id:03d}.png")
-                        plt.savefig(frame_path, dpi=400, bbox_inches='tight')
-                        plt.close()
-                        frame_list.append(frame_path)
-                    break
-            
-            if not any_applied:
-                print("No more refining productions can be applied.")
-                break
-        
-        # Phase 2: Apply all modifying productions
-        print("\n--- Phase 2: Applying Modifying Productions ---")
-        phase2_any_applied = False
-        while True:
-            any_applied = False
-            
-            for prod in modifying_productions:
-                new_hg = prod.apply(hg)
-                if new_hg:
-                    image_id += 1
-                    prod_name = prod.__class__.__name__
-                    print(f"✓ {prod_name} applied successfully")
-                    hg = new_hg
-                    any_applied = True
-                    phase2_any_applied = True
-
-                    if save_images and temp_dir:
-                        plt.figure(figsize=(14, 10))
-                        plt.suptitle(f"Production: {prod_name}", fontsize=16, fontweight='bold')
-                        hg.draw(use_positional_parameters=True)
-                        frame_path = os.path.join(temp_dir, f"frame_{image_id:03d}.png")
-                        plt.savefig(frame_path, dpi=400, bbox_inches='tight')
-                        plt.close()
-                        frame_list.append(frame_path)
-                    break
-            
-            if not any_applied:
-                print("No more modifying productions can be applied.")
-                break
-        
-        # Check if we should continue or stop
-        if not phase1_any_applied and not phase2_any_applied:
-            print(f"\nBoth phases completed without changes. Stopping.")
-            break
-
-    print(f"\nTotal iterations: {image_id}")
-    print(f"Total big iterations: {big_iteration}")
+    hooks = [PrintingHook()]
+    renderer = None
+    if save_images:
+        renderer = FrameRenderer(output_dir, dpi=400, figsize=(14, 10))
+        hooks.append(renderer)
+
+    engine = DerivationEngine(default_phases(rfc), max_rounds=depth, hooks=hooks)
+    result = engine.run(hg)
+    hg = result.graph
+
+    print(f"\nTotal iterations: {result.steps}")
+    print(f"Total big iterations: {result.rounds}")
 
     # Create GIF from frames
-    if save_images and frame_list:
+    if renderer is not None and renderer.frames:
         try:
-            frames = [Image.open(frame_path) for frame_path in frame_list]
+            frames = [Image.open(frame_path) for frame_path in renderer.frames]
             gif_path = os.path.join(output_dir, "animation.gif")
             frames[0].save(
                 gif_path,
@@ -234,10 +158,6 @@ def apply_all_productions_automatically(
                 loop=0
             )
             print(f"GIF saved: {gif_path}")
-            
-            # Clean up temporary frames
-            import shutil
-            # shutil.rmtree(temp_dir)
         except Exception as e:
             print(f"Error creating GIF: {e}")
 
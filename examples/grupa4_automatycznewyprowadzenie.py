@@ -17,20 +17,14 @@ sys.path.append(str(proj_root))
 
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
-from hypergrammar.productions.prod_0 import Prod0
-from hypergrammar.productions.prod_1 import Prod1
-from hypergrammar.productions.prod_2 import Prod2
-from hypergrammar.productions.prod_3 import Prod3
-from hypergrammar.productions.prod_4 import Prod4
-from hypergrammar.productions.prod_5 import Prod5
-from hypergrammar.productions.prod_6 import Prod6
-from hypergrammar.productions.prod_7 import Prod7
-from hypergrammar.productions.prod_8 import Prod8
-from hypergrammar.productions.prod_9 import Prod9
-from hypergrammar.productions.prod_10 import Prod10
-from hypergrammar.productions.prod_11 import Prod11
-from hypergrammar.productions.prod_12 import Prod12
-from hypergrammar.rfc import RFC
+from hypergrammar.engine import (
+    DerivationEngine,
+    DerivationHook,
+    FrameRenderer,
+    Phase,
+    default_phases,
+)
+from hypergrammar.rfc_cache import RFCCache
 
 
 class PointBasedRFC:
@@ -38,6 +32,9 @@ class PointBasedRFC:
     RFC that filters edges based on proximity to a target (x, y) point.
     """
 
+    # a few vertex parameter reads, cheaper than any cycle check
+    cost = 2.0
+
     def __init__(self, target_point: Optional[tuple[float, float]] = None, radius: float = 0.6):
         self.target_point = target_point
         self.radius = radius
@@ -79,6 +76,10 @@ class PointBasedRFC:
     def set_target_point(self, point: tuple[float, float]) -> None:
         self.target_point = point
 
+    def cache_token(self) -> tuple[Optional[tuple[float, float]], float]:
+        # cached results are only valid for the same target area
+        return self.target_point, self.radius
+
 
 def create_initial_graph() -> Hypergraph:
     """Create the initial hypergraph with the shape from the image."""
@@ -138,76 +139,37 @@ def create_initial_graph() -> Hypergraph:
     return hg
 
 
+class PrintingHook(DerivationHook):
+    """Logs phases and applied productions to stdout."""
+
+    def phase_started(self, phase: Phase, graph: Hypergraph) -> None:
+        print(f"--- Phase: {phase.name} ---")
+
+    def production_applied(self, step: int, phase: Phase, production, graph: Hypergraph) -> None:
+        print(f"✓ {production.__class__.__name__} applied")
+
+
 def apply_step(
     hg: Hypergraph,
     rfc: PointBasedRFC,
     target_point: tuple[float, float],
     step_name: str,
-    temp_dir: str,
-    frame_list: list,
-    image_counter: list
+    renderer: Optional[FrameRenderer] = None,
 ) -> Hypergraph:
     """Helper to apply one 'logical step' of refinement at a specific point."""
     print(f"\n=== Starting Step: {step_name} at {target_point} ===")
     
     # Update the RFC target
     rfc.set_target_point(target_point)
-    
-    # Productions
-    refining_productions = [Prod0(rfc=rfc), Prod6(rfc=rfc), Prod9(rfc=rfc), Prod12(rfc=rfc)]
-    modifying_productions = [Prod1(), Prod2(), Prod3(), Prod4(), Prod5(), Prod7(), Prod8(), Prod10(), Prod11()]
-
-    # Phase 1: Refining
-    print("--- Phase 1: Refining ---")
-    while True:
-        applied = False
-        for prod in refining_productions:
-            new_hg = prod.apply(hg)
-            if new_hg:
-                image_counter[0] += 1
-                print(f"✓ {prod.__class__.__name__} applied")
-                hg = new_hg
-                applied = True
-                
-                # Save frame
-                if temp_dir:
-                    plt.figure(figsize=(10, 8))
-                    plt.suptitle(f"{step_name}: {prod.__class__.__name__}", fontsize=14)
-                    hg.draw(use_positional_parameters=True)
-                    frame_path = os.path.join(temp_dir, f"frame_{image_counter[0]:03d}.png")
-                    plt.savefig(frame_path, dpi=200, bbox_inches='tight')
-                    plt.close()
-                    frame_list.append(frame_path)
-                break
-        if not applied:
-            break
-
-    # Phase 2: Modifying
-    print("--- Phase 2: Modifying ---")
-    while True:
-        applied = False
-        for prod in modifying_productions:
-            new_hg = prod.apply(hg)
-            if new_hg:
-                image_counter[0] += 1
-                print(f"✓ {prod.__class__.__name__} applied")
-                hg = new_hg
-                applied = True
-                
-                # Save frame
-                if temp_dir:
-                    plt.figure(figsize=(10, 8))
-                    plt.suptitle(f"{step_name}: {prod.__class__.__name__}", fontsize=14)
-                    hg.draw(use_positional_parameters=True)
-                    frame_path = os.path.join(temp_dir, f"frame_{image_counter[0]:03d}.png")
-                    plt.savefig(frame_path, dpi=200, bbox_inches='tight')
-                    plt.close()
-                    frame_list.append(frame_path)
-                break
-        if not applied:
-            break
-            
-    return hg
+
+    hooks: list[DerivationHook] = [PrintingHook()]
+    if renderer is not None:
+        renderer.title = f"{step_name}: {{production}}"
+        hooks.append(renderer)
+
+    # Phase 1: Refining, Phase 2: Modifying
+    engine = DerivationEngine(default_phases(rfc), max_rounds=1, hooks=hooks)
+    return engine.run(hg).graph
 
 
 def main() -> None:
@@ -219,9 +181,11 @@ def main() -> None:
 
     # 1. Setup
     hg = create_initial_graph()
+    # results are reused while a step asks about the same elements again;
+    # set_target_point changes the cache token, so every step starts empty
+    hg.set_rfc_cache(RFCCache())
     temp_dir = tempfile.mkdtemp()
-    frame_list = []
-    image_counter = [0]
+    renderer = FrameRenderer(temp_dir, dpi=200)
     
     # Initialize our Point-Based RFC
     # Radius 0.6 is good for picking larger shapes like the Right/Top sections
@@ -242,9 +206,7 @@ def main() -> None:
         hg, rfc, 
         target_point=(2.0, 0.5), 
         step_name="Step 1 (Right Hexagon)", 
-        temp_dir=temp_dir, 
-        frame_list=frame_list, 
-        image_counter=image_counter
+        renderer=renderer
     )
 
     # ---------------------------------------------------------
@@ -255,9 +217,7 @@ def main() -> None:
         hg, rfc, 
         target_point=(0.5, 1.5), 
         step_name="Step 2 (Top Shape)", 
-        temp_dir=temp_dir, 
-        frame_list=frame_list, 
-        image_counter=image_counter
+        renderer=renderer
     )
 
     # ---------------------------------------------------------
@@ -268,9 +228,7 @@ def main() -> None:
         hg, rfc, 
         target_point=(0.5, 0.5), 
         step_name="Step 3 (Center Square)", 
-        temp_dir=temp_dir, 
-        frame_list=frame_list, 
-        image_counter=image_counter
+        renderer=renderer
     )
 
     # ---------------------------------------------------------
@@ -283,9 +241,7 @@ def main() -> None:
         hg, rfc, 
         target_point=(0.75, 0.75), 
         step_name="Step 4 (Center Top-Right)", 
-        temp_dir=temp_dir, 
-        frame_list=frame_list, 
-        image_counter=image_counter
+        renderer=renderer
     )
 
     # ---------------------------------------------------------
@@ -297,9 +253,9 @@ def main() -> None:
     plt.close()
     
     # Generate GIF
-    if frame_list:
+    if renderer.frames:
         try:
-            frames = [Image.open(fp) for fp in frame_list]
+            frames = [Image.open(fp) for fp in renderer.frames]
             gif_path = os.path.join("./output_4", "animation.gif")
             frames[0].save(gif_path, save_all=True, append_images=frames[1:], duration=800, loop=0)
             print(f"\nGIF saved: {gif_path}")
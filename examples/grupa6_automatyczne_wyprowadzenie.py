@@ -13,6 +13,8 @@ sys.path.append(str(proj_root))
 
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.engine import DerivationEngine, FrameRenderer, Phase
+from hypergrammar.rfc_cache import RFCCache
 from hypergrammar.productions.prod_0 import Prod0
 from hypergrammar.productions.prod_1 import Prod1
 from hypergrammar.productions.prod_2 import Prod2
@@ -26,6 +28,9 @@ from hypergrammar.productions.prod_8 import Prod8
 
 class Group6PointRFC:
 
+    # a few vertex parameter reads, cheaper than any cycle check
+    cost = 2.0
+
     def __init__(self, target_point: Optional[tuple[float, float]] = None, radius: float = 0.6):
         self.target_point = target_point
         self.radius = radius
@@ -51,6 +56,9 @@ class Group6PointRFC:
     def set_target_point(self, point: tuple[float, float]) -> None:
         self.target_point = point
 
+    def cache_token(self) -> tuple:
+        return self.target_point, self.radius
+
 
 def create_initial_graph() -> Hypergraph:
     hg = Hypergraph()
@@ -102,35 +110,18 @@ def create_initial_graph() -> Hypergraph:
 
 
 def apply_logical_step(hg: Hypergraph, rfc: Group6PointRFC, target: tuple, step_name: str,
-                       frames: list, counter: list, tmp: str, radius: float = 0.4) -> Hypergraph:
+                       renderer: FrameRenderer, radius: float = 0.4) -> Hypergraph:
     rfc.set_target_point(target)
     rfc.radius = radius
 
-    refining_element = [Prod6(rfc=rfc), Prod0(rfc=rfc)]
-
-    marking_edges = [Prod7(), Prod1()]
-
-    modifying = [Prod2(), Prod4(), Prod3(), Prod8(), Prod5()]
-
-    for phase in [refining_element, marking_edges, modifying]:
-        while True:
-            applied = False
-            for p in phase:
-                new_hg = p.apply(hg)
-                if new_hg:
-                    hg = new_hg
-                    applied = True
-                    counter[0] += 1
-                    plt.figure(figsize=(10, 8))
-                    plt.suptitle(f"{step_name}: {p.__class__.__name__}")
-                    hg.draw(use_positional_parameters=True)
-                    path = os.path.join(tmp, f"frame_{counter[0]:03d}.png")
-                    plt.savefig(path, dpi=150)
-                    plt.close()
-                    frames.append(path)
-                    break
-            if not applied: break
-    return hg
+    phases = [
+        Phase("refining_element", [Prod6(rfc=rfc), Prod0(rfc=rfc)]),
+        Phase("marking_edges", [Prod7(), Prod1()]),
+        Phase("modifying", [Prod2(), Prod4(), Prod3(), Prod8(), Prod5()]),
+    ]
+
+    renderer.title = f"{step_name}: {{production}}"
+    return DerivationEngine(phases, max_rounds=1, hooks=[renderer]).run(hg).graph
 
 
 def main() -> None:
@@ -139,26 +130,27 @@ def main() -> None:
     out.mkdir(parents=True, exist_ok=True)
 
     hg = create_initial_graph()
+    hg.set_rfc_cache(RFCCache())
     plt.figure(figsize=(12, 10))
     hg.draw(use_positional_parameters=True, clean=True)
     plt.savefig(out / "initial_group6.png", dpi=300)
     plt.close()
     tmp = tempfile.mkdtemp()
-    frames, counter = [], [0]
+    renderer = FrameRenderer(tmp, dpi=150)
     rfc = Group6PointRFC()
 
-    hg = apply_logical_step(hg, rfc, (1.8, 0.5), "Step 1: Pentagon", frames, counter, tmp, radius=0.6)
-    hg = apply_logical_step(hg, rfc, (0.5, 1.5), "Step 2: Top Trapezoid", frames, counter, tmp, radius=0.5)
-    hg = apply_logical_step(hg, rfc, (0.5, 0.5), "Step 3: Center Square", frames, counter, tmp, radius=0.4)
-    hg = apply_logical_step(hg, rfc, (0.8, 0.8), "Step 4: Corner Refinement", frames, counter, tmp, radius=0.25)
+    hg = apply_logical_step(hg, rfc, (1.8, 0.5), "Step 1: Pentagon", renderer, radius=0.6)
+    hg = apply_logical_step(hg, rfc, (0.5, 1.5), "Step 2: Top Trapezoid", renderer, radius=0.5)
+    hg = apply_logical_step(hg, rfc, (0.5, 0.5), "Step 3: Center Square", renderer, radius=0.4)
+    hg = apply_logical_step(hg, rfc, (0.8, 0.8), "Step 4: Corner Refinement", renderer, radius=0.25)
 
     plt.figure(figsize=(12, 10))
     hg.draw(use_positional_parameters=True, clean=True)
     plt.savefig(out / "final_group6.png", dpi=300)
     plt.close()
 
-    if frames:
-        imgs = [Image.open(f) for f in frames]
+    if renderer.frames:
+        imgs = [Image.open(f) for f in renderer.frames]
         imgs[0].save(out / "animation_group6.gif", save_all=True, append_images=imgs[1:], duration=600, loop=0)
 
     shutil.rmtree(tmp)
@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+from hypergrammar.balance import Balancer
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener
+from hypergrammar.productions.ngon import MarkElement
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_2 import Prod2
+from hypergrammar.productions.prod_3 import Prod3
+from hypergrammar.productions.prod_4 import Prod4
+from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.productions.prod_6 import Prod6
+from hypergrammar.productions.prod_7 import Prod7
+from hypergrammar.productions.prod_8 import Prod8
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.productions.prod_11 import Prod11
+from hypergrammar.productions.prod_12 import Prod12
+from hypergrammar.rfcs import TargetSizeRFC
+
+SizeFunction = Union[float, Callable[[np.ndarray, np.ndarray], np.ndarray]]
+
+
+def sweep(production: Any, graph: Hypergraph) -> bool:
+    """Apply `production` to every match, through `apply_all` when it has one.
+
+    Returns whether anything was rewritten.
+    """
+    apply_all = getattr(production, "apply_all", None)
+    if apply_all is not None:
+        return apply_all(graph) is not None
+
+    applied = False
+    while production.apply(graph) is not None:
+        applied = True
+    return applied
+
+
+class _FlaggedElements(HypergraphListener):
+    """Elements flagged for refinement while it listens."""
+
+    def __init__(self) -> None:
+        self.flagged: list[Edge] = []
+
+    def edge_added(self, edge: Edge) -> None:
+        if edge.get_type() != EdgeType.E and edge.get_parameters().get("R") == 1:
+            self.flagged.append(edge)
+
+
+@dataclass
+class AdaptiveResult:
+    graph: Hypergraph
+    sweeps: int = 0
+    # "fixpoint" or "max_sweeps"
+    stop_reason: str = "fixpoint"
+    # production name -> number of sweeps in which it rewrote the mesh
+    applied: dict[str, int] = field(default_factory=dict)
+
+
+class AdaptiveRefiner:
+    """Refines a mesh until every element is at most as large as a target size.
+
+    The target size `h(x, y)` is given as a constant or as a vectorized
+    callable, see `TargetSizeRFC`; an element is refined while its diameter
+    exceeds `h` at its centroid. Every sweep runs, each production applied
+    to all of its matches at once:
+
+    - flag: Prod0, Prod6, Prod9, Prod12 with the target size criterion,
+      which measures all candidates in one batch from the coordinate store,
+    - mark: the boundaries of the flagged elements,
+    - split: Prod2, Prod3 and Prod4 until no marked edge is left,
+    - break: Prod5, Prod8, Prod11,
+
+    until a sweep changes nothing or `max_sweeps` sweeps were run. With
+    `balanced` a `Balancer` pass follows the flag phase, so neighbouring
+    elements never differ by more than one refinement level. The first pass
+    checks the whole mesh; later ones start only from the elements flagged
+    in their sweep.
+
+    Quadrilaterals are marked with a skip-only-when-all-marked configuration
+    of `MarkElement` instead of Prod1, which would skip a flagged element
+    whose side was already marked by a neighbour flagged in the same sweep.
+    """
+
+    def __init__(
+        self, size: SizeFunction, max_sweeps: Optional[int] = None, balanced: bool = False
+    ) -> None:
+        self._rfc = TargetSizeRFC(size)
+        self._max_sweeps = max_sweeps
+        self._balancer = Balancer() if balanced else None
+        self._flag = [
+            Prod0(rfc=self._rfc),
+            Prod6(rfc=self._rfc),
+            Prod9(rfc=self._rfc),
+            Prod12(rfc=self._rfc),
+        ]
+        self._mark = [
+            MarkElement(EdgeType.Q, 4, strict_size=False, uses_rfc=False, mark_only_unmarked=True),
+            Prod7(),
+            Prod10(),
+        ]
+        self._split = [Prod2(), Prod3(), Prod4()]
+        self._break = [Prod5(), Prod8(), Prod11()]
+
+    def get_rfc(self) -> TargetSizeRFC:
+        return self._rfc
+
+    def run(self, graph: Hypergraph) -> AdaptiveResult:
+        result = AdaptiveResult(graph=graph)
+        while True:
+            if self._max_sweeps is not None and result.sweeps >= self._max_sweeps:
+                result.stop_reason = "max_sweeps"
+                break
+
+            result.sweeps += 1
+            recorder = _FlaggedElements()
+            result.graph.add_listener(recorder)
+            try:
+                changed = self._run_all(self._flag, result)
+            finally:
+                result.graph.remove_listener(recorder)
+            if self._balancer is not None:
+                seeds = None if result.sweeps == 1 else recorder.flagged
+                if self._balancer.run(result.graph, seeds):
+                    result.applied["Balancer"] = result.applied.get("Balancer", 0) + 1
+                    changed = True
+            changed |= self._run_all(self._mark, result)
+            while self._run_all(self._split, result):
+                changed = True
+            changed |= self._run_all(self._break, result)
+
+            if not changed:
+                result.stop_reason = "fixpoint"
+                break
+
+        return result
+
+    def _run_all(self, productions: Sequence[Any], result: AdaptiveResult) -> bool:
+        changed = False
+        for production in productions:
+            if sweep(production, result.graph):
+                name = production.__class__.__name__
+                result.applied[name] = result.applied.get(name, 0) + 1
+                changed = True
+        return changed
+
+
+def refine_to_size(
+    graph: Hypergraph, size: SizeFunction, max_sweeps: Optional[int] = None, balanced: bool = False
+) -> AdaptiveResult:
+    """Refine `graph` until every element's diameter is at most `size`, see `AdaptiveRefiner`."""
+    return AdaptiveRefiner(size, max_sweeps, balanced).run(graph)
+
+
+__all__ = ["SizeFunction", "sweep", "AdaptiveResult", "AdaptiveRefiner", "refine_to_size"]
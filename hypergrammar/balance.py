@@ -0,0 +1,68 @@
+from collections import deque
+from typing import Iterable, Optional
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.productions.ngon import FlagElement
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_6 import Prod6
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_12 import Prod12
+
+
+class Balancer:
+    """Flags the elements whose refinement keeps the mesh 2:1 balanced.
+
+    Neighbouring elements (see `DualGraph`) may differ by at most
+    one refinement level, counting a flagged element as already refined
+    once. Starting from `seeds`, by default the refined elements which can
+    violate the rule, every element is checked against its neighbours; a
+    neighbour more than one level coarser is flagged with Prod0, Prod6,
+    Prod9 or Prod12 and queued in turn, so the refinement propagates
+    outward only as far as needed.
+
+    A neighbour is flagged at most once per pass: one that is three or
+    more levels coarser is balanced by the passes after the next breaks.
+    """
+
+    def __init__(self) -> None:
+        self._productions: dict[EdgeType, FlagElement] = {
+            EdgeType.Q: Prod0(),
+            EdgeType.P: Prod6(),
+            EdgeType.S: Prod9(),
+            EdgeType.T: Prod12(),
+        }
+
+    @staticmethod
+    def _target_level(graph: Hypergraph, element: Edge) -> int:
+        return graph.get_element_level(element) + (element.get_parameters().get("R", 0) == 1)
+
+    def run(self, graph: Hypergraph, seeds: Optional[Iterable[Edge]] = None) -> list[Edge]:
+        """Flag the elements needed to balance the mesh, returns the flagged elements."""
+        if seeds is None:
+            seeds = (e for e in graph.get_elements_at_least(1) if self._target_level(graph, e) >= 2)
+        queue = deque(seeds)
+        flagged = []
+        while queue:
+            element = queue.popleft()
+            if not graph.has_edge(element):
+                continue
+            level = self._target_level(graph, element)
+            for neighbour in graph.get_element_neighbours(element):
+                if self._target_level(graph, neighbour) >= level - 1:
+                    continue
+                production = self._productions.get(neighbour.get_type())
+                flagged_edge = production.flag(graph, neighbour) if production is not None else None
+                if flagged_edge is None:
+                    continue
+                flagged.append(flagged_edge)
+                queue.append(flagged_edge)
+        return flagged
+
+
+def balance(graph: Hypergraph, seeds: Optional[Iterable[Edge]] = None) -> list[Edge]:
+    """Flag the elements needed to keep `graph` 2:1 balanced, see `Balancer`."""
+    return Balancer().run(graph, seeds)
+
+
+__all__ = ["Balancer", "balance"]
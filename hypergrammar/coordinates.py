@@ -0,0 +1,97 @@
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+
+class CoordinateStore:
+    """Vertex coordinates kept in one contiguous (n, 2) NumPy array.
+
+    Every vertex gets a stable row index on its first `set`, so batched
+    geometry can gather coordinates with integer indexing instead of
+    reading a parameter dict per vertex. Rows of discarded vertices are
+    set to NaN and are not reused.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._index: dict[str, int] = {}
+        self._xy = np.full((max(capacity, 1), 2), np.nan)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, vertex: str) -> bool:
+        index = self._index.get(vertex)
+        return index is not None and not np.isnan(self._xy[index, 0])
+
+    def _reserve(self, count: int) -> None:
+        needed = self._size + count
+        if needed <= len(self._xy):
+            return
+        capacity = max(needed, 2 * len(self._xy))
+        grown = np.full((capacity, 2), np.nan)
+        grown[: self._size] = self._xy[: self._size]
+        self._xy = grown
+
+    def _row(self, vertex: str) -> int:
+        index = self._index.get(vertex)
+        if index is None:
+            self._reserve(1)
+            index = self._size
+            self._index[vertex] = index
+            self._size += 1
+        return index
+
+    def set(self, vertex: str, x: float, y: float) -> None:
+        row = self._row(vertex)
+        self._xy[row] = (x, y)
+
+    def set_many(self, vertices: Sequence[str], xy: np.ndarray) -> None:
+        """Store `xy[i]` as the coordinates of `vertices[i]`."""
+        self._reserve(len(vertices))
+        rows = np.fromiter((self._row(v) for v in vertices), dtype=np.intp, count=len(vertices))
+        self._xy[rows] = xy
+
+    def discard(self, vertex: str) -> None:
+        index = self._index.get(vertex)
+        if index is not None:
+            self._xy[index] = np.nan
+
+    def get(self, vertex: str) -> Optional[tuple[float, float]]:
+        if vertex not in self:
+            return None
+        x, y = self._xy[self._index[vertex]]
+        return float(x), float(y)
+
+    def indices(self, vertices: Iterable[str]) -> np.ndarray:
+        """Row indices of `vertices`, raises KeyError for a vertex without coordinates."""
+        rows = np.array([self._index[v] for v in vertices], dtype=np.intp)
+        if np.isnan(self._xy[rows, 0]).any():
+            raise KeyError("vertex without coordinates")
+        return rows
+
+    def lookup(self, vertices: Iterable[str]) -> np.ndarray:
+        """(n, 2) array with the coordinates of `vertices`, NaN rows for vertices without them."""
+        rows = np.fromiter((self._index.get(v, -1) for v in vertices), dtype=np.intp)
+        xy = self._xy[np.maximum(rows, 0)]
+        xy[rows < 0] = np.nan
+        return xy
+
+    def get_many(self, vertices: Iterable[str]) -> np.ndarray:
+        """(n, 2) array with the coordinates of `vertices`."""
+        xy: np.ndarray = self._xy[self.indices(vertices)]
+        return xy
+
+    def midpoints(self, first: Iterable[str], second: Iterable[str]) -> np.ndarray:
+        """(n, 2) array of the midpoints between `first[i]` and `second[i]`."""
+        xy: np.ndarray = (self.get_many(first) + self.get_many(second)) / 2.0
+        return xy
+
+    def as_array(self) -> np.ndarray:
+        """Read-only view of all rows, indexed by `indices`."""
+        view = self._xy[: self._size]
+        view.flags.writeable = False
+        return view
+
+
+__all__ = ["CoordinateStore"]
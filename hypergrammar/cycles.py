@@ -0,0 +1,156 @@
+from typing import Callable, Iterable, Optional, Sequence
+
+from hypergrammar.edge import Edge
+from hypergrammar.hypergraph import Hypergraph
+
+
+def find_cycle(
+    vertices: Iterable[str], adjacent: Callable[[str], Iterable[str]]
+) -> Optional[tuple[str, ...]]:
+    """Order `vertices` into a cycle in which consecutive vertices are adjacent.
+
+    `adjacent(v)` returns the vertices adjacent to `v`, only those in
+    `vertices` are followed. The cycle starts at the smallest vertex.
+    Element boundaries are 2-regular, so the walk normally never
+    backtracks and costs O(k) adjacency lookups for k vertices.
+    Returns None when no such cycle exists.
+    """
+    vertex_set = frozenset(vertices)
+    if len(vertex_set) < 3:
+        return None
+
+    neighbours = {v: sorted(set(adjacent(v)) & vertex_set - {v}) for v in vertex_set}
+    if any(len(adj) < 2 for adj in neighbours.values()):
+        return None
+
+    start = min(vertex_set)
+    path = [start]
+    visited = {start}
+
+    def extend() -> bool:
+        if len(path) == len(vertex_set):
+            return start in neighbours[path[-1]]
+        for nxt in neighbours[path[-1]]:
+            if nxt in visited:
+                continue
+            path.append(nxt)
+            visited.add(nxt)
+            if extend():
+                return True
+            path.pop()
+            visited.discard(nxt)
+        return False
+
+    if not extend():
+        return None
+    return tuple(path)
+
+
+def e_cycle(
+    graph: Hypergraph,
+    vertices: Iterable[str],
+    order: Optional[tuple[str, ...]] = None,
+) -> Optional[tuple[str, ...]]:
+    """Cycle of `vertices` connected by E edges.
+
+    A known cyclic `order` (see `Edge.get_order`) is only verified,
+    skipping the search.
+    """
+    if order is not None:
+        for i in range(len(order)):
+            if not graph.has_e_edge(order[i], order[(i + 1) % len(order)]):
+                return None
+        return order
+    return find_cycle(vertices, graph.get_neighbours)
+
+
+def broken_cycle(
+    graph: Hypergraph,
+    vertices: Iterable[str],
+    order: Optional[tuple[str, ...]] = None,
+) -> Optional[tuple[tuple[str, ...], list[str]]]:
+    """Cycle of `vertices` whose every side was split by a midpoint.
+
+    Returns the cycle and the midpoints, `midpoints[i]` splitting the side
+    `cycle[i]`-`cycle[i + 1]`. Midpoints are never vertices of the cycle.
+    A known cyclic `order` is used instead of searching for the cycle.
+    """
+    vertex_set = frozenset(vertices)
+    if order is not None:
+        ordered_midpoints = []
+        for i in range(len(order)):
+            midpoint = graph.find_midpoint(
+                order[i], order[(i + 1) % len(order)], exclude=vertex_set
+            )
+            if midpoint is None:
+                return None
+            ordered_midpoints.append(midpoint)
+        return order, ordered_midpoints
+
+    def broken_adjacent(v: str) -> set[str]:
+        adjacent = set()
+        for midpoint in graph.get_neighbours(v) - vertex_set:
+            adjacent.update(graph.get_neighbours(midpoint) & vertex_set)
+        return adjacent
+
+    cycle = find_cycle(vertex_set, broken_adjacent)
+    if cycle is None:
+        return None
+    # corners joined through the far end of a hanging-node half are not a broken side
+    midpoints = []
+    for i in range(len(cycle)):
+        midpoint = graph.find_midpoint(cycle[i], cycle[(i + 1) % len(cycle)], exclude=vertex_set)
+        if midpoint is None:
+            return None
+        midpoints.append(midpoint)
+    return cycle, midpoints
+
+
+def cycle_cost(size: int, order: Optional[tuple[str, ...]] = None, broken: bool = False) -> float:
+    """Estimated cost of `e_cycle` / `broken_cycle` in index lookups.
+
+    A known order is verified with one lookup per side, a search reads
+    the neighbourhood of every vertex (and of the midpoints when broken).
+    """
+    per_vertex = 1.0 if order is not None else 2.0
+    if broken:
+        per_vertex *= 3.0
+    return per_vertex * size
+
+
+def cycle_edges(
+    graph: Hypergraph,
+    cycle: Sequence[str],
+    known: Optional[Sequence[Edge]] = None,
+) -> list[Optional[Edge]]:
+    """E edges along `cycle`, entry i joining `cycle[i]` and `cycle[i + 1]`.
+
+    Edges in `known` (see `Edge.get_boundary`) are used while they are still
+    in the hypergraph, other sides are looked up in the pair index.
+    Missing sides are None.
+    """
+    edges: list[Optional[Edge]] = []
+    for i in range(len(cycle)):
+        if known is not None and i < len(known) and graph.has_edge(known[i]):
+            edges.append(known[i])
+        else:
+            edges.append(graph.find_e_edge(cycle[i], cycle[(i + 1) % len(cycle)]))
+    return edges
+
+
+def element_boundary(graph: Hypergraph, cycle: Sequence[str]) -> Optional[tuple[Edge, ...]]:
+    """Boundary E edges of a new element, None when a side is missing."""
+    edges = cycle_edges(graph, cycle)
+    if any(edge is None for edge in edges):
+        return None
+    return tuple(edges)  # type: ignore[arg-type]
+
+
+__all__ = [
+    "find_cycle",
+    "e_cycle",
+    "broken_cycle",
+    "cycle_cost",
+    "cycle_edges",
+    "element_boundary",
+]
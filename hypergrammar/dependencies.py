@@ -0,0 +1,223 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_1 import Prod1
+from hypergrammar.productions.prod_2 import Prod2
+from hypergrammar.productions.prod_3 import Prod3
+from hypergrammar.productions.prod_4 import Prod4
+from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.productions.prod_6 import Prod6
+from hypergrammar.productions.prod_7 import Prod7
+from hypergrammar.productions.prod_8 import Prod8
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.productions.prod_11 import Prod11
+from hypergrammar.productions.prod_12 import Prod12
+
+
+@dataclass(frozen=True)
+class EdgePattern:
+    """Edges of `edge_type` whose parameters equal every value in `parameters`.
+
+    An empty `parameters` mapping matches every edge of the given type.
+    """
+
+    edge_type: EdgeType
+    parameters: Mapping[str, int] = field(default_factory=dict)
+
+    def matches(self, edge: Edge) -> bool:
+        if edge.get_type() != self.edge_type:
+            return False
+        edge_parameters = edge.get_parameters()
+        return all(edge_parameters.get(k) == v for k, v in self.parameters.items())
+
+    def overlaps(self, other: "EdgePattern") -> bool:
+        """True when some edge could match both patterns."""
+        if self.edge_type != other.edge_type:
+            return False
+        return all(
+            other.parameters[k] == v for k, v in self.parameters.items() if k in other.parameters
+        )
+
+
+# Edges each production reads on its left-hand side. A change to an edge
+# matching none of the patterns cannot turn a failed match into a successful one.
+PRODUCTION_READS: dict[type, tuple[EdgePattern, ...]] = {
+    Prod0: (EdgePattern(EdgeType.Q, {"R": 0}), EdgePattern(EdgeType.E)),
+    Prod1: (EdgePattern(EdgeType.Q, {"R": 1}), EdgePattern(EdgeType.E)),
+    Prod2: (EdgePattern(EdgeType.E),),
+    Prod3: (EdgePattern(EdgeType.E, {"R": 1, "B": 0}),),
+    Prod4: (EdgePattern(EdgeType.E, {"R": 1, "B": 1}),),
+    Prod5: (EdgePattern(EdgeType.Q, {"R": 1}), EdgePattern(EdgeType.E)),
+    Prod6: (EdgePattern(EdgeType.P, {"R": 0}), EdgePattern(EdgeType.E)),
+    Prod7: (EdgePattern(EdgeType.P, {"R": 1}), EdgePattern(EdgeType.E)),
+    Prod8: (EdgePattern(EdgeType.P, {"R": 1}), EdgePattern(EdgeType.E)),
+    Prod9: (EdgePattern(EdgeType.S, {"R": 0}),),
+    Prod10: (EdgePattern(EdgeType.S, {"R": 1}), EdgePattern(EdgeType.E)),
+    Prod11: (EdgePattern(EdgeType.S, {"R": 1}), EdgePattern(EdgeType.E)),
+    Prod12: (EdgePattern(EdgeType.T, {"R": 0}), EdgePattern(EdgeType.E)),
+}
+
+# Edges each production adds on its right-hand side.
+PRODUCTION_WRITES: dict[type, tuple[EdgePattern, ...]] = {
+    Prod0: (EdgePattern(EdgeType.Q, {"R": 1}),),
+    Prod1: (EdgePattern(EdgeType.E, {"R": 1}),),
+    Prod2: (EdgePattern(EdgeType.E, {"R": 0, "B": 0}),),
+    Prod3: (EdgePattern(EdgeType.E, {"R": 0}),),
+    Prod4: (EdgePattern(EdgeType.E, {"R": 0}),),
+    Prod5: (EdgePattern(EdgeType.Q, {"R": 0}), EdgePattern(EdgeType.E, {"R": 0, "B": 0})),
+    Prod6: (EdgePattern(EdgeType.P, {"R": 1}),),
+    Prod7: (EdgePattern(EdgeType.E, {"R": 1}),),
+    Prod8: (EdgePattern(EdgeType.Q, {"R": 0}), EdgePattern(EdgeType.E, {"B": 0})),
+    Prod9: (EdgePattern(EdgeType.S, {"R": 1}),),
+    Prod10: (EdgePattern(EdgeType.E, {"R": 1}),),
+    Prod11: (EdgePattern(EdgeType.Q, {"R": 0}), EdgePattern(EdgeType.E, {"B": 0})),
+    Prod12: (EdgePattern(EdgeType.T, {"R": 1}),),
+}
+
+
+def _lookup(
+    production: Any, attribute: str, table: dict[type, tuple[EdgePattern, ...]]
+) -> Optional[tuple[EdgePattern, ...]]:
+    patterns = getattr(production, attribute, None)
+    if patterns is not None:
+        return tuple(patterns)
+    for cls in type(production).__mro__:
+        if cls in table:
+            return table[cls]
+    return None
+
+
+def production_reads(production: Any) -> Optional[tuple[EdgePattern, ...]]:
+    """Return the read patterns of `production`, None when they are unknown.
+
+    A `READS` attribute on the production takes precedence over `PRODUCTION_READS`.
+    """
+    return _lookup(production, "READS", PRODUCTION_READS)
+
+
+def production_writes(production: Any) -> Optional[tuple[EdgePattern, ...]]:
+    """Return the write patterns of `production`, None when they are unknown.
+
+    A `WRITES` attribute on the production takes precedence over `PRODUCTION_WRITES`.
+    """
+    return _lookup(production, "WRITES", PRODUCTION_WRITES)
+
+
+class DependencyGraph:
+    """Produces/consumes graph between productions.
+
+    There is an arc p -> q when an edge added by p could match a pattern read
+    by q, i.e. applying p may enable q. Productions with unknown reads or
+    writes are conservatively connected to every production.
+
+    Declared writes are refined from observed applications: an added edge
+    that matches none of the declared patterns widens the declaration.
+    """
+
+    def __init__(self, productions: Sequence[Any]) -> None:
+        self._productions = list(productions)
+        self._reads = {p: production_reads(p) for p in self._productions}
+        self._writes = {p: production_writes(p) for p in self._productions}
+        self._predecessors: dict[Any, list[Any]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        self._predecessors = {q: [] for q in self._productions}
+        for p in self._productions:
+            for q in self._productions:
+                if self._enables(p, q):
+                    self._predecessors[q].append(p)
+
+    def _enables(self, p: Any, q: Any) -> bool:
+        writes = self._writes[p]
+        reads = self._reads[q]
+        if writes is None or reads is None:
+            return True
+        return any(w.overlaps(r) for w in writes for r in reads)
+
+    def get_productions(self) -> list[Any]:
+        return list(self._productions)
+
+    def predecessors(self, production: Any) -> list[Any]:
+        return list(self._predecessors[production])
+
+    def successors(self, production: Any) -> list[Any]:
+        return [q for q in self._productions if production in self._predecessors[q]]
+
+    def observe(self, production: Any, added: Iterable[Edge]) -> None:
+        """Widen the writes of `production` with edges it was seen adding."""
+        writes = self._writes.get(production)
+        if writes is None:
+            return
+        missing = {
+            edge.get_type()
+            for edge in added
+            if not any(pattern.matches(edge) for pattern in writes)
+        }
+        if not missing:
+            return
+        self._writes[production] = writes + tuple(EdgePattern(t) for t in missing)
+        self._build()
+
+
+class DerivationHistory:
+    """Remembers failed probes across scheduler runs on one hypergraph.
+
+    A production that failed is skipped until one of its predecessors in the
+    `DependencyGraph` is applied, or the hypergraph is changed by anything
+    other than the recorded applications (e.g. a hook or the caller).
+    """
+
+    def __init__(self, dependencies: DependencyGraph) -> None:
+        self._dependencies = dependencies
+        self._clock = 0
+        self._applied_at: dict[Any, int] = {}
+        self._failed_at: dict[Any, int] = {}
+        self._graph: Optional[Hypergraph] = None
+        self._graph_version = -1
+
+    def get_dependencies(self) -> DependencyGraph:
+        return self._dependencies
+
+    def may_apply(self, production: Any, graph: Hypergraph) -> bool:
+        self._sync(graph)
+        failed_at = self._failed_at.get(production)
+        if failed_at is None:
+            return True
+        return any(
+            self._applied_at.get(p, -1) > failed_at
+            for p in self._dependencies.predecessors(production)
+        )
+
+    def record_failure(self, production: Any, graph: Hypergraph) -> None:
+        self._sync(graph)
+        self._failed_at[production] = self._clock
+
+    def record_application(self, production: Any, graph: Hypergraph, added: Iterable[Edge]) -> None:
+        self._clock += 1
+        self._applied_at[production] = self._clock
+        self._dependencies.observe(production, added)
+        self._graph = graph
+        self._graph_version = graph.get_version()
+
+    def _sync(self, graph: Hypergraph) -> None:
+        if graph is not self._graph or graph.get_version() != self._graph_version:
+            # changed behind our back, every failure may be stale
+            self._failed_at.clear()
+            self._graph = graph
+            self._graph_version = graph.get_version()
+
+
+__all__ = [
+    "EdgePattern",
+    "PRODUCTION_READS",
+    "PRODUCTION_WRITES",
+    "production_reads",
+    "production_writes",
+    "DependencyGraph",
+    "DerivationHistory",
+]
@@ -0,0 +1,148 @@
+from typing import Iterable
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener
+
+ElementKey = tuple[EdgeType, frozenset[str]]
+
+
+def _element_sides(element: Edge) -> list[tuple[str, str]]:
+    order = element.get_order()
+    if order is not None:
+        return [(order[i - 1], order[i]) for i in range(len(order))]
+    vertices = sorted(element.get_vertices())
+    return [(a, b) for i, a in enumerate(vertices) for b in vertices[i + 1:]]
+
+
+def _elements_on(graph: Hypergraph, v1: str, v2: str) -> Iterable[Edge]:
+    for edge in graph.get_incident_edges(v1):
+        if edge.get_type() != EdgeType.E and v2 in edge.get_vertices():
+            yield edge
+
+
+def element_neighbours(graph: Hypergraph, element: Edge) -> set[Edge]:
+    """Elements sharing a side with `element`.
+
+    Elements sharing at least two vertices are neighbours, and so are the
+    elements on the two sides of a split side: a side is followed through
+    the midpoint registry to the sides it was split from and into, so a
+    neighbour across hanging nodes is found as well.
+    """
+    vertices = element.get_vertices()
+    neighbours = set()
+    for vertex in vertices:
+        for edge in graph.get_incident_edges(vertex):
+            if edge.get_type() != EdgeType.E and len(edge.get_vertices() & vertices) >= 2:
+                neighbours.add(edge)
+
+    for a, b in _element_sides(element):
+        # coarser elements on the sides this one is a half of
+        x, y = a, b
+        while True:
+            parent = graph.get_midpoint_parent(x)
+            if parent is None or y not in parent:
+                parent = graph.get_midpoint_parent(y)
+                if parent is None or x not in parent:
+                    break
+            x, y = parent
+            neighbours.update(_elements_on(graph, x, y))
+
+        # finer elements on the halves of this side
+        stack = [(a, b)]
+        while stack:
+            x, y = stack.pop()
+            midpoint = graph.get_midpoint(x, y)
+            if midpoint is None:
+                continue
+            for half in ((x, midpoint), (midpoint, y)):
+                neighbours.update(_elements_on(graph, *half))
+                stack.append(half)
+
+    neighbours.discard(element)
+    return neighbours
+
+
+class DualGraph(HypergraphListener):
+    """Adjacency of the elements (non-E edges) of a hypergraph.
+
+    Two elements are adjacent when they share a side, see
+    `element_neighbours`, so the elements on both sides of a hanging node
+    left by Prod3 or Prod4 are adjacent as well. Elements are keyed by
+    their type and vertices, so an element keeps its neighbours when its
+    parameters change. The adjacency follows the hypergraph through its
+    change notifications and only the neighbourhood of a changed element
+    or split side is recomputed.
+    """
+
+    def __init__(self, graph: Hypergraph) -> None:
+        self._graph = graph
+        # element key -> the element stored in the hypergraph
+        self._elements: dict[ElementKey, Edge] = {}
+        self._adjacency: dict[ElementKey, set[ElementKey]] = {}
+        for edge in graph.get_edges():
+            if edge.get_type() != EdgeType.E:
+                self._elements[self.key(edge)] = edge
+        for edge in self._elements.values():
+            self._link(edge)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __contains__(self, edge: Edge) -> bool:
+        return self._elements.get(self.key(edge)) == edge
+
+    @staticmethod
+    def key(edge: Edge) -> ElementKey:
+        return edge.get_type(), edge.get_vertices()
+
+    def neighbours(self, element: Edge) -> list[Edge]:
+        """Elements adjacent to `element`, empty when it is not in the hypergraph."""
+        return [self._elements[key] for key in self._adjacency.get(self.key(element), ())]
+
+    def degree(self, element: Edge) -> int:
+        return len(self._adjacency.get(self.key(element), ()))
+
+    def _link(self, element: Edge) -> None:
+        key = self.key(element)
+        linked = self._adjacency.setdefault(key, set())
+        for neighbour in element_neighbours(self._graph, element):
+            neighbour_key = self.key(neighbour)
+            if neighbour_key in self._elements:
+                linked.add(neighbour_key)
+                self._adjacency.setdefault(neighbour_key, set()).add(key)
+
+    def _unlink(self, key: ElementKey) -> None:
+        for neighbour_key in self._adjacency.pop(key, ()):
+            self._adjacency[neighbour_key].discard(key)
+
+    def edge_added(self, edge: Edge) -> None:
+        if edge.get_type() == EdgeType.E:
+            return
+        key = self.key(edge)
+        self._elements[key] = edge
+        self._unlink(key)
+        self._link(edge)
+
+    def edge_removed(self, edge: Edge) -> None:
+        key = self.key(edge)
+        if self._elements.get(key) != edge:
+            return
+        del self._elements[key]
+        self._unlink(key)
+
+    def midpoint_changed(self, v1: str, v2: str, midpoint: str) -> None:
+        touched = {
+            self.key(edge)
+            for vertex in (v1, v2, midpoint)
+            for edge in self._graph.get_incident_edges(vertex)
+            if edge.get_type() != EdgeType.E
+        }
+        for key in touched:
+            if key in self._elements:
+                self._unlink(key)
+        for key in touched:
+            if key in self._elements:
+                self._link(self._elements[key])
+
+
+__all__ = ["DualGraph", "element_neighbours"]
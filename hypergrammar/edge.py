@@ -1,4 +1,5 @@
 from enum import Enum, auto
+from typing import Optional
 
 
 class EdgeType(Enum):
@@ -15,10 +16,19 @@ class Edge:
         edge_type: EdgeType,
         vertices: frozenset[str],
         parameters: dict[str, int] | None = None,
+        order: Optional[tuple[str, ...]] = None,
+        boundary: Optional[tuple["Edge", ...]] = None,
     ):
+        """Element hyperedges may carry the cyclic `order` of their vertices
+        and their `boundary` E edges (`boundary[i]` joins `order[i]` and
+        `order[i + 1]`). Neither takes part in hashing or equality."""
+        if order is not None and (len(order) != len(vertices) or set(order) != vertices):
+            raise ValueError("order must list every vertex of the edge exactly once")
         self.edge_type = edge_type
         self.vertices = vertices
         self.parameters = parameters or {}
+        self.order = order
+        self.boundary = boundary
 
     def get_type(self) -> EdgeType:
         return self.edge_type
@@ -29,6 +39,12 @@ class Edge:
     def get_parameters(self) -> dict[str, int]:
         return self.parameters
 
+    def get_order(self) -> Optional[tuple[str, ...]]:
+        return self.order
+
+    def get_boundary(self) -> Optional[tuple["Edge", ...]]:
+        return self.boundary
+
     def set_parameter(self, param: str, value: int) -> None:
         self.parameters[param] = value
 
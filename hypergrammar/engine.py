@@ -0,0 +1,220 @@
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from hypergrammar.dependencies import DependencyGraph, DerivationHistory
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_1 import Prod1
+from hypergrammar.productions.prod_2 import Prod2
+from hypergrammar.productions.prod_3 import Prod3
+from hypergrammar.productions.prod_4 import Prod4
+from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.productions.prod_6 import Prod6
+from hypergrammar.productions.prod_7 import Prod7
+from hypergrammar.productions.prod_8 import Prod8
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.productions.prod_11 import Prod11
+from hypergrammar.productions.prod_12 import Prod12
+from hypergrammar.rfc import RFC
+from hypergrammar.scheduler import WorklistScheduler
+
+
+class Phase:
+    """Named group of productions derived together to a fixpoint."""
+
+    def __init__(self, name: str, productions: Sequence[Any]) -> None:
+        self.name = name
+        self.productions = list(productions)
+        self.scheduler = WorklistScheduler(self.productions)
+
+
+class DerivationHook:
+    """Observes a derivation run by `DerivationEngine`.
+
+    Subclasses override the callbacks they are interested in,
+    the default implementations do nothing.
+    """
+
+    def phase_started(self, phase: Phase, graph: Hypergraph) -> None:
+        pass
+
+    def production_applied(
+        self, step: int, phase: Phase, production: Any, graph: Hypergraph
+    ) -> None:
+        pass
+
+    def phase_finished(self, phase: Phase, graph: Hypergraph, steps: int) -> None:
+        pass
+
+
+@dataclass
+class DerivationResult:
+    graph: Hypergraph
+    steps: int = 0
+    rounds: int = 0
+    # "fixpoint", "max_rounds", "max_steps" or "time_budget"
+    stop_reason: str = "fixpoint"
+    applied: dict[str, int] = field(default_factory=dict)
+
+
+class DerivationEngine:
+    """Runs phases of productions, each to a fixpoint, until nothing applies.
+
+    One round runs every phase in order. Rounds are repeated until a whole
+    round applies no production, `max_rounds` rounds were run, `max_steps`
+    productions were applied or `time_budget` seconds have passed.
+    The engine is headless, rendering and logging are done through `hooks`.
+
+    Failed probes are shared between phases and rounds through a
+    `DerivationHistory`, so a production is not retried until a production
+    that may enable it (according to the `DependencyGraph`) was applied.
+    """
+
+    def __init__(
+        self,
+        phases: Sequence[Phase],
+        max_rounds: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        hooks: Optional[Sequence[DerivationHook]] = None,
+    ) -> None:
+        self._phases = list(phases)
+        self._max_rounds = max_rounds
+        self._max_steps = max_steps
+        self._time_budget = time_budget
+        self._hooks = list(hooks or [])
+        self._dependencies = DependencyGraph(
+            [production for phase in self._phases for production in phase.productions]
+        )
+
+    def get_dependencies(self) -> DependencyGraph:
+        return self._dependencies
+
+    def get_phases(self) -> list[Phase]:
+        return list(self._phases)
+
+    def add_hook(self, hook: DerivationHook) -> None:
+        self._hooks.append(hook)
+
+    def run(self, graph: Hypergraph) -> DerivationResult:
+        result = DerivationResult(graph=graph)
+        history = DerivationHistory(self._dependencies)
+        deadline = None
+        if self._time_budget is not None:
+            deadline = time.perf_counter() + self._time_budget
+
+        while True:
+            if self._max_rounds is not None and result.rounds >= self._max_rounds:
+                result.stop_reason = "max_rounds"
+                break
+
+            result.rounds += 1
+            round_steps = 0
+            for phase in self._phases:
+                remaining = None
+                if self._max_steps is not None:
+                    remaining = self._max_steps - result.steps
+                    if remaining <= 0:
+                        break
+                round_steps += self._run_phase(phase, result, remaining, deadline, history)
+
+            if self._max_steps is not None and result.steps >= self._max_steps:
+                result.stop_reason = "max_steps"
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                result.stop_reason = "time_budget"
+                break
+            if round_steps == 0:
+                result.stop_reason = "fixpoint"
+                break
+
+        return result
+
+    def _run_phase(
+        self,
+        phase: Phase,
+        result: DerivationResult,
+        max_steps: Optional[int],
+        deadline: Optional[float],
+        history: DerivationHistory,
+    ) -> int:
+        for hook in self._hooks:
+            hook.phase_started(phase, result.graph)
+
+        def on_apply(production: Any, graph: Hypergraph) -> None:
+            result.steps += 1
+            name = production.__class__.__name__
+            result.applied[name] = result.applied.get(name, 0) + 1
+            for hook in self._hooks:
+                hook.production_applied(result.steps, phase, production, graph)
+
+        result.graph, steps = phase.scheduler.run(
+            result.graph,
+            max_steps=max_steps,
+            on_apply=on_apply,
+            deadline=deadline,
+            history=history,
+        )
+
+        for hook in self._hooks:
+            hook.phase_finished(phase, result.graph, steps)
+        return steps
+
+
+class FrameRenderer(DerivationHook):
+    """Saves a drawing of the hypergraph after every applied production.
+
+    Requires matplotlib, which is only imported once the first frame is drawn.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        title: str = "Production: {production}",
+        dpi: int = 150,
+        figsize: tuple[float, float] = (10, 8),
+    ) -> None:
+        self.output_dir = output_dir
+        self.title = title
+        self.dpi = dpi
+        self.figsize = figsize
+        self.frames: list[str] = []
+
+    def production_applied(
+        self, step: int, phase: Phase, production: Any, graph: Hypergraph
+    ) -> None:
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+        plt.figure(figsize=self.figsize)
+        plt.suptitle(
+            self.title.format(production=production.__class__.__name__, phase=phase.name)
+        )
+        graph.draw(use_positional_parameters=True)
+        frame_path = os.path.join(self.output_dir, f"frame_{len(self.frames) + 1:03d}.png")
+        plt.savefig(frame_path, dpi=self.dpi, bbox_inches="tight")
+        plt.close()
+        self.frames.append(frame_path)
+
+
+def default_phases(rfc: Optional[RFC] = None) -> list[Phase]:
+    """Refining phase (Prod0, Prod6, Prod9, Prod12) followed by the modifying phase."""
+    return [
+        Phase("refining", [Prod0(rfc=rfc), Prod6(rfc=rfc), Prod9(rfc=rfc), Prod12(rfc=rfc)]),
+        Phase(
+            "modifying",
+            [Prod1(), Prod2(), Prod3(), Prod4(), Prod5(), Prod7(), Prod8(), Prod10(), Prod11()],
+        ),
+    ]
+
+
+__all__ = [
+    "Phase",
+    "DerivationHook",
+    "DerivationResult",
+    "DerivationEngine",
+    "FrameRenderer",
+    "default_phases",
+]
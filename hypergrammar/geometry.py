@@ -0,0 +1,195 @@
+import math
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener
+
+Cell = tuple[int, int]
+
+
+class SpatialIndex(HypergraphListener):
+    """Uniform grid over the centroids of the edges of a hypergraph.
+
+    Elements are indexed by the mean of their vertices, so E edges are
+    indexed by their midpoint. Edges with a vertex without coordinates are
+    not indexed until the coordinates are set. The index follows the
+    hypergraph through its change notifications: added and removed edges
+    are inserted and dropped, a vertex change moves its incident edges.
+    Queries only visit the grid cells overlapping the searched region.
+    The cell size defaults to `default_cell_size` of the mesh at build time.
+    """
+
+    def __init__(self, graph: Hypergraph, cell_size: Optional[float] = None) -> None:
+        if cell_size is None:
+            cell_size = default_cell_size(graph)
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, but got {cell_size}")
+        self._graph = graph
+        self._cell_size = cell_size
+        self._cells: dict[Cell, set[Edge]] = {}
+        # indexed edge -> its cell and centroid
+        self._entries: dict[Edge, tuple[Cell, tuple[float, float]]] = {}
+        for edge in graph.get_edges():
+            self._insert(edge)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, edge: Edge) -> bool:
+        return edge in self._entries
+
+    def get_cell_size(self) -> float:
+        return self._cell_size
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def centroid(self, edge: Edge) -> Optional[tuple[float, float]]:
+        """Indexed centroid of `edge`, None when it is not indexed."""
+        entry = self._entries.get(edge)
+        return entry[1] if entry is not None else None
+
+    def _insert(self, edge: Edge) -> None:
+        coordinates = self._graph.get_coordinates()
+        vertices = edge.get_vertices()
+        if not vertices or not all(vertex in coordinates for vertex in vertices):
+            return
+        x, y = coordinates.get_many(vertices).mean(axis=0).tolist()
+        cell = self._cell(x, y)
+        self._cells.setdefault(cell, set()).add(edge)
+        self._entries[edge] = (cell, (x, y))
+
+    def _discard(self, edge: Edge) -> None:
+        entry = self._entries.pop(edge, None)
+        if entry is None:
+            return
+        bucket = self._cells[entry[0]]
+        bucket.discard(edge)
+        if not bucket:
+            del self._cells[entry[0]]
+
+    def edge_added(self, edge: Edge) -> None:
+        self._insert(edge)
+
+    def edge_removed(self, edge: Edge) -> None:
+        self._discard(edge)
+
+    def vertex_changed(self, vertex: str) -> None:
+        for edge in self._graph.get_incident_edges(vertex):
+            self._discard(edge)
+            self._insert(edge)
+
+    def _candidates(self, xmin: float, ymin: float, xmax: float, ymax: float) -> Iterator[Edge]:
+        (i0, j0), (i1, j1) = self._cell(xmin, ymin), self._cell(xmax, ymax)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+            # the region covers more cells than are occupied
+            for (i, j), bucket in self._cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    yield from bucket
+            return
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                yield from self._cells.get((i, j), ())
+
+    def elements_in_box(
+        self,
+        xmin: float,
+        ymin: float,
+        xmax: float,
+        ymax: float,
+        edge_type: Optional[EdgeType] = None,
+    ) -> list[Edge]:
+        """Edges whose centroid lies in the closed box, optionally only of `edge_type`."""
+        found = []
+        for edge in self._candidates(xmin, ymin, xmax, ymax):
+            if edge_type is not None and edge.get_type() != edge_type:
+                continue
+            x, y = self._entries[edge][1]
+            if xmin <= x <= xmax and ymin <= y <= ymax:
+                found.append(edge)
+        return found
+
+    def elements_within(
+        self,
+        point: tuple[float, float],
+        radius: float,
+        edge_type: Optional[EdgeType] = None,
+    ) -> list[Edge]:
+        """Edges whose centroid is at most `radius` from `point`, optionally only of `edge_type`."""
+        px, py = point
+        found = []
+        for edge in self._candidates(px - radius, py - radius, px + radius, py + radius):
+            if edge_type is not None and edge.get_type() != edge_type:
+                continue
+            x, y = self._entries[edge][1]
+            if (x - px) ** 2 + (y - py) ** 2 <= radius * radius:
+                found.append(edge)
+        return found
+
+
+def default_cell_size(graph: Hypergraph) -> float:
+    """Grid cell size matching the typical element size of `graph`.
+
+    This is the median length of the E edges with coordinates at both
+    ends. Without such edges, the extent of the vertices is divided by
+    the square root of their number. Falls back to 1.0 for a mesh without
+    extent.
+    """
+    coordinates = graph.get_coordinates()
+    ends = [tuple(edge.get_vertices()) for edge in graph.get_edges_of_type(EdgeType.E)]
+    ends = [pair for pair in ends if len(pair) == 2]
+    if ends:
+        xy = coordinates.lookup(v for pair in ends for v in pair).reshape(len(ends), 2, 2)
+        lengths = np.sqrt(((xy[:, 0] - xy[:, 1]) ** 2).sum(axis=1))
+        lengths = lengths[lengths > 0]
+        if len(lengths):
+            return float(np.median(lengths))
+    xy = coordinates.as_array()
+    xy = xy[~np.isnan(xy[:, 0])]
+    if len(xy) > 1:
+        extent = float((xy.max(axis=0) - xy.min(axis=0)).max())
+        if extent > 0:
+            return extent / math.sqrt(len(xy))
+    return 1.0
+
+
+def element_centroids(graph: Hypergraph, edges: Sequence[Edge]) -> np.ndarray:
+    """(n, 2) array of the mean vertex positions of `edges`.
+
+    Rows of edges with a vertex without coordinates are NaN.
+    """
+    if not edges:
+        return np.empty((0, 2))
+    counts = np.fromiter(
+        (len(edge.get_vertices()) for edge in edges), dtype=np.intp, count=len(edges)
+    )
+    xy = graph.get_coordinates().lookup(v for edge in edges for v in edge.get_vertices())
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return np.add.reduceat(xy, offsets, axis=0) / counts[:, None]
+
+
+def element_diameters(graph: Hypergraph, edges: Sequence[Edge]) -> np.ndarray:
+    """Largest distance between two vertices of each of `edges`.
+
+    Edges are grouped by their number of vertices and every group is
+    computed with one broadcast, NaN for edges with a vertex without coordinates.
+    """
+    diameters = np.full(len(edges), np.nan)
+    groups: dict[int, list[int]] = {}
+    for index, edge in enumerate(edges):
+        groups.setdefault(len(edge.get_vertices()), []).append(index)
+
+    coordinates = graph.get_coordinates()
+    for size, indices in groups.items():
+        xy = coordinates.lookup(
+            v for index in indices for v in edges[index].get_vertices()
+        ).reshape(len(indices), size, 2)
+        diff = xy[:, :, None, :] - xy[:, None, :, :]
+        distances = np.sqrt((diff ** 2).sum(axis=-1)).reshape(len(indices), -1)
+        diameters[indices] = distances.max(axis=1)
+    return diameters
+
+
+__all__ = ["SpatialIndex", "default_cell_size", "element_centroids", "element_diameters"]
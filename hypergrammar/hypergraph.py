@@ -1,11 +1,63 @@
-from typing import Optional, Mapping, Any
+import itertools
+from dataclasses import dataclass
+from typing import (
+    AbstractSet, Any, Callable, Hashable, Iterator, Mapping, Optional, Sequence, TypeVar,
+    TYPE_CHECKING, cast,
+)
 
+import numpy as np
 import xgi
 from matplotlib.axes import Axes
 
-from hypergrammar.edge import Edge
-from hypergrammar.rfc import RFC
-from hypergrammar.utils import get_edge_color
+from hypergrammar.coordinates import CoordinateStore
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.rfc import RFC, evaluate_rfc
+from hypergrammar.utils import NameAllocator, get_edge_color
+
+if TYPE_CHECKING:
+    from hypergrammar.dual import DualGraph
+    from hypergrammar.geometry import SpatialIndex
+    from hypergrammar.rfc_cache import RFCCache
+
+
+ElementKey = tuple[EdgeType, frozenset[str]]
+
+
+@dataclass(frozen=True)
+class Refinement:
+    """Record of an element broken into `children` around the vertex `center`.
+
+    `midpoints[i]` splits the side `cycle[i]`-`cycle[i + 1]` of `parent`.
+    """
+
+    parent: Edge
+    children: tuple[Edge, ...]
+    center: str
+    cycle: tuple[str, ...]
+    midpoints: tuple[str, ...]
+
+
+L = TypeVar("L", bound="HypergraphListener")
+
+
+class HypergraphListener:
+    """Receives change notifications from a `Hypergraph`.
+
+    Subclasses override the callbacks they are interested in,
+    the default implementations do nothing.
+    """
+
+    def edge_added(self, edge: Edge) -> None:
+        pass
+
+    def edge_removed(self, edge: Edge) -> None:
+        pass
+
+    def vertex_changed(self, vertex: str) -> None:
+        pass
+
+    def midpoint_changed(self, v1: str, v2: str, midpoint: str) -> None:
+        """The midpoint of the side `v1`-`v2` was registered or unregistered."""
 
 
 class Hypergraph:
@@ -13,39 +65,523 @@ class Hypergraph:
         """Create a Hypergraph.
         Optionally pass an `rfc` implementing `RFC` protocol
         """
-        self._edges: frozenset[Edge] = frozenset()
-        self._node_parameters: dict[str, dict[str, int]] = {}
+        self._edges: set[Edge] = set()
+        # snapshot returned by `get_edges`, rebuilt lazily after a change
+        self._edges_view: Optional[frozenset[Edge]] = frozenset()
+        self._edges_by_type: dict[EdgeType, set[Edge]] = {}
+        # vertex -> every edge containing it
+        self._incidence: dict[str, set[Edge]] = {}
+        # vertex pair -> binary E edges connecting it
+        self._pairs: dict[frozenset[str], set[Edge]] = {}
+        # split side -> vertex inserted in its middle, and the reverse mapping
+        self._midpoints: dict[frozenset[str], str] = {}
+        self._midpoint_parents: dict[str, frozenset[str]] = {}
+        # refinement levels, elements keyed by type and vertices so that a level
+        # survives parameter updates, and the present elements of every level
+        self._element_levels: dict[tuple[EdgeType, frozenset[str]], int] = {}
+        self._vertex_levels: dict[str, int] = {}
+        self._elements_by_level: dict[int, set[Edge]] = {}
+        # refinement tree, broken element -> its refinement, child -> parent
+        self._refinements: dict[ElementKey, Refinement] = {}
+        self._refinement_parents: dict[ElementKey, ElementKey] = {}
+        # refinements whose children are all unflagged leaves, by the parent's type
+        self._mergeable: dict[EdgeType, dict[ElementKey, Refinement]] = {}
+        self._node_parameters: dict[str, dict[str, float]] = {}
+        # "x" and "y" of every vertex having both, mirrored from `_node_parameters`
+        self._coordinates = CoordinateStore()
+        self._name_allocators: dict[str, NameAllocator] = {}
         self._rfc: Optional[RFC] = rfc
+        self._rfc_cache: Optional["RFCCache"] = None
+        self._spatial_index: Optional["SpatialIndex"] = None
+        self._dual_graph: Optional["DualGraph"] = None
+        self._listeners: list[HypergraphListener] = []
+        # indexes owned by the hypergraph, notified after the listeners
+        self._indexes: dict[Hashable, HypergraphListener] = {}
+        self._version = 0
+
+    def add_listener(self, listener: HypergraphListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: HypergraphListener) -> None:
+        self._listeners.remove(listener)
+
+    def get_index(self, key: Hashable, factory: Callable[["Hypergraph"], L]) -> L:
+        """Index owned by the hypergraph, built by `factory(self)` on first use of `key`.
+
+        It is notified of every change like a listener, but is not one of
+        the listeners and is not copied.
+        """
+        index = self._indexes.get(key)
+        if index is None:
+            index = factory(self)
+            self._indexes[key] = index
+        return cast(L, index)
+
+    def _observers(self) -> Iterator[HypergraphListener]:
+        return itertools.chain(self._listeners, self._indexes.values())
+
+    def get_version(self) -> int:
+        """Counter increased by every change of edges or vertex parameters."""
+        return self._version
 
     def add_edge(self, edge: Edge) -> None:
-        self._edges = self._edges.union(frozenset([edge]))
+        if edge in self._edges:
+            return
+        self._edges.add(edge)
+        self._edges_view = None
+        self._edges_by_type.setdefault(edge.get_type(), set()).add(edge)
+        for vertex in edge.get_vertices():
+            self._incidence.setdefault(vertex, set()).add(edge)
+        if edge.get_type() == EdgeType.E and len(edge.get_vertices()) == 2:
+            self._pairs.setdefault(edge.get_vertices(), set()).add(edge)
+        level = self._element_levels.get((edge.get_type(), edge.get_vertices()))
+        if level is not None:
+            self._elements_by_level.setdefault(level, set()).add(edge)
+        parent_key = self._refinement_parents.get((edge.get_type(), edge.get_vertices()))
+        if parent_key is not None:
+            self._update_mergeable(parent_key)
+        self._version += 1
+        for listener in self._observers():
+            listener.edge_added(edge)
 
     def remove_edge(self, edge: Edge) -> None:
-        self._edges = self._edges.difference(frozenset([edge]))
+        if edge not in self._edges:
+            return
+        self._edges.remove(edge)
+        self._edges_view = None
+        self._edges_by_type[edge.get_type()].discard(edge)
+        for vertex in edge.get_vertices():
+            incident = self._incidence[vertex]
+            incident.discard(edge)
+            if not incident:
+                del self._incidence[vertex]
+        if edge.get_type() == EdgeType.E and len(edge.get_vertices()) == 2:
+            pair_edges = self._pairs[edge.get_vertices()]
+            pair_edges.discard(edge)
+            if not pair_edges:
+                del self._pairs[edge.get_vertices()]
+        level = self._element_levels.get((edge.get_type(), edge.get_vertices()))
+        if level is not None:
+            self._elements_by_level[level].discard(edge)
+        parent_key = self._refinement_parents.get((edge.get_type(), edge.get_vertices()))
+        if parent_key is not None:
+            self._update_mergeable(parent_key)
+        self._version += 1
+        for listener in self._observers():
+            listener.edge_removed(edge)
+
+    def update_edge_parameters(self, edge: Edge, parameters: Mapping[str, int]) -> Edge:
+        """Replace `edge` with a copy whose parameters are updated with `parameters`.
+
+        Edges hash by their parameters, so they are never modified in place
+        while in a hypergraph. Returns the edge now stored in the hypergraph.
+        """
+        new_parameters = dict(edge.get_parameters())
+        new_parameters.update(parameters)
+        if new_parameters == edge.get_parameters():
+            return edge
+        new_edge = Edge(
+            edge.get_type(),
+            edge.get_vertices(),
+            new_parameters,
+            order=edge.get_order(),
+            boundary=edge.get_boundary(),
+        )
+        self.remove_edge(edge)
+        self.add_edge(new_edge)
+        return new_edge
 
-    def set_vertex_parameter(self, vertex: str, parameter: dict[str, int]) -> None:
+    def copy(self) -> "Hypergraph":
+        """Copy of the hypergraph sharing its (immutable) edges, without listeners,
+        rfc cache, spatial index and dual graph."""
+        new_hg = Hypergraph(rfc=self._rfc)
+        new_hg._element_levels = dict(self._element_levels)
+        new_hg._vertex_levels = dict(self._vertex_levels)
+        new_hg._refinements = dict(self._refinements)
+        new_hg._refinement_parents = dict(self._refinement_parents)
+        new_hg._mergeable = {t: dict(refinements) for t, refinements in self._mergeable.items()}
+        for edge in self._edges:
+            new_hg.add_edge(edge)
+        for vertex, params in self._node_parameters.items():
+            new_hg.set_vertex_parameter(vertex, dict(params) if params else params)
+        new_hg._midpoints = dict(self._midpoints)
+        new_hg._midpoint_parents = dict(self._midpoint_parents)
+        return new_hg
+
+    def set_vertex_parameter(self, vertex: str, parameter: dict[str, float]) -> None:
         self._node_parameters[vertex] = parameter
+        if parameter and "x" in parameter and "y" in parameter:
+            self._coordinates.set(vertex, parameter["x"], parameter["y"])
+        else:
+            self._coordinates.discard(vertex)
+        self._version += 1
+        for listener in self._observers():
+            listener.vertex_changed(vertex)
+
+    def set_vertex_positions(self, vertices: Sequence[str], xy: np.ndarray) -> None:
+        """Set "x" and "y" of many vertices at once, `xy` has shape (n, 2).
+
+        Other parameters of the vertices are kept."""
+        self._coordinates.set_many(vertices, xy)
+        for vertex, (x, y) in zip(vertices, xy.tolist()):
+            parameters = self._node_parameters.get(vertex) or {}
+            self._node_parameters[vertex] = {**parameters, "x": x, "y": y}
+        self._version += 1
+        for listener in self._observers():
+            for vertex in vertices:
+                listener.vertex_changed(vertex)
+
+    def get_coordinates(self) -> CoordinateStore:
+        return self._coordinates
+
+    def new_vertex_name(self, prefix: str = "v") -> str:
+        """Return a vertex name `<prefix><n>` not yet used in this hypergraph."""
+        allocator = self._name_allocators.get(prefix)
+        if allocator is None:
+            allocator = NameAllocator(prefix, self.has_vertex)
+            self._name_allocators[prefix] = allocator
+        return allocator.allocate()
 
     def set_rfc(self, rfc: Optional[RFC]) -> None:
+        if self._rfc_cache is not None and self._rfc is not None:
+            self._rfc_cache.clear(self._rfc)
         self._rfc = rfc
 
     def get_rfc(self) -> Optional[RFC]:
         return self._rfc
 
+    def set_rfc_cache(self, cache: Optional["RFCCache"]) -> None:
+        """Memoize rfc results in `cache` (see `RFCCache`), None disables caching."""
+        if self._rfc_cache is not None:
+            self.remove_listener(self._rfc_cache)
+        self._rfc_cache = cache
+        if cache is not None:
+            self.add_listener(cache)
+
+    def get_rfc_cache(self) -> Optional["RFCCache"]:
+        return self._rfc_cache
+
     def edge_rfc_is_valid(
-        self, edge: Edge, meta: Optional[Mapping[str, Any]] = None
+        self,
+        edge: Edge,
+        meta: Optional[Mapping[str, Any]] = None,
+        rfc: Optional[RFC] = None,
     ) -> Optional[bool]:
-        if self._rfc is None:
+        """Whether `rfc`, by default the hypergraph's, accepts `edge`."""
+        rfc = rfc if rfc is not None else self._rfc
+        if rfc is None:
             # if no rfc provided function returns None
             # to distinguish from invalid criterion
             return None
 
-        return bool(self._rfc.is_valid(edge, self, meta))
+        if self._rfc_cache is not None:
+            return self._rfc_cache.is_valid(rfc, edge, self, meta)
+        return bool(rfc.is_valid(edge, self, meta))
+
+    def edges_rfc_are_valid(
+        self,
+        edges: Sequence[Edge],
+        meta: Optional[Mapping[str, Any]] = None,
+        rfc: Optional[RFC] = None,
+    ) -> Optional[np.ndarray]:
+        """Mask of the `edges` accepted by `rfc`, by default the hypergraph's,
+        None when there is no rfc.
+
+        A single `is_valid_batch` call when the rfc implements it.
+        """
+        rfc = rfc if rfc is not None else self._rfc
+        if rfc is None:
+            return None
+
+        if self._rfc_cache is not None:
+            return self._rfc_cache.evaluate(rfc, edges, self, meta)
+        return evaluate_rfc(rfc, edges, self, meta)
+
+    def get_spatial_index(self, cell_size: Optional[float] = None) -> "SpatialIndex":
+        """Grid index over edge centroids (see `SpatialIndex`), built on first use
+        and kept up to date afterwards. The cell size defaults to the typical
+        element size (see `default_cell_size`), a different `cell_size`
+        rebuilds it."""
+        index = self._spatial_index
+        if index is not None and (cell_size is None or cell_size == index.get_cell_size()):
+            return index
+
+        # geometry builds on this module
+        from hypergrammar.geometry import SpatialIndex  # pylint: disable=import-outside-toplevel
+
+        if index is not None:
+            self.remove_listener(index)
+        index = SpatialIndex(self, cell_size)
+        self.add_listener(index)
+        self._spatial_index = index
+        return index
+
+    def get_dual_graph(self) -> "DualGraph":
+        """Element adjacency (see `DualGraph`), built on first use and kept
+        up to date afterwards."""
+        if self._dual_graph is None:
+            # dual builds on this module
+            from hypergrammar.dual import DualGraph  # pylint: disable=import-outside-toplevel
+
+            self._dual_graph = DualGraph(self)
+            self.add_listener(self._dual_graph)
+        return self._dual_graph
+
+    def get_element_neighbours(self, element: Edge) -> list[Edge]:
+        """Elements sharing a side with `element`, hanging nodes included."""
+        return self.get_dual_graph().neighbours(element)
+
+    def elements_within(
+        self,
+        point: tuple[float, float],
+        radius: float,
+        edge_type: Optional[EdgeType] = None,
+    ) -> list[Edge]:
+        """Edges whose centroid is at most `radius` from `point`."""
+        return self.get_spatial_index().elements_within(point, radius, edge_type)
+
+    def elements_in_box(
+        self,
+        xmin: float,
+        ymin: float,
+        xmax: float,
+        ymax: float,
+        edge_type: Optional[EdgeType] = None,
+    ) -> list[Edge]:
+        """Edges whose centroid lies in the box [xmin, xmax] x [ymin, ymax]."""
+        return self.get_spatial_index().elements_in_box(xmin, ymin, xmax, ymax, edge_type)
 
     def get_edges(self) -> frozenset[Edge]:
-        return self._edges
+        if self._edges_view is None:
+            self._edges_view = frozenset(self._edges)
+        return self._edges_view
+
+    def has_edge(self, edge: Edge) -> bool:
+        return edge in self._edges
+
+    def get_edges_of_type(self, edge_type: EdgeType) -> list[Edge]:
+        return list(self._edges_by_type.get(edge_type, ()))
+
+    def get_incident_edges(
+        self, vertex: str, edge_type: Optional[EdgeType] = None
+    ) -> list[Edge]:
+        """Edges containing `vertex`, optionally only those of `edge_type`."""
+        incident = self._incidence.get(vertex, ())
+        if edge_type is None:
+            return list(incident)
+        return [edge for edge in incident if edge.get_type() == edge_type]
+
+    def get_neighbours(self, vertex: str) -> set[str]:
+        """Vertices connected to `vertex` by a binary E edge."""
+        neighbours: set[str] = set()
+        for edge in self._incidence.get(vertex, ()):
+            if edge.get_type() == EdgeType.E and len(edge.get_vertices()) == 2:
+                neighbours.update(edge.get_vertices())
+        neighbours.discard(vertex)
+        return neighbours
+
+    def find_e_edge(self, v1: str, v2: str) -> Optional[Edge]:
+        """Binary E edge connecting `v1` and `v2`, None when there is none."""
+        pair_edges = self._pairs.get(frozenset((v1, v2)))
+        if not pair_edges:
+            return None
+        return next(iter(pair_edges))
+
+    def find_e_edges(self, v1: str, v2: str) -> list[Edge]:
+        """Every binary E edge connecting `v1` and `v2`."""
+        return list(self._pairs.get(frozenset((v1, v2)), ()))
+
+    def has_e_edge(self, v1: str, v2: str) -> bool:
+        return frozenset((v1, v2)) in self._pairs
+
+    def register_midpoint(self, v1: str, v2: str, midpoint: str) -> None:
+        """Record that the side `v1`-`v2` was split at `midpoint`."""
+        side = frozenset((v1, v2))
+        self._midpoints[side] = midpoint
+        self._midpoint_parents[midpoint] = side
+        for listener in self._observers():
+            listener.midpoint_changed(v1, v2, midpoint)
+
+    def unregister_midpoint(self, v1: str, v2: str) -> None:
+        midpoint = self._midpoints.pop(frozenset((v1, v2)), None)
+        if midpoint is not None:
+            self._midpoint_parents.pop(midpoint, None)
+            for listener in self._observers():
+                listener.midpoint_changed(v1, v2, midpoint)
+
+    def get_midpoint(self, v1: str, v2: str) -> Optional[str]:
+        """Registered midpoint of the side `v1`-`v2`, None when it was not split."""
+        midpoint = self._midpoints.get(frozenset((v1, v2)))
+        if midpoint is None or not self.has_vertex(midpoint):
+            return None
+        return midpoint
+
+    def get_midpoint_parent(self, midpoint: str) -> Optional[frozenset[str]]:
+        """The side that `midpoint` was inserted into, None for other vertices."""
+        return self._midpoint_parents.get(midpoint)
+
+    def find_midpoint(
+        self, v1: str, v2: str, exclude: Optional[AbstractSet[str]] = None
+    ) -> Optional[str]:
+        """Vertex splitting the side `v1`-`v2` into two binary E edges.
+
+        The registry is consulted first, otherwise a common neighbour of both
+        vertices (not in `exclude`) is looked up through the adjacency index.
+        A common neighbour is skipped when `v1`-`v2` is itself a registered half
+        of a side ending in it, the base edge kept next to a hanging node
+        closes such a triangle.
+        """
+        excluded: AbstractSet[str] = exclude or frozenset()
+        midpoint = self.get_midpoint(v1, v2)
+        if (
+            midpoint is not None
+            and midpoint not in excluded
+            and self.has_e_edge(v1, midpoint)
+            and self.has_e_edge(midpoint, v2)
+        ):
+            return midpoint
+
+        neighbours = self.get_neighbours(v1)
+        if len(neighbours) > len(self.get_neighbours(v2)):
+            v1, v2 = v2, v1
+            neighbours = self.get_neighbours(v1)
+        for candidate in neighbours:
+            if candidate in excluded or candidate == v2 or not self.has_e_edge(candidate, v2):
+                continue
+            parents = self._midpoint_parents
+            if (
+                parents.get(v1) == frozenset((v2, candidate))
+                or parents.get(v2) == frozenset((v1, candidate))
+            ):
+                continue
+            return candidate
+        return None
+
+    def set_element_level(self, edge: Edge, level: int) -> None:
+        """Record how many times the region of the element `edge` was refined.
+
+        The level belongs to the element's type and vertices, so it is kept
+        when the element is replaced by `update_edge_parameters`.
+        """
+        key = (edge.get_type(), edge.get_vertices())
+        old_level = self._element_levels.get(key)
+        if old_level is not None:
+            self._elements_by_level[old_level].discard(edge)
+        self._element_levels[key] = level
+        if edge in self._edges:
+            self._elements_by_level.setdefault(level, set()).add(edge)
+
+    def get_element_level(self, edge: Edge) -> int:
+        """Refinement level of `edge`, 0 for the elements of the initial mesh."""
+        return self._element_levels.get((edge.get_type(), edge.get_vertices()), 0)
+
+    def set_vertex_level(self, vertex: str, level: int) -> None:
+        self._vertex_levels[vertex] = level
+
+    def get_vertex_level(self, vertex: str) -> Optional[int]:
+        """Level of the refinement that created `vertex`, None when it was not stamped."""
+        return self._vertex_levels.get(vertex)
+
+    def get_max_level(self) -> int:
+        return max((level for level, edges in self._elements_by_level.items() if edges), default=0)
+
+    def get_elements_at_level(self, level: int) -> list[Edge]:
+        """Elements of refinement level `level`, level 0 holds every unstamped element."""
+        if level <= 0:
+            return [
+                edge for edge in self._edges
+                if edge.get_type() != EdgeType.E and self.get_element_level(edge) == 0
+            ]
+        return list(self._elements_by_level.get(level, ()))
+
+    def get_elements_at_least(self, level: int) -> list[Edge]:
+        """Elements of refinement level `level` or finer, in time linear in the result."""
+        if level <= 0:
+            return [edge for edge in self._edges if edge.get_type() != EdgeType.E]
+        found: list[Edge] = []
+        for edge_level, edges in self._elements_by_level.items():
+            if edge_level >= level:
+                found.extend(edges)
+        return found
+
+    def record_refinement(self, refinement: Refinement) -> None:
+        """Add `refinement` to the refinement tree."""
+        parent = refinement.parent
+        parent_key = (parent.get_type(), parent.get_vertices())
+        self._refinements[parent_key] = refinement
+        for child in refinement.children:
+            self._refinement_parents[(child.get_type(), child.get_vertices())] = parent_key
+        self._update_mergeable(parent_key)
+
+    def forget_refinement(self, refinement: Refinement) -> None:
+        """Remove `refinement` from the refinement tree, after its children were merged."""
+        parent = refinement.parent
+        parent_key = (parent.get_type(), parent.get_vertices())
+        self._refinements.pop(parent_key, None)
+        self._mergeable.get(parent.get_type(), {}).pop(parent_key, None)
+        for child in refinement.children:
+            self._refinement_parents.pop((child.get_type(), child.get_vertices()), None)
+
+    def _update_mergeable(self, parent_key: ElementKey) -> None:
+        refinement = self._refinements.get(parent_key)
+        if refinement is None:
+            return
+        mergeable = self._mergeable.setdefault(parent_key[0], {})
+        for child in refinement.children:
+            current = self.find_element(child.get_type(), child.get_vertices())
+            if current is None or current.get_parameters().get("R", 0) != 0:
+                mergeable.pop(parent_key, None)
+                return
+        mergeable[parent_key] = refinement
+
+    def get_mergeable_refinements(self, edge_type: EdgeType) -> list[Refinement]:
+        """Refinements of elements of `edge_type` whose children are all unflagged
+        leaves, kept up to date as the children change."""
+        return list(self._mergeable.get(edge_type, {}).values())
+
+    def get_refinement(self, element: Edge) -> Optional[Refinement]:
+        """Refinement which broke `element`, None when it was not broken."""
+        return self._refinements.get((element.get_type(), element.get_vertices()))
+
+    def get_parent_refinement(self, element: Edge) -> Optional[Refinement]:
+        """Refinement which created `element`, None for the elements of the initial mesh."""
+        parent_key = self._refinement_parents.get((element.get_type(), element.get_vertices()))
+        return self._refinements.get(parent_key) if parent_key is not None else None
+
+    def get_refinements(self, edge_type: Optional[EdgeType] = None) -> list[Refinement]:
+        """Recorded refinements, optionally only those of elements of `edge_type`."""
+        if edge_type is None:
+            return list(self._refinements.values())
+        return [r for (t, _), r in self._refinements.items() if t == edge_type]
+
+    def find_element(self, edge_type: EdgeType, vertices: frozenset[str]) -> Optional[Edge]:
+        """Edge of `edge_type` with exactly `vertices`, None when there is none."""
+        for edge in self._incidence.get(next(iter(vertices)), ()):
+            if edge.get_type() == edge_type and edge.get_vertices() == vertices:
+                return edge
+        return None
+
+    def remove_vertex(self, vertex: str) -> None:
+        """Forget the parameters and level of a vertex without edges."""
+        if vertex in self._incidence:
+            raise ValueError(f"Vertex {vertex} still has {len(self._incidence[vertex])} edges")
+        if vertex not in self._node_parameters:
+            return
+        del self._node_parameters[vertex]
+        self._coordinates.discard(vertex)
+        self._vertex_levels.pop(vertex, None)
+        self._version += 1
+        for listener in self._observers():
+            listener.vertex_changed(vertex)
+
+    def has_vertex(self, vertex: str) -> bool:
+        return vertex in self._incidence or vertex in self._node_parameters
+
+    def get_vertices(self) -> set[str]:
+        """Vertices of all edges and vertices with parameters."""
+        return set(self._incidence).union(self._node_parameters)
 
-    def get_vertex_parameters(self, vertex: str) -> dict[str, int]:
+    def get_vertex_parameters(self, vertex: str) -> dict[str, float]:
         return self._node_parameters.get(vertex, {})
 
     def draw(
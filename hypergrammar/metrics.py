@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from hypergrammar.coordinates import CoordinateStore
+from hypergrammar.cycles import find_cycle
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+
+ELEMENT_TYPES = (EdgeType.Q, EdgeType.P, EdgeType.S, EdgeType.T)
+
+
+@dataclass
+class ElementMetrics:
+    """Quality measures of `elements`, entry i of every array describes `elements[i]`.
+
+    Elements whose cycle is unknown or which have a vertex without
+    coordinates get NaN.
+    """
+
+    elements: list[Edge]
+    area: np.ndarray
+    diameter: np.ndarray
+    # smallest interior angle at a corner, in radians
+    min_angle: np.ndarray
+    # longest side over shortest side
+    aspect_ratio: np.ndarray
+    # (n, 2) centroids of the enclosed polygons
+    centroid: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+def element_cycle(graph: Hypergraph, element: Edge) -> Optional[tuple[str, ...]]:
+    """Corners of `element` in cyclic order, None when they do not form a cycle.
+
+    A known order (see `Edge.get_order`) is used as is. Otherwise corners
+    are adjacent when an E edge joins them or when they are the ends of a
+    side split by a registered midpoint, so sides whose base edge was
+    removed next to a hanging node are followed as well.
+    """
+    order = element.get_order()
+    if order is not None:
+        return order
+
+    vertices = element.get_vertices()
+
+    def adjacent(vertex: str) -> set[str]:
+        found = set()
+        for neighbour in graph.get_neighbours(vertex):
+            if neighbour in vertices:
+                found.add(neighbour)
+                continue
+            parent = graph.get_midpoint_parent(neighbour)
+            if parent is not None and vertex in parent:
+                found.update(parent & vertices)
+        found.discard(vertex)
+        return found
+
+    return find_cycle(vertices, adjacent)
+
+
+def cycle_metrics(
+    coordinates: CoordinateStore, cycles: Sequence[Sequence[str]]
+) -> dict[str, np.ndarray]:
+    """Area, diameter, minimum angle, aspect ratio and centroid of polygons given
+    by their ordered `cycles` of vertices.
+
+    Cycles are grouped by their length and every group is computed with
+    NumPy over an (m, k, 2) array gathered from `coordinates` in one lookup.
+    """
+    n = len(cycles)
+    metrics = {
+        "area": np.full(n, np.nan),
+        "diameter": np.full(n, np.nan),
+        "min_angle": np.full(n, np.nan),
+        "aspect_ratio": np.full(n, np.nan),
+        "centroid": np.full((n, 2), np.nan),
+    }
+    groups: dict[int, list[int]] = {}
+    for index, cycle in enumerate(cycles):
+        groups.setdefault(len(cycle), []).append(index)
+
+    for size, indices in groups.items():
+        if size < 3:
+            continue
+        xy = coordinates.lookup(v for index in indices for v in cycles[index])
+        xy = xy.reshape(len(indices), size, 2)
+        nxt = np.roll(xy, -1, axis=1)
+
+        # shoelace formula, signed so that the centroid works for either orientation
+        cross = xy[:, :, 0] * nxt[:, :, 1] - nxt[:, :, 0] * xy[:, :, 1]
+        signed_area = cross.sum(axis=1) / 2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centroid = ((xy + nxt) * cross[:, :, None]).sum(axis=1) / (6 * signed_area[:, None])
+        degenerate = signed_area == 0
+        centroid[degenerate] = xy[degenerate].mean(axis=1)
+
+        diff = xy[:, :, None, :] - xy[:, None, :, :]
+        diameter = np.sqrt((diff ** 2).sum(axis=-1)).reshape(len(indices), -1).max(axis=1)
+
+        sides = nxt - xy
+        lengths = np.sqrt((sides ** 2).sum(axis=-1))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            aspect_ratio = lengths.max(axis=1) / lengths.min(axis=1)
+
+        # interior angle at corner i, from the side to the next corner to the
+        # side to the previous one; the sine is signed by the orientation of
+        # the cycle so a reflex corner gets an angle above pi
+        to_next = sides
+        to_prev = -np.roll(sides, 1, axis=1)
+        cross = to_next[:, :, 0] * to_prev[:, :, 1] - to_next[:, :, 1] * to_prev[:, :, 0]
+        sine = np.sign(signed_area)[:, None] * cross
+        cosine = (to_next * to_prev).sum(axis=-1)
+        min_angle = np.mod(np.arctan2(sine, cosine), 2 * np.pi).min(axis=1)
+
+        metrics["area"][indices] = np.abs(signed_area)
+        metrics["diameter"][indices] = diameter
+        metrics["min_angle"][indices] = min_angle
+        metrics["aspect_ratio"][indices] = aspect_ratio
+        metrics["centroid"][indices] = centroid
+    return metrics
+
+
+def element_metrics(graph: Hypergraph, elements: Sequence[Edge]) -> ElementMetrics:
+    """Quality measures of `elements`, from their ordered boundary cycles."""
+    cycles = [element_cycle(graph, element) or () for element in elements]
+    return ElementMetrics(elements=list(elements), **cycle_metrics(graph.get_coordinates(), cycles))
+
+
+def mesh_quality(
+    graph: Hypergraph, edge_types: Iterable[EdgeType] = ELEMENT_TYPES
+) -> ElementMetrics:
+    """Quality measures of every element of `edge_types` (by default Q, P, S and T)."""
+    elements = [
+        element for edge_type in edge_types for element in graph.get_edges_of_type(edge_type)
+    ]
+    return element_metrics(graph, elements)
+
+
+__all__ = [
+    "ELEMENT_TYPES",
+    "ElementMetrics",
+    "element_cycle",
+    "cycle_metrics",
+    "element_metrics",
+    "mesh_quality",
+]
@@ -1,8 +1,52 @@
+import itertools
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from hypergrammar.edge import Edge
 from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.rfc import RFC, supports_batch
+
+# size of the first RFC batch evaluated by `IProd._rfc_results`
+FIRST_RFC_BATCH = 32
 
 
 class IProd(ABC):
     @abstractmethod
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
         pass
+
+    def _active_rfc(self, graph: Hypergraph) -> Optional[RFC]:
+        """The RFC checked by the production: its own, otherwise the hypergraph's."""
+        rfc = getattr(self, "_rfc", None)
+        return rfc if rfc is not None else graph.get_rfc()
+
+    def _rfc_mask(self, graph: Hypergraph, edges: Sequence[Edge]) -> Optional[np.ndarray]:
+        """Mask of the `edges` accepted by the active RFC, evaluated in one batch.
+
+        None when there is no RFC or it does not implement `is_valid_batch`,
+        the edges are then checked one by one.
+        """
+        rfc = self._active_rfc(graph)
+        if not edges or not supports_batch(rfc):
+            return None
+        return graph.edges_rfc_are_valid(edges, rfc=rfc)
+
+    def _rfc_results(self, graph: Hypergraph, edges: Sequence[Edge]) -> Iterator[Optional[bool]]:
+        """RFC result of each of `edges` in order, evaluated lazily in batches.
+
+        The first batch has `FIRST_RFC_BATCH` edges and every next one is
+        twice as large, so a caller stopping at the first accepted edge
+        evaluates O(its position) edges and a full sweep O(len(edges)).
+        Yields None for the edges to check one by one, see `_rfc_mask`.
+        """
+        start, size = 0, FIRST_RFC_BATCH
+        while start < len(edges):
+            mask = self._rfc_mask(graph, edges[start:start + size])
+            if mask is None:
+                yield from itertools.repeat(None, len(edges) - start)
+                return
+            yield from mask.tolist()
+            start += size
+            size *= 2
@@ -0,0 +1,571 @@
+import itertools
+from abc import abstractmethod
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, TypeVar
+
+from hypergrammar.cycles import (
+    broken_cycle,
+    cycle_cost,
+    cycle_edges,
+    e_cycle,
+    element_boundary,
+)
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener, Refinement
+from hypergrammar.productions.i_prod import IProd
+from hypergrammar.rfc import RFC, check_guards
+
+T = TypeVar("T")
+
+
+class ElementProduction(IProd):
+    """Base of the productions matching one element hyperedge of `size` vertices.
+
+    Candidates are the edges of `edge_type` whose R parameter equals
+    `source_r` (`missing_r` is assumed when R is not set). An element with
+    a wrong number of vertices raises ValueError when `strict_size` is set
+    and is skipped otherwise. With `uses_rfc` unset no RFC is consulted.
+    An RFC implementing `is_valid_batch` is evaluated over the candidates
+    in growing batches, as far as the sweep gets (see `IProd._rfc_results`).
+
+    Subclasses yield the matched elements from `_matches`, lazily so that every
+    match sees the rewrites of the previous ones, and rewrite one match in
+    `_rewrite`. `apply` rewrites the first match, `apply_all` every match
+    found in one sweep over the candidates.
+    """
+
+    def __init__(
+        self,
+        edge_type: EdgeType,
+        size: int,
+        source_r: int,
+        rfc: Optional[RFC] = None,
+        strict_size: bool = True,
+        missing_r: Optional[int] = None,
+        uses_rfc: bool = True,
+    ) -> None:
+        self._edge_type = edge_type
+        self._size = size
+        self._source_r = source_r
+        self._rfc = rfc
+        self._strict_size = strict_size
+        self._missing_r = missing_r
+        self._uses_rfc = uses_rfc
+        super().__init__()
+
+    def apply(self, graph: Hypergraph) -> Hypergraph | None:
+        for match in self._matches(graph):
+            target = self._target(graph)
+            self._rewrite(target, match)
+            return target
+        return None
+
+    def apply_all(self, graph: Hypergraph) -> Hypergraph | None:
+        """Rewrite every element matching in one sweep, None when none matches."""
+        target = self._target(graph)
+        applied = False
+        for match in self._matches(target):
+            self._rewrite(target, match)
+            applied = True
+        return target if applied else None
+
+    def _target(self, graph: Hypergraph) -> Hypergraph:
+        """Hypergraph the rewrites are applied to."""
+        return graph
+
+    @abstractmethod
+    def _matches(self, graph: Hypergraph) -> Iterator[Any]:
+        pass
+
+    @abstractmethod
+    def _rewrite(self, graph: Hypergraph, match: Any) -> None:
+        pass
+
+    def _candidates(self, graph: Hypergraph) -> list[Edge]:
+        return [
+            edge for edge in graph.get_edges_of_type(self._edge_type)
+            if edge.get_parameters().get("R", self._missing_r) == self._source_r
+        ]
+
+    def _candidate_results(
+        self, graph: Hypergraph, candidates: list[Edge]
+    ) -> Iterator[Optional[bool]]:
+        if not self._uses_rfc:
+            return itertools.repeat(None, len(candidates))
+        return self._rfc_results(graph, candidates)
+
+    def _has_size(self, edge: Edge) -> bool:
+        count = len(edge.get_vertices())
+        if count == self._size:
+            return True
+        if self._strict_size:
+            raise ValueError(
+                f"{self._edge_type.name} edge must connect exactly {self._size} vertices, "
+                f"but got {count}"
+            )
+        return False
+
+    def _validate_edge(self, edge: Edge, graph: Hypergraph) -> bool:
+        if not self._uses_rfc:
+            return True
+
+        res = graph.edge_rfc_is_valid(edge, rfc=self._rfc)
+
+        # no rfc was found
+        if res is None:
+            return True
+
+        return res
+
+    def _guarded(
+        self,
+        graph: Hypergraph,
+        edge: Edge,
+        match: Callable[[], Optional[T]],
+        cost: float,
+        accepted: Optional[bool] = None,
+    ) -> Optional[T]:
+        """Result of the structural check `match` on an element the RFC accepts.
+
+        `accepted` is the RFC result when it was already evaluated in a batch.
+        """
+        if accepted is not None:
+            return match() if accepted else None
+        rfc = self._active_rfc(graph) if self._uses_rfc else None
+        return check_guards(rfc, lambda: self._validate_edge(edge, graph), match, cost)
+
+
+class FlagElement(ElementProduction):
+    """Flags an element for refinement by setting R=1 on it (Prod0, Prod6, Prod9, Prod12).
+
+    With `check_cycle` the element's vertices must form a cycle of E edges.
+    With `reset_parameters` the flagged element gets only {"R": 1},
+    otherwise its other parameters are kept.
+    """
+
+    def __init__(
+        self,
+        edge_type: EdgeType,
+        size: int,
+        rfc: Optional[RFC] = None,
+        strict_size: bool = True,
+        missing_r: Optional[int] = None,
+        check_cycle: bool = True,
+        reset_parameters: bool = False,
+    ) -> None:
+        super().__init__(edge_type, size, 0, rfc, strict_size, missing_r)
+        self._check_element_cycle = check_cycle
+        self._reset_parameters = reset_parameters
+
+    def _matches(self, graph: Hypergraph) -> Iterator[Edge]:
+        candidates = self._candidates(graph)
+        results = self._candidate_results(graph, candidates)
+        for edge, accepted in zip(candidates, results):
+            if not self._has_size(edge):
+                continue
+
+            if self._check_element_cycle:
+                cycle = self._guarded(
+                    graph,
+                    edge,
+                    lambda: e_cycle(graph, edge.get_vertices(), edge.get_order()),
+                    cycle_cost(self._size, edge.get_order()),
+                    accepted,
+                )
+                if cycle is None:
+                    continue
+            elif not (self._validate_edge(edge, graph) if accepted is None else accepted):
+                continue
+
+            yield edge
+
+    def flag(self, graph: Hypergraph, edge: Edge) -> Optional[Edge]:
+        """Flag the element `edge` without consulting the RFC.
+
+        The element must still be an unflagged element of this production;
+        returns the flagged element, None when it was not flagged.
+        """
+        if edge.get_type() != self._edge_type or not graph.has_edge(edge):
+            return None
+        if edge.get_parameters().get("R", self._missing_r) != self._source_r:
+            return None
+        if len(edge.get_vertices()) != self._size:
+            return None
+        if (
+            self._check_element_cycle
+            and e_cycle(graph, edge.get_vertices(), edge.get_order()) is None
+        ):
+            return None
+        return self._flag(graph, edge)
+
+    def _rewrite(self, graph: Hypergraph, match: Edge) -> None:
+        self._flag(graph, match)
+
+    def _flag(self, graph: Hypergraph, match: Edge) -> Edge:
+        if not self._reset_parameters:
+            return graph.update_edge_parameters(match, {"R": 1})
+        flagged = Edge(
+            edge_type=self._edge_type,
+            vertices=match.get_vertices(),
+            parameters={"R": 1},
+            order=match.get_order(),
+            boundary=match.get_boundary(),
+        )
+        graph.remove_edge(match)
+        graph.add_edge(flagged)
+        return flagged
+
+
+class _PendingElements(HypergraphListener):
+    """Flagged elements of one hypergraph whose boundary may still need marking.
+
+    An element leaves the set once it is found settled, and comes back
+    when it is added again or an E edge between two of its vertices is
+    added (a side marked, split or restored).
+    """
+
+    def __init__(
+        self, graph: Hypergraph, edge_type: EdgeType, is_candidate: Callable[[Edge], bool]
+    ) -> None:
+        self._graph = graph
+        self._edge_type = edge_type
+        self._is_candidate = is_candidate
+        self._pending = {
+            edge for edge in graph.get_edges_of_type(edge_type) if is_candidate(edge)
+        }
+
+    def snapshot(self) -> list[Edge]:
+        return list(self._pending)
+
+    def settle(self, edge: Edge) -> None:
+        self._pending.discard(edge)
+
+    def edge_added(self, edge: Edge) -> None:
+        if edge.get_type() == self._edge_type:
+            if self._is_candidate(edge):
+                self._pending.add(edge)
+            return
+        if edge.get_type() != EdgeType.E or len(edge.get_vertices()) != 2:
+            return
+        v1, v2 = edge.get_vertices()
+        for element in self._graph.get_incident_edges(v1, self._edge_type):
+            if v2 in element.get_vertices() and self._is_candidate(element):
+                self._pending.add(element)
+
+    def edge_removed(self, edge: Edge) -> None:
+        self._pending.discard(edge)
+
+
+class MarkElement(ElementProduction):
+    """Marks the boundary E edges of a flagged element with R=1 (Prod1, Prod7, Prod10).
+
+    The element is skipped when any of its boundary edges is already marked
+    (`skip_if_any_marked`) or only when all of them are. With
+    `mark_only_unmarked` edges with R other than 0 are left untouched.
+    With `chordless` the E edges between the element's vertices must be
+    exactly its sides. With `copy_on_write` the input is not modified and
+    a copy is returned.
+    """
+
+    def __init__(
+        self,
+        edge_type: EdgeType,
+        size: int,
+        rfc: Optional[RFC] = None,
+        strict_size: bool = True,
+        uses_rfc: bool = True,
+        skip_if_any_marked: bool = False,
+        mark_only_unmarked: bool = False,
+        chordless: bool = False,
+        copy_on_write: bool = False,
+    ) -> None:
+        super().__init__(edge_type, size, 1, rfc, strict_size, uses_rfc=uses_rfc)
+        self._skip_if_any_marked = skip_if_any_marked
+        self._mark_only_unmarked = mark_only_unmarked
+        self._chordless = chordless
+        self._copy_on_write = copy_on_write
+
+    def _target(self, graph: Hypergraph) -> Hypergraph:
+        return graph.copy() if self._copy_on_write else graph
+
+    def _pending_elements(self, graph: Hypergraph) -> _PendingElements:
+        """Candidates of `graph` not yet found settled, an index owned by `graph`."""
+        return graph.get_index(
+            (_PendingElements, self),
+            lambda owner: _PendingElements(
+                owner,
+                self._edge_type,
+                lambda edge: edge.get_parameters().get("R", self._missing_r) == self._source_r,
+            ),
+        )
+
+    def _matches(self, graph: Hypergraph) -> Iterator[list[Edge]]:
+        """Flagged elements with boundary edges left to mark.
+
+        Elements found settled (all sides marked, or any with
+        `skip_if_any_marked`, or of a wrong size) are dropped from the
+        pending index, so a derivation checks each of them once per change
+        of its sides instead of on every application.
+        """
+        pending = self._pending_elements(graph)
+        candidates = pending.snapshot()
+        results = self._candidate_results(graph, candidates)
+        for edge, accepted in zip(candidates, results):
+            if not graph.has_edge(edge):
+                continue
+            if not self._has_size(edge):
+                pending.settle(edge)
+                continue
+
+            boundary_edges = self._find_element_boundary(graph, edge, accepted)
+            if boundary_edges is None:
+                continue
+
+            marked = [e.get_parameters().get("R", 0) == 1 for e in boundary_edges]
+            if any(marked) if self._skip_if_any_marked else all(marked):
+                pending.settle(edge)
+                continue
+
+            yield boundary_edges
+
+    def _rewrite(self, graph: Hypergraph, match: list[Edge]) -> None:
+        for b_edge in match:
+            if self._mark_only_unmarked and b_edge.get_parameters().get("R", 0) != 0:
+                continue
+            graph.update_edge_parameters(b_edge, {"R": 1})
+
+    def _find_element_boundary(
+        self, graph: Hypergraph, edge: Edge, accepted: Optional[bool] = None
+    ) -> Optional[list[Edge]]:
+        """Boundary E edges of an element accepted by the RFC, None when it does not match."""
+        cycle = self._guarded(
+            graph,
+            edge,
+            lambda: e_cycle(graph, edge.get_vertices(), edge.get_order()),
+            cycle_cost(self._size, edge.get_order()),
+            accepted,
+        )
+        if cycle is None:
+            return None
+        if self._chordless and not self._is_chordless(graph, cycle):
+            return None
+        return [e for e in cycle_edges(graph, cycle, edge.get_boundary()) if e is not None]
+
+    @staticmethod
+    def _is_chordless(graph: Hypergraph, cycle: Sequence[str]) -> bool:
+        """Whether the only E edges between vertices of `cycle` are its sides."""
+        pairs = itertools.combinations(cycle, 2)
+        return sum(len(graph.find_e_edges(v1, v2)) for v1, v2 in pairs) == len(cycle)
+
+
+class BreakElement(ElementProduction):
+    """Breaks a flagged element whose sides are all split into quadrilaterals
+    (Prod5, Prod8, Prod11).
+
+    A central vertex is connected to every side midpoint by a spoke with
+    `spoke_parameters`, and one Q element (R=0) is created per corner.
+    The central vertex is placed at the mean of the corners; with
+    `center_requires_coordinates` it is only placed when every corner has
+    coordinates, otherwise missing coordinates count as 0.
+    """
+
+    def __init__(
+        self,
+        edge_type: EdgeType,
+        size: int,
+        rfc: Optional[RFC] = None,
+        strict_size: bool = True,
+        spoke_parameters: Optional[Mapping[str, int]] = None,
+        center_requires_coordinates: bool = True,
+    ) -> None:
+        super().__init__(edge_type, size, 1, rfc, strict_size)
+        self._spoke_parameters = dict(spoke_parameters or {"B": 0})
+        self._center_requires_coordinates = center_requires_coordinates
+
+    def _matches(self, graph: Hypergraph) -> Iterator[tuple[Edge, tuple[str, ...], list[str]]]:
+        candidates = self._candidates(graph)
+        results = self._candidate_results(graph, candidates)
+        for edge, accepted in zip(candidates, results):
+            if not self._has_size(edge):
+                continue
+
+            # every side must be broken, midpoints come in cycle order
+            found = self._guarded(
+                graph,
+                edge,
+                lambda: broken_cycle(graph, edge.get_vertices(), edge.get_order()),
+                cycle_cost(self._size, edge.get_order(), broken=True),
+                accepted,
+            )
+            if found is None:
+                continue
+
+            cycle, midpoints = found
+            yield edge, cycle, midpoints
+
+    def _rewrite(self, graph: Hypergraph, match: tuple[Edge, tuple[str, ...], list[str]]) -> None:
+        self._break(graph, *match)
+
+    def _break(
+        self, graph: Hypergraph, edge: Edge, cycle: Sequence[str], midpoints: Sequence[str]
+    ) -> Hypergraph:
+        """Replace `edge` with Q elements, `midpoints[i]` splits `cycle[i]`-`cycle[i + 1]`.
+
+        The new elements and vertices are one refinement level finer than `edge`;
+        a midpoint keeps the level of the break which first reached it. The
+        break is recorded in the refinement tree of `graph`, see `MergeElement`.
+        """
+        level = graph.get_element_level(edge) + 1
+        graph.remove_edge(edge)
+
+        central_vertex = self._generate_central_vertex_name(graph)
+        self._set_central_vertex_position(graph, central_vertex, cycle)
+        graph.set_vertex_level(central_vertex, level)
+        for midpoint in midpoints:
+            if graph.get_vertex_level(midpoint) is None:
+                graph.set_vertex_level(midpoint, level)
+
+        for midpoint in midpoints:
+            if not graph.has_e_edge(central_vertex, midpoint):
+                graph.add_edge(Edge(
+                    edge_type=EdgeType.E,
+                    vertices=frozenset({central_vertex, midpoint}),
+                    parameters=dict(self._spoke_parameters),
+                ))
+
+        children = []
+        for i in range(len(cycle)):
+            # corner, next midpoint, center, previous midpoint keeps the cyclic order
+            order = (cycle[i], midpoints[i], central_vertex, midpoints[i - 1])
+            child = Edge(
+                edge_type=EdgeType.Q,
+                vertices=frozenset(order),
+                parameters={"R": 0},
+                order=order,
+                boundary=element_boundary(graph, order),
+            )
+            graph.add_edge(child)
+            graph.set_element_level(child, level)
+            children.append(child)
+
+        graph.record_refinement(Refinement(
+            parent=edge,
+            children=tuple(children),
+            center=central_vertex,
+            cycle=tuple(cycle),
+            midpoints=tuple(midpoints),
+        ))
+        return graph
+
+    def _generate_central_vertex_name(self, graph: Hypergraph) -> str:
+        """Generate a unique name for the central vertex."""
+        return graph.new_vertex_name("M")
+
+    def _set_central_vertex_position(
+        self, graph: Hypergraph, central_vertex: str, cycle: Sequence[str]
+    ) -> None:
+        """Set the position of the central vertex as the average of the corners."""
+        coordinates = graph.get_coordinates()
+        if all(vertex in coordinates for vertex in cycle):
+            avg_x, avg_y = coordinates.get_many(cycle).mean(axis=0).tolist()
+        elif self._center_requires_coordinates:
+            return
+        else:
+            params = [graph.get_vertex_parameters(v) or {} for v in cycle]
+            avg_x = sum(p.get("x", 0.0) for p in params) / len(cycle)
+            avg_y = sum(p.get("y", 0.0) for p in params) / len(cycle)
+        graph.set_vertex_parameter(central_vertex, {"x": avg_x, "y": avg_y})
+
+
+class MergeElement(ElementProduction):
+    """Merges the Q children of a broken element back into it (Prod13, Prod14, Prod15).
+
+    Candidates are the recorded refinements (see `Hypergraph.get_refinement`)
+    of elements of `edge_type` with `size` vertices whose children are all
+    unflagged leaves, read from the index the hypergraph keeps of them
+    (`Hypergraph.get_mergeable_refinements`). The RFC selects the parents
+    to restore, it is evaluated on the parent elements. The children, spokes and central
+    vertex are removed; a side midpoint still used by a finer neighbour is
+    kept with its halves as a hanging node next to the restored base edge,
+    other midpoints are removed with their halves. The restored element
+    gets R=0. Only the mergeable refinements are visited, not the whole
+    refinement tree or mesh.
+    """
+
+    def __init__(self, edge_type: EdgeType, size: int, rfc: Optional[RFC] = None) -> None:
+        super().__init__(edge_type, size, 0, rfc)
+
+    def _matches(self, graph: Hypergraph) -> Iterator[tuple[Refinement, list[Edge]]]:
+        refinements = [
+            refinement for refinement in graph.get_mergeable_refinements(self._edge_type)
+            if len(refinement.cycle) == self._size
+        ]
+        results = self._rfc_results(graph, [refinement.parent for refinement in refinements])
+        for refinement, accepted in zip(refinements, results):
+            children = self._leaf_children(graph, refinement)
+            if children is None:
+                continue
+            if accepted is None:
+                accepted = self._validate_edge(refinement.parent, graph)
+            if accepted:
+                yield refinement, children
+
+    def _leaf_children(self, graph: Hypergraph, refinement: Refinement) -> Optional[list[Edge]]:
+        """Children of `refinement` as stored in `graph`, None when one was broken or flagged."""
+        children = []
+        for child in refinement.children:
+            current = graph.find_element(child.get_type(), child.get_vertices())
+            if current is None or current.get_parameters().get("R", 0) != 0:
+                return None
+            children.append(current)
+        return children
+
+    def _rewrite(self, graph: Hypergraph, match: tuple[Refinement, list[Edge]]) -> None:
+        self.merge(graph, *match)
+
+    def merge(self, graph: Hypergraph, refinement: Refinement, children: Sequence[Edge]) -> Edge:
+        """Replace `children` with the parent of `refinement`, returns the restored element."""
+        center, cycle, midpoints = refinement.center, refinement.cycle, refinement.midpoints
+        for child in children:
+            graph.remove_edge(child)
+        for midpoint in midpoints:
+            for spoke in graph.find_e_edges(center, midpoint):
+                graph.remove_edge(spoke)
+        if not graph.get_incident_edges(center):
+            graph.remove_vertex(center)
+
+        for i, midpoint in enumerate(midpoints):
+            self._restore_side(graph, cycle[i], cycle[(i + 1) % len(cycle)], midpoint)
+
+        parent = refinement.parent
+        restored = Edge(
+            edge_type=parent.get_type(),
+            vertices=parent.get_vertices(),
+            parameters={**parent.get_parameters(), "R": 0},
+            order=parent.get_order(),
+            boundary=element_boundary(graph, cycle) if parent.get_boundary() is not None else None,
+        )
+        graph.add_edge(restored)
+        graph.forget_refinement(refinement)
+        return restored
+
+    def _restore_side(self, graph: Hypergraph, v1: str, v2: str, midpoint: str) -> None:
+        """Put the base edge `v1`-`v2` back, removing `midpoint` unless a
+        finer neighbour uses it."""
+        halves = graph.find_e_edges(v1, midpoint) + graph.find_e_edges(midpoint, v2)
+        parameters = {**halves[0].get_parameters(), "R": 0} if halves else {"R": 0, "B": 0}
+        in_use = (
+            any(edge.get_type() != EdgeType.E for edge in graph.get_incident_edges(midpoint))
+            or graph.get_midpoint(v1, midpoint) is not None
+            or graph.get_midpoint(midpoint, v2) is not None
+        )
+        if not in_use:
+            for half in halves:
+                graph.remove_edge(half)
+            graph.unregister_midpoint(v1, v2)
+            if not graph.get_incident_edges(midpoint):
+                graph.remove_vertex(midpoint)
+        if not graph.has_e_edge(v1, v2):
+            graph.add_edge(Edge(EdgeType.E, frozenset((v1, v2)), parameters))
+
+
+__all__ = ["ElementProduction", "FlagElement", "MarkElement", "BreakElement", "MergeElement"]
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from hypergrammar.edge import EdgeType
+from hypergrammar.productions.ngon import MergeElement
+from hypergrammar.rfc import RFC
+
+
+class Prod13(MergeElement):
+    """Production P13, the inverse of P5: merges the 4 quadrilaterals of a
+    broken Q element accepted by the RFC back into it."""
+
+    def __init__(self, rfc: Optional[RFC] = None):
+        super().__init__(EdgeType.Q, 4, rfc)
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from hypergrammar.edge import EdgeType
+from hypergrammar.productions.ngon import MergeElement
+from hypergrammar.rfc import RFC
+
+
+class Prod14(MergeElement):
+    """Production P14, the inverse of P8: merges the 5 quadrilaterals of a
+    broken pentagonal P element accepted by the RFC back into it."""
+
+    def __init__(self, rfc: Optional[RFC] = None):
+        super().__init__(EdgeType.P, 5, rfc)
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from hypergrammar.edge import EdgeType
+from hypergrammar.productions.ngon import MergeElement
+from hypergrammar.rfc import RFC
+
+
+class Prod15(MergeElement):
+    """Production P15, the inverse of P11: merges the 6 quadrilaterals of a
+    broken hexagonal S element accepted by the RFC back into it."""
+
+    def __init__(self, rfc: Optional[RFC] = None):
+        super().__init__(EdgeType.S, 6, rfc)
@@ -22,12 +22,10 @@ class Prod2(IProd):
 
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
 
-        edges_e = [e for e in graph.get_edges() if e.get_type() == EdgeType.E]
-
         # potential e1s - first edge, to be removed, have to have R=1 and B=0
         e1s = [
             e
-            for e in edges_e
+            for e in graph.get_edges_of_type(EdgeType.E)
             if e.get_parameters().get("R") == 1 and e.get_parameters().get("B") == 0
         ]
         for e1 in e1s:
@@ -40,14 +38,9 @@ class Prod2(IProd):
                 v2 = pair[1]
 
                 # potential e2s - edge connected to v1, not connected to v2 and connected to some verticle v3
-                e2s = [
-                    e
-                    for e in edges_e
-                    if v1 in e.get_vertices()
-                    and v2 not in e.get_vertices()
-                    and len(e.get_vertices()) > 1
-                ]
-                for e2 in e2s:
+                for e2 in graph.get_incident_edges(v1, EdgeType.E):
+                    if v2 in e2.get_vertices() or len(e2.get_vertices()) <= 1:
+                        continue
 
                     # potential v3s linked with e2, other than v1 and matching v1 and v2's averages
                     v3s = [v for v in e2.get_vertices() if v != v1]
@@ -57,42 +50,38 @@ class Prod2(IProd):
 
                     for v3 in v3s:
 
-                        # potential e3s - edge closing the cycle (having v2 and v3, but not v1)
-                        e3s = [
-                            e
-                            for e in edges_e
-                            if v1 not in e.get_vertices()
-                            and v2 in e.get_vertices()
-                            and v3 in e.get_vertices()
-                        ]
+                        # e1 is a half of a split side ending in v3, not a base edge
+                        if self._is_half_of(graph, v1, v2, v3):
+                            continue
 
-                        if len(e3s) > 0:
+                        # e3 - edge closing the cycle (having v2 and v3, but not v1)
+                        e3 = self._find_closing_edge(graph, v1, v2, v3)
 
-                            # e3 found - not sure if can be more than one, just taking first possible
-                            e3 = e3s[0]
+                        if e3 is not None:
 
                             # remove e1
                             graph.remove_edge(e1)
 
                             # move v3 to align with v1 and v2
-                            v1_params = graph.get_vertex_parameters(vertex=v1)
-                            v2_params = graph.get_vertex_parameters(vertex=v2)
+                            # v1_params = graph.get_vertex_parameters(vertex=v1)
+                            # v2_params = graph.get_vertex_parameters(vertex=v2)
                             # v3_x = (v1_params["x"] + v2_params["x"]) / 2
                             # v3_y = (v1_params["y"] + v2_params["y"]) / 2
                             # graph.set_vertex_parameter(
                             #     v3, {"x": v3_x, "y": v3_y}
                             # )
 
-                            # set e2 and e3 B=0 and R=0
+                            # set e2 and e3 B=0 and R=0, a half already marked
+                            # by the finer element on its other side stays marked
                             new_e2 = Edge(
                                 edge_type=EdgeType.E,
                                 vertices=e2.get_vertices(),
-                                parameters={"R": 0, "B": 0},
+                                parameters={"R": self._half_mark(e2), "B": 0},
                             )
                             new_e3 = Edge(
                                 edge_type=EdgeType.E,
                                 vertices=e3.get_vertices(),
-                                parameters={"R": 0, "B": 0},
+                                parameters={"R": self._half_mark(e3), "B": 0},
                             )
                             graph.remove_edge(e2)
                             graph.remove_edge(e3)
@@ -100,3 +89,22 @@ class Prod2(IProd):
                             graph.add_edge(new_e3)
                             return graph
         return None
+
+    def _half_mark(self, half: Edge) -> int:
+        return 1 if half.get_parameters().get("R") == 1 else 0
+
+    def _is_half_of(self, graph: Hypergraph, v1: str, v2: str, v3: str) -> bool:
+        return (
+            graph.get_midpoint_parent(v1) == frozenset((v2, v3))
+            or graph.get_midpoint_parent(v2) == frozenset((v1, v3))
+        )
+
+    def _find_closing_edge(self, graph: Hypergraph, v1: str, v2: str, v3: str) -> Edge | None:
+        # binary edges are a single pair lookup, wider E edges are found among those of v2
+        e3 = graph.find_e_edge(v2, v3)
+        if e3 is not None:
+            return e3
+        for e in graph.get_incident_edges(v2, EdgeType.E):
+            if v3 in e.get_vertices() and v1 not in e.get_vertices():
+                return e
+        return None
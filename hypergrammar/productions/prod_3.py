@@ -1,4 +1,3 @@
-import uuid
 from hypergrammar.productions.i_prod import IProd
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
@@ -14,15 +13,27 @@ class Prod3(IProd):
 
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
         # Look for nonboundary (B=0) edge E with R=1
-        target_edge = None
-        for edge in graph.get_edges():
-            if edge.get_type() == EdgeType.E and edge.get_parameters().get("R") == 1 and edge.get_parameters().get("B") == 0:
-                target_edge = edge
-                break
-
-        if target_edge is None:
+        target_edges = self._find_flagged_edges(graph)
+        if not target_edges:
             return None
 
+        return self._split(graph, target_edges[0])
+
+    def apply_all(self, graph: Hypergraph) -> Hypergraph | None:
+        """Split every nonboundary edge flagged for refinement in one sweep."""
+        applied = False
+        for target_edge in self._find_flagged_edges(graph):
+            if self._split(graph, target_edge) is not None:
+                applied = True
+        return graph if applied else None
+
+    def _find_flagged_edges(self, graph: Hypergraph) -> list[Edge]:
+        return [
+            edge for edge in graph.get_edges_of_type(EdgeType.E)
+            if edge.get_parameters().get("R") == 1 and edge.get_parameters().get("B") == 0
+        ]
+
+    def _split(self, graph: Hypergraph, target_edge: Edge) -> Hypergraph | None:
         vertices = list(target_edge.get_vertices())
         if len(vertices) != 2:
             return None
@@ -39,13 +50,17 @@ class Prod3(IProd):
         x1, y1 = param_a.get("x", 0), param_a.get("y", 0)
         x2, y2 = param_b.get("x", 0), param_b.get("y", 0)
 
-        # Create new vertex between initial ones
-        new_c_id = f"v_{uuid.uuid4().hex[:6]}"
-        new_c_params = {
-            "x": (x1 + x2) / 2.0,
-            "y": (y1 + y2) / 2.0
-        }
-        graph.set_vertex_parameter(new_c_id, new_c_params)
+        # Reuse the midpoint when this side was already split from a neighbour
+        new_c_id = graph.get_midpoint(v_a_id, v_b_id)
+        if new_c_id is None:
+            # Create new vertex between initial ones
+            new_c_id = graph.new_vertex_name()
+            new_c_params = {
+                "x": (x1 + x2) / 2.0,
+                "y": (y1 + y2) / 2.0
+            }
+            graph.set_vertex_parameter(new_c_id, new_c_params)
+            graph.register_midpoint(v_a_id, v_b_id, new_c_id)
 
         # Prepare params for new edges, copy 'B' value, set R=0
         old_params = target_edge.get_parameters().copy()
@@ -59,8 +74,10 @@ class Prod3(IProd):
 
         # Remove old edge from graph and add 3 edges from previous step
         graph.remove_edge(target_edge)
-        graph.add_edge(edge_ac)
-        graph.add_edge(edge_cb)
+        if not graph.has_e_edge(v_a_id, new_c_id):
+            graph.add_edge(edge_ac)
+        if not graph.has_e_edge(new_c_id, v_b_id):
+            graph.add_edge(edge_cb)
         graph.add_edge(edge_ab)
 
         return graph
\ No newline at end of file
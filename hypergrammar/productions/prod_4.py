@@ -1,12 +1,9 @@
-import itertools
 from typing import Optional
 
 from hypergrammar.productions.i_prod import IProd
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
-from hypergrammar.utils import canonical_rotation, generate_vertex_name
 from hypergrammar.rfc import RFC
-from copy import deepcopy
 
 
 class Prod4(IProd):
@@ -16,68 +13,74 @@ class Prod4(IProd):
         super().__init__()
 
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
-        hg_edges = graph.get_edges()
-        # Find evry Q edge with R=0
-        e_edges = []
-        for edge in hg_edges:
-            if edge.get_type() == EdgeType.E and "R" in edge.parameters and edge.parameters["R"] == 1 and "B" in edge.parameters and edge.parameters["B"] == 1:
-                e_edges.append(edge)
+        # Find every boundary E edge with R=1
+        e_edges = self._find_flagged_edges(graph)
+        for e_edge, accepted in zip(e_edges, self._rfc_results(graph, e_edges)):
+            # valid edge found -> check refinement criterion (rfc)
+            if not (self._validate_edge(e_edge, graph) if accepted is None else accepted):
+                continue
 
-        if not e_edges:
-            return None
+            self._split(graph, [e_edge])
+            return graph
 
-        for e_edge in e_edges:
+        return None
 
-            e_edge_vertices = e_edge.get_vertices()
-            if len(e_edge_vertices) != 2:
-                raise ValueError(
-                    f"E edge must connect exactly 2 vertices, but got {len(e_edge_vertices)}"
-                )
+    def apply_all(self, graph: Hypergraph) -> Hypergraph | None:
+        """Split every flagged boundary edge accepted by the rfc in one batch.
+
+        Midpoints of sides that were not split before are computed with a single
+        vectorized operation on the coordinate store of the graph.
+        """
+        e_edges = self._find_flagged_edges(graph)
+        mask = self._rfc_mask(graph, e_edges)
+        if mask is None:
+            e_edges = [e_edge for e_edge in e_edges if self._validate_edge(e_edge, graph)]
+        else:
+            e_edges = [e_edge for e_edge, accepted in zip(e_edges, mask) if accepted]
+        if not e_edges:
+            return None
 
-            # valid edge found -> check refinement criterion (rfc)
-            if not self._validate_edge(e_edge, graph):
-                continue
-            
-            new_v = self.get_new_vert(graph)
-            vvv = []
-            for i in e_edge_vertices:
-                vvv.append(i)
-            for v in e_edge_vertices:
-                v1 = graph.get_vertex_parameters(vvv[0])
-                v2 = graph.get_vertex_parameters(vvv[1])
-            
-            
-            graph.set_vertex_parameter(new_v, {"x": (v1["x"] + v2["x"])/2 , "y":  (v1["y"] + v2["y"])/2})
-            new_edges = [ ]
-            
-            for v in e_edge_vertices:
-                new_e_edge = Edge(
-                    edge_type=EdgeType.E,
-                    vertices=frozenset({v, new_v}),
-                    parameters=deepcopy(e_edge.get_parameters()),
-                )
-                new_e_edge.get_parameters()["R"] = 0
-                new_edges.append(new_e_edge)
-            
-            
-
-            new_graph = graph
-
-            new_graph.remove_edge(e_edge)
-            
-            for e in new_edges:
-                new_graph.add_edge(e)
-                
-
-            return new_graph
+        self._split(graph, e_edges)
+        return graph
 
-        return None
+    def _find_flagged_edges(self, graph: Hypergraph) -> list[Edge]:
+        e_edges = []
+        for edge in graph.get_edges_of_type(EdgeType.E):
+            params = edge.get_parameters()
+            if params.get("R") == 1 and params.get("B") == 1:
+                count = len(edge.get_vertices())
+                if count != 2:
+                    raise ValueError(f"E edge must connect exactly 2 vertices, but got {count}")
+                e_edges.append(edge)
+        return e_edges
+
+    def _split(self, graph: Hypergraph, e_edges: list[Edge]) -> None:
+        sides = [tuple(e_edge.get_vertices()) for e_edge in e_edges]
+
+        # Reuse the midpoint when a side was already split
+        found = [graph.get_midpoint(v1, v2) for v1, v2 in sides]
+        missing = [i for i, midpoint in enumerate(found) if midpoint is None]
+        names = [self.get_new_vert(graph) for _ in missing]
+        if missing:
+            xy = graph.get_coordinates().midpoints(
+                [sides[i][0] for i in missing], [sides[i][1] for i in missing]
+            )
+            graph.set_vertex_positions(names, xy)
+            for i, name in zip(missing, names):
+                graph.register_midpoint(sides[i][0], sides[i][1], name)
+        new_names = iter(names)
+        midpoints = [midpoint if midpoint is not None else next(new_names) for midpoint in found]
+
+        for e_edge, side, new_v in zip(e_edges, sides, midpoints):
+            graph.remove_edge(e_edge)
+            for v in side:
+                if not graph.has_e_edge(v, new_v):
+                    # every half gets its own parameters, they are mutable
+                    params = {**e_edge.get_parameters(), "R": 0}
+                    graph.add_edge(Edge(EdgeType.E, frozenset((v, new_v)), params))
 
     def _validate_edge(self, e_edge: Edge, graph: Hypergraph) -> bool:
-        if self._rfc is not None:
-            return self._rfc.is_valid(e_edge, graph)
-
-        res = graph.edge_rfc_is_valid(e_edge)
+        res = graph.edge_rfc_is_valid(e_edge, rfc=self._rfc)
 
         # no rfc was found
         if res is None:
@@ -85,21 +88,5 @@ class Prod4(IProd):
 
         return res
 
-    def _e_edges_match(self, graph: Hypergraph, edges_vertices: frozenset[str]) -> bool:
-        for edge in graph.get_edges():
-            if edge.get_type() == EdgeType.E and edge.get_vertices() == edges_vertices:
-                return True
-        return False
-
-    def _check_cycle(self, graph: Hypergraph, cycle: tuple[str, ...]) -> bool:
-
-        for i in range(len(cycle)):
-            v1 = list(cycle)[i]
-            v2 = list(cycle)[(i + 1) % len(cycle)]
-            edges_match = self._e_edges_match(graph, frozenset([v1, v2]))
-            if not edges_match:
-                return False
-        return True
-
-    def get_new_vert(self, graph: Hypergraph):
-        return generate_vertex_name()
\ No newline at end of file
+    def get_new_vert(self, graph: Hypergraph) -> str:
+        return graph.new_vertex_name()
\ No newline at end of file
@@ -0,0 +1,115 @@
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.productions.ngon import BreakElement, FlagElement, MarkElement, MergeElement
+
+
+def create_polygon(size, edge_type=EdgeType.T, r=0, broken=False):
+    """Regular polygon element, with every side split by a registered midpoint when `broken`."""
+    hg = Hypergraph()
+    corners = [f"v{i}" for i in range(size)]
+    for i, v in enumerate(corners):
+        hg.set_vertex_parameter(v, {"x": float(i), "y": float(i * i)})
+        nxt = corners[(i + 1) % size]
+        if broken:
+            midpoint = f"h{i}"
+            hg.add_edge(Edge(EdgeType.E, frozenset({v, midpoint}), {"R": 0, "B": 1}))
+            hg.add_edge(Edge(EdgeType.E, frozenset({midpoint, nxt}), {"R": 0, "B": 1}))
+            hg.register_midpoint(v, nxt, midpoint)
+        else:
+            hg.add_edge(Edge(EdgeType.E, frozenset({v, nxt}), {"R": 0, "B": 1}))
+    hg.add_edge(Edge(edge_type, frozenset(corners), {"R": r}))
+    return hg
+
+
+class TestElementProductions:
+    """Test suite for the n-gon production family."""
+
+    def test_flag_any_size(self):
+        hg = create_polygon(7)
+
+        result = FlagElement(EdgeType.T, 7).apply(hg)
+
+        assert result is not None
+        [element] = result.get_edges_of_type(EdgeType.T)
+        assert element.get_parameters() == {"R": 1}
+
+    def test_flag_wrong_size(self):
+        hg = create_polygon(7)
+
+        with pytest.raises(ValueError):
+            FlagElement(EdgeType.T, 8).apply(hg)
+        assert FlagElement(EdgeType.T, 8, strict_size=False).apply(hg) is None
+
+    def test_flag_respects_rfc(self):
+        class RejectAll:
+            def is_valid(self, edge, graph, meta=None):
+                return False
+
+        hg = create_polygon(7)
+
+        assert FlagElement(EdgeType.T, 7, RejectAll()).apply(hg) is None
+
+    def test_mark_any_size(self):
+        hg = create_polygon(7, r=1)
+
+        result = MarkElement(EdgeType.T, 7).apply(hg)
+
+        assert result is not None
+        assert all(e.get_parameters()["R"] == 1 for e in result.get_edges_of_type(EdgeType.E))
+        assert MarkElement(EdgeType.T, 7).apply(result) is None
+
+    def test_break_any_size(self):
+        hg = create_polygon(7, r=1, broken=True)
+
+        result = BreakElement(EdgeType.T, 7).apply(hg)
+
+        assert result is not None
+        assert result.get_edges_of_type(EdgeType.T) == []
+        q_edges = result.get_edges_of_type(EdgeType.Q)
+        assert len(q_edges) == 7
+        assert all(q.get_boundary() is not None for q in q_edges)
+        [center] = result.get_vertices() - {f"v{i}" for i in range(7)} - {f"h{i}" for i in range(7)}
+        assert result.get_vertex_parameters(center) == {"x": 3.0, "y": 13.0}
+        assert len(result.get_neighbours(center)) == 7
+
+    def test_break_stamps_levels(self):
+        hg = create_polygon(7, r=1, broken=True)
+        [element] = hg.get_edges_of_type(EdgeType.T)
+        hg.set_element_level(element, 2)
+
+        result = BreakElement(EdgeType.T, 7).apply(hg)
+
+        q_edges = result.get_edges_of_type(EdgeType.Q)
+        assert set(result.get_elements_at_least(3)) == set(q_edges)
+        assert all(result.get_element_level(q) == 3 for q in q_edges)
+        assert all(result.get_vertex_level(f"h{i}") == 3 for i in range(7))
+        assert result.get_vertex_level("v0") is None
+
+    def test_merge_any_size(self):
+        hg = create_polygon(7, r=1, broken=True)
+        BreakElement(EdgeType.T, 7).apply(hg)
+
+        result = MergeElement(EdgeType.T, 7).apply(hg)
+
+        assert result is not None
+        [element] = result.get_edges_of_type(EdgeType.T)
+        assert element.get_parameters() == {"R": 0}
+        assert result.get_edges_of_type(EdgeType.Q) == []
+        assert result.get_vertices() == {f"v{i}" for i in range(7)}
+        assert all(result.has_e_edge(f"v{i}", f"v{(i + 1) % 7}") for i in range(7))
+        assert all(e.get_parameters() == {"R": 0, "B": 1} for e in result.get_edges_of_type(EdgeType.E))
+
+    def test_mark_revisits_element_when_side_changes(self):
+        hg = create_polygon(7, r=1)
+        production = MarkElement(EdgeType.T, 7)
+        production.apply(hg)
+        assert production.apply(hg) is None
+
+        side = hg.find_e_edge("v0", "v1")
+        hg.update_edge_parameters(side, {"R": 0})
+
+        assert production.apply(hg) is not None
+        assert hg.find_e_edge("v0", "v1").get_parameters()["R"] == 1
+        assert not hg._listeners
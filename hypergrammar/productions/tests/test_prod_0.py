@@ -1,6 +1,7 @@
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
 from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.cycles import e_cycle
 
 
 class TestProd0:
@@ -109,24 +110,21 @@ class TestProd0:
         # Assert
         assert result is None
 
-    def test_e_edges_match_private_method(self):
-        """Test the _e_edges_match helper method."""
+    def test_has_e_edge(self):
+        """Test the E edge lookup the production matches sides with."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"})))
 
-        prod0 = Prod0()
-
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod0._e_edges_match(hg, frozenset({"A", "B"})) is True
-        assert prod0._e_edges_match(hg, frozenset({"C", "D"})) is True
-        assert prod0._e_edges_match(hg, frozenset({"A", "C"})) is False
-        assert prod0._e_edges_match(hg, frozenset({"X", "Y"})) is False
+        assert hg.has_e_edge("A", "B") is True
+        assert hg.has_e_edge("C", "D") is True
+        assert hg.has_e_edge("A", "C") is False
+        assert hg.has_e_edge("X", "Y") is False
 
-    def test_check_cycle_valid_square(self):
-        """Test _check_cycle with a valid square cycle."""
+    def test_e_cycle_valid_square(self):
+        """Test e_cycle with a valid square cycle."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
@@ -134,15 +132,13 @@ class TestProd0:
         hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"})))
 
-        prod0 = Prod0()
         cycle = ["A", "B", "C", "D"]
 
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod0._check_cycle(hg, cycle) is True
+        assert e_cycle(hg, cycle, tuple(cycle)) is not None
 
-    def test_check_cycle_invalid_square(self):
-        """Test _check_cycle with an invalid square cycle."""
+    def test_e_cycle_invalid_square(self):
+        """Test e_cycle with an invalid square cycle."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
@@ -150,12 +146,10 @@ class TestProd0:
         # Missing edge between C and D
         hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"})))
 
-        prod0 = Prod0()
         cycle = ["A", "B", "C", "D"]
 
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod0._check_cycle(hg, cycle) is False
+        assert e_cycle(hg, cycle, tuple(cycle)) is None
 
     def test_rfc_mechanism_rejects_refinement_when_false(self):
         """Test that an RFC returning False prevents the production from applying."""
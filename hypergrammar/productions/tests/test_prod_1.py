@@ -1,6 +1,7 @@
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
 from hypergrammar.productions.prod_1 import Prod1
+from hypergrammar.cycles import cycle_edges, e_cycle
 
 class TestProd1:
     """Test suite for Production 1."""
@@ -59,34 +60,31 @@ class TestProd1:
         result = prod1.apply(hg)
         assert result is None
     
-    def test_check_cycle_valid_square(self):
+    def test_e_cycle_valid_square(self):
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"})))
-        prod1 = Prod1()
         cycle = ["A", "B", "C", "D"]
-        assert prod1._check_cycle(hg, cycle) is True
+        assert e_cycle(hg, cycle, tuple(cycle)) is not None
     
-    def test_check_cycle_invalid_square(self):
+    def test_e_cycle_invalid_square(self):
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"})))
         # Missing edge between C and D
         hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"})))
-        prod1 = Prod1()
         cycle = ["A", "B", "C", "D"]
-        assert prod1._check_cycle(hg, cycle) is False
+        assert e_cycle(hg, cycle, tuple(cycle)) is None
     
-    def test_get_edges_returns_correct_edges(self):
+    def test_cycle_edges_returns_correct_edges(self):
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"})))
-        prod1 = Prod1()
         cycle = ["A", "B", "C", "D"]
-        edges = prod1._get_edges(hg, cycle)
+        edges = cycle_edges(hg, cycle)
         assert all(e is not None for e in edges)
         assert len(edges) == 4
\ No newline at end of file
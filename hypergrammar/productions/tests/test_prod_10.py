@@ -126,3 +126,18 @@ class TestProd10():
 
         # Assert
         assert result is None, "Should check that Q has exactly 6 vertices"
+
+    def test_apply_in_place_with_neighbouring_edges(self):
+        """Test that P10 marks only the hexagon cycle when its vertices have other neighbours."""
+        hg = self._create_hexagon(q_r=1, e_r=0)
+        outside = Edge(EdgeType.E, frozenset({"v0", "x"}), {"R": 0})
+        chord = Edge(EdgeType.E, frozenset({"v0", "v3"}), {"R": 0})
+        hg.add_edge(outside)
+        hg.add_edge(chord)
+
+        result = Prod10().apply(hg)
+
+        assert result is hg
+        assert hg.has_edge(outside)
+        assert hg.has_edge(chord)
+        assert hg.find_e_edge("v0", "v1").get_parameters() == {"R": 1}
@@ -2,6 +2,7 @@ from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
 from hypergrammar.productions.prod_11 import Prod11
 import pytest
+from hypergrammar.cycles import broken_cycle
 
 
 class TestProd11:
@@ -177,8 +178,8 @@ class TestProd11:
         with pytest.raises(ValueError):
             prod11.apply(hg)
 
-    def test_check_all_edges_broken_valid(self):
-        """Test _check_all_edges_broken with all edges properly broken."""
+    def test_broken_cycle_valid(self):
+        """Test broken_cycle with all edges properly broken."""
         # Arrange
         hg = Hypergraph()
         vertices = ["A", "B", "C", "D", "E", "F"]
@@ -198,14 +199,11 @@ class TestProd11:
         hg.add_edge(Edge(EdgeType.E, frozenset({"F", "G6"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"G6", "A"})))
         
-        prod11 = Prod11()
-        
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod11._check_all_edges_broken(hg, tuple(vertices)) is True
+        assert broken_cycle(hg, vertices, tuple(vertices)) is not None
 
-    def test_check_all_edges_broken_invalid(self):
-        """Test _check_all_edges_broken with some edges not broken."""
+    def test_broken_cycle_invalid(self):
+        """Test broken_cycle with some edges not broken."""
         # Arrange
         hg = Hypergraph()
         vertices = ["A", "B", "C", "D", "E", "F"]
@@ -218,38 +216,31 @@ class TestProd11:
         hg.add_edge(Edge(EdgeType.E, frozenset({"E", "F"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"F", "A"})))
         
-        prod11 = Prod11()
-        
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod11._check_all_edges_broken(hg, tuple(vertices)) is False
+        assert broken_cycle(hg, vertices, tuple(vertices)) is None
 
-    def test_is_edge_broken_true(self):
-        """Test _is_edge_broken when edge is broken."""
+    def test_find_midpoint_when_edge_broken(self):
+        """Test find_midpoint when edge is broken."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "G"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"G", "B"})))
         
-        prod11 = Prod11()
         s_vertices = {"A", "B", "C", "D", "E", "F"}
         
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod11._is_edge_broken(hg, "A", "B", s_vertices) is True
+        assert hg.find_midpoint("A", "B", exclude=s_vertices) is not None
 
-    def test_is_edge_broken_false(self):
-        """Test _is_edge_broken when edge is not broken."""
+    def test_find_midpoint_when_edge_not_broken(self):
+        """Test find_midpoint when edge is not broken."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
         
-        prod11 = Prod11()
         s_vertices = {"A", "B", "C", "D", "E", "F"}
         
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod11._is_edge_broken(hg, "A", "B", s_vertices) is False
+        assert hg.find_midpoint("A", "B", exclude=s_vertices) is None
 
     def test_rfc_mechanism_rejects_refinement_when_false(self):
         """Test that an RFC returning False prevents the production from applying."""
@@ -331,8 +322,8 @@ class TestProd11:
         ]
         assert len(q_edges_r0) == 6
 
-    def test_break_hexagon_creates_central_vertex_and_edges(self):
-        """Test _break_hexagon creates central vertex, E edges with B=0, and Q edges."""
+    def test_apply_creates_central_vertex_and_edges(self):
+        """Test apply creates central vertex, E edges with B=0, and Q edges."""
         # Arrange
         hg = Hypergraph()
         vertices = ["A", "B", "C", "D", "E", "F"]
@@ -358,8 +349,7 @@ class TestProd11:
         prod11 = Prod11()
         
         # Act
-        # pylint: disable=protected-access
-        result = prod11._break_hexagon(hg, s_edge, tuple(vertices))
+        result = prod11.apply(hg)
         
         # Assert
         edges = result.get_edges()
@@ -398,8 +388,8 @@ class TestProd11:
             assert len(q_edge.get_vertices()) == 4
             assert central_vertex in q_edge.get_vertices()
 
-    def test_break_hexagon_returns_original_graph_if_intermediate_missing(self):
-        """Test _break_hexagon returns original graph if an intermediate vertex is missing."""
+    def test_apply_leaves_graph_unchanged_if_intermediate_missing(self):
+        """Test apply does not break the hexagon if an intermediate vertex is missing."""
         # Arrange
         hg = Hypergraph()
         vertices = ["A", "B", "C", "D", "E", "F"]
@@ -418,62 +408,58 @@ class TestProd11:
         
         prod11 = Prod11()
         
+        edges_before = hg.get_edges()
+
         # Act
-        # pylint: disable=protected-access
-        result = prod11._break_hexagon(hg, s_edge, tuple(vertices))
+        result = prod11.apply(hg)
         
-        # Assert - should return original graph unchanged
-        assert result == hg
+        # Assert - nothing is applied and the graph is unchanged
+        assert result is None
+        assert hg.get_edges() == edges_before
         # S edge should still exist
-        s_edges = [e for e in result.get_edges() if e.get_type() == EdgeType.S]
+        s_edges = [e for e in hg.get_edges() if e.get_type() == EdgeType.S]
         assert len(s_edges) == 1
 
-    def test_find_intermediate_vertex_found(self):
-        """Test _find_intermediate_vertex finds the correct intermediate vertex."""
+    def test_find_midpoint_found(self):
+        """Test find_midpoint finds the correct intermediate vertex."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "G"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"G", "B"})))
         
-        prod11 = Prod11()
         s_vertices = {"A", "B", "C", "D", "E", "F"}
         
         # Act
-        # pylint: disable=protected-access
-        result = prod11._find_intermediate_vertex(hg, "A", "B", s_vertices)
+        result = hg.find_midpoint("A", "B", exclude=s_vertices)
         
         # Assert
         assert result == "G"
 
-    def test_find_intermediate_vertex_not_found(self):
-        """Test _find_intermediate_vertex returns None when no intermediate exists."""
+    def test_find_midpoint_not_found(self):
+        """Test find_midpoint returns None when no intermediate exists."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))  # Direct edge
         
-        prod11 = Prod11()
         s_vertices = {"A", "B", "C", "D", "E", "F"}
         
         # Act
-        # pylint: disable=protected-access
-        result = prod11._find_intermediate_vertex(hg, "A", "B", s_vertices)
+        result = hg.find_midpoint("A", "B", exclude=s_vertices)
         
         # Assert
         assert result is None
 
-    def test_find_intermediate_vertex_ignores_s_vertices(self):
-        """Test _find_intermediate_vertex ignores vertices that are part of S."""
+    def test_find_midpoint_ignores_s_vertices(self):
+        """Test find_midpoint ignores vertices that are part of S."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "C"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"C", "B"})))
         
-        prod11 = Prod11()
         s_vertices = {"A", "B", "C", "D", "E", "F"}  # C is part of S
         
         # Act
-        # pylint: disable=protected-access
-        result = prod11._find_intermediate_vertex(hg, "A", "B", s_vertices)
+        result = hg.find_midpoint("A", "B", exclude=s_vertices)
         
         # Assert
         assert result is None  # C should be ignored because it's in s_vertices
@@ -531,3 +517,27 @@ class TestProd11:
         # Should not set position because not all vertices have coordinates
         assert "x" not in central_params
         assert "y" not in central_params
+
+    def test_apply_uses_registered_midpoints(self):
+        """Test that the registered midpoint of a side is used over other common neighbours."""
+        # Arrange
+        hg = Hypergraph()
+        vertices = ["A", "B", "C", "D", "E", "F"]
+        for i, vertex in enumerate(vertices):
+            nxt = vertices[(i + 1) % 6]
+            hg.add_edge(Edge(EdgeType.E, frozenset({vertex, f"G{i}"})))
+            hg.add_edge(Edge(EdgeType.E, frozenset({f"G{i}", nxt})))
+            hg.register_midpoint(vertex, nxt, f"G{i}")
+        # Vertex of a neighbouring element connected to both A and B
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "X"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"X", "B"})))
+        hg.add_edge(Edge(EdgeType.S, frozenset(vertices), {"R": 1}))
+
+        # Act
+        result = Prod11().apply(hg)
+
+        # Assert
+        assert result is not None
+        q_edges = result.get_edges_of_type(EdgeType.Q)
+        assert len(q_edges) == 6
+        assert all("X" not in e.get_vertices() for e in q_edges)
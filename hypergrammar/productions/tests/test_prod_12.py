@@ -1,4 +1,5 @@
 import pytest
+from hypergrammar.cycles import e_cycle
 
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
@@ -128,24 +129,21 @@ class TestProd12:
         # Assert
         assert result is None
 
-    def test_e_edges_match_private_method(self):
-        """Test the _e_edges_match helper method."""
+    def test_has_e_edge(self):
+        """Test the E edge lookup the production matches sides with."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"})))
 
-        prod12 = Prod12()
-
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod12._e_edges_match(hg, frozenset({"A", "B"})) is True
-        assert prod12._e_edges_match(hg, frozenset({"C", "D"})) is True
-        assert prod12._e_edges_match(hg, frozenset({"A", "C"})) is False
-        assert prod12._e_edges_match(hg, frozenset({"X", "Y"})) is False
+        assert hg.has_e_edge("A", "B") is True
+        assert hg.has_e_edge("C", "D") is True
+        assert hg.has_e_edge("A", "C") is False
+        assert hg.has_e_edge("X", "Y") is False
 
-    def test_check_cycle_valid_septagon(self):
-        """Test _check_cycle with a valid septagon cycle."""
+    def test_e_cycle_valid_septagon(self):
+        """Test e_cycle with a valid septagon cycle."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
@@ -156,15 +154,13 @@ class TestProd12:
         hg.add_edge(Edge(EdgeType.E, frozenset({"F", "G"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"G", "A"})))
 
-        prod12 = Prod12()
         cycle = ["A", "B", "C", "D", "E", "F", "G"]
 
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod12._check_cycle(hg, cycle) is True
+        assert e_cycle(hg, cycle, tuple(cycle)) is not None
 
-    def test_check_cycle_invalid_septagon(self):
-        """Test _check_cycle with an invalid septagon cycle."""
+    def test_e_cycle_invalid_septagon(self):
+        """Test e_cycle with an invalid septagon cycle."""
         # Arrange
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
@@ -175,12 +171,10 @@ class TestProd12:
         # Missing edge between F and G
         hg.add_edge(Edge(EdgeType.E, frozenset({"G", "A"})))
 
-        prod12 = Prod12()
         cycle = ["A", "B", "C", "D", "E", "F", "G"]
 
         # Act & Assert
-        # pylint: disable=protected-access
-        assert prod12._check_cycle(hg, cycle) is False
+        assert e_cycle(hg, cycle, tuple(cycle)) is None
 
     def test_rfc_mechanism_rejects_refinement_when_false(self):
         """Test that an RFC returning False prevents the production from applying."""
@@ -357,4 +351,22 @@ class TestProd12:
         prod12 = Prod12()
 
         with pytest.raises(ValueError):
-            prod12.apply(hg)
\ No newline at end of file
+            prod12.apply(hg)
+
+    def test_apply_with_shuffled_cycle_and_outside_neighbours(self):
+        """Test that the cycle is found when vertex names are not in cycle order."""
+        # Arrange
+        hg = Hypergraph()
+        cycle = ["D", "A", "G", "B", "F", "C", "E"]
+        for i, vertex in enumerate(cycle):
+            hg.add_edge(Edge(EdgeType.E, frozenset({vertex, cycle[(i + 1) % 7]})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "X"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"X", "B"})))
+        hg.add_edge(Edge(EdgeType.T, frozenset(cycle), {"R": 0}))
+
+        # Act
+        result = Prod12().apply(hg)
+
+        # Assert
+        assert result is not None
+        assert result.get_edges_of_type(EdgeType.T)[0].get_parameters() == {"R": 1}
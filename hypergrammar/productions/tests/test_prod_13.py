@@ -0,0 +1,96 @@
+import numpy as np
+
+from hypergrammar.adaptive import refine_to_size, sweep
+from hypergrammar.cycles import e_cycle
+from hypergrammar.dual import DualGraph
+from hypergrammar.edge import EdgeType
+from hypergrammar.geometry import element_centroids
+from hypergrammar.productions.prod_13 import Prod13
+from hypergrammar.rfcs import ErrorIndicatorRFC
+from hypergrammar.tests.test_adaptive import create_mesh
+
+
+def snapshot(hg):
+    return hg.get_vertices(), {(e.get_type(), e.get_vertices(), frozenset(e.get_parameters().items())) for e in hg.get_edges()}
+
+
+def refine_corner(hg):
+    """Refine the mesh around its (0, 0) corner."""
+    refine_to_size(hg, lambda x, y: np.where(x + y <= 1.0, 0.2, 10.0), balanced=True)
+
+
+class TestProd13:
+    """Test suite for production 13 (merging broken Q elements)."""
+
+    def test_break_is_recorded(self):
+        hg = create_mesh(1)
+        refine_to_size(hg, 0.8)
+
+        [refinement] = hg.get_refinements()
+        assert refinement.parent.get_vertices() == frozenset({"v0_0", "v1_0", "v1_1", "v0_1"})
+        assert len(refinement.children) == 4
+        assert all(hg.get_parent_refinement(child) == refinement for child in refinement.children)
+        assert all(refinement.center in child.get_vertices() for child in refinement.children)
+
+    def test_merge_restores_mesh(self):
+        hg = create_mesh(3)
+        initial = snapshot(hg)
+        refine_corner(hg)
+        dual = hg.get_dual_graph()
+
+        while sweep(Prod13(), hg):
+            pass
+
+        assert snapshot(hg) == initial
+        assert hg.get_refinements() == []
+        assert len(dual) == 9
+        assert hg.get_vertex_parameters("v0_0") == {"x": 0.0, "y": 0.0}
+
+    def test_merge_only_accepted(self):
+        hg = create_mesh(3)
+        refine_corner(hg)
+        dual = hg.get_dual_graph()
+        rfc = ErrorIndicatorRFC(lambda x, y: x + y, 1.0)
+
+        while sweep(Prod13(rfc), hg):
+            pass
+
+        parents = [refinement.parent for refinement in hg.get_refinements()]
+        assert parents
+        assert np.all(element_centroids(hg, parents).sum(axis=1) <= 1.0)
+        for element in hg.get_edges_of_type(EdgeType.Q):
+            assert e_cycle(hg, element.get_vertices(), element.get_order()) is not None
+        rebuilt = DualGraph(hg)
+        for element in hg.get_edges_of_type(EdgeType.Q):
+            assert set(dual.neighbours(element)) == set(rebuilt.neighbours(element))
+
+    def test_flagged_children_are_not_merged(self):
+        hg = create_mesh(1)
+        refine_to_size(hg, 0.8)
+        [refinement] = hg.get_refinements()
+        hg.update_edge_parameters(hg.find_element(EdgeType.Q, refinement.children[0].get_vertices()), {"R": 1})
+
+        assert Prod13().apply(hg) is None
+
+    def test_mergeable_index_follows_children(self):
+        hg = create_mesh(1)
+        refine_to_size(hg, 0.8)
+        [refinement] = hg.get_refinements()
+        assert hg.get_mergeable_refinements(EdgeType.Q) == [refinement]
+
+        child = hg.find_element(EdgeType.Q, refinement.children[0].get_vertices())
+        flagged = hg.update_edge_parameters(child, {"R": 1})
+        assert hg.get_mergeable_refinements(EdgeType.Q) == []
+
+        hg.update_edge_parameters(flagged, {"R": 0})
+        assert hg.get_mergeable_refinements(EdgeType.Q) == [refinement]
+
+    def test_only_leaf_parents_are_mergeable(self):
+        hg = create_mesh(3)
+        refine_corner(hg)
+
+        mergeable = hg.get_mergeable_refinements(EdgeType.Q)
+
+        assert 0 < len(mergeable) < len(hg.get_refinements())
+        for refinement in mergeable:
+            assert all(hg.get_refinement(child) is None for child in refinement.children)
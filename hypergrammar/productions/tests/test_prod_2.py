@@ -210,3 +210,58 @@ class TestProd2:
 
         # Assert
         assert result2 is None
+
+    def test_apply_on_large_mesh_touches_only_flagged_triangle(self):
+        """Test that production closes the flagged triangle in a long strip of triangles"""
+        # Arrange
+        hg = Hypergraph()
+        n = 2000
+        for i in range(n):
+            hg.add_edge(Edge(EdgeType.E, frozenset({f"T{i}", f"T{i + 1}"}), {"R": 0, "B": 1}))
+            hg.add_edge(Edge(EdgeType.E, frozenset({f"B{i}", f"B{i + 1}"}), {"R": 0, "B": 1}))
+            hg.add_edge(Edge(EdgeType.E, frozenset({f"T{i}", f"B{i + 1}"}), {"R": 0, "B": 0}))
+        for i in range(n + 1):
+            hg.add_edge(Edge(EdgeType.E, frozenset({f"T{i}", f"B{i}"}), {"R": 0, "B": 0}))
+
+        flagged = Edge(EdgeType.E, frozenset({"T1000", "B1001"}), {"R": 0, "B": 0})
+        hg.remove_edge(flagged)
+        hg.add_edge(Edge(EdgeType.E, frozenset({"T1000", "B1001"}), {"R": 1, "B": 0}))
+        edges_count = len(hg.get_edges())
+
+        prod2 = Prod2()
+
+        # Act
+        result = prod2.apply(hg)
+
+        # Assert
+        assert result is not None
+        assert len(result.get_edges()) == edges_count - 1
+        assert not result.has_e_edge("T1000", "B1001")
+        assert prod2.apply(result) is None
+
+    def test_half_of_split_side_is_kept(self):
+        """Test that a marked half of a split side is not taken for a base edge."""
+        hg = Hypergraph()
+        # A-C-B split with the base A-B kept next to the hanging node C
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "C"}), {"R": 1, "B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"C", "B"}), {"R": 0, "B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0, "B": 0}))
+        hg.register_midpoint("A", "B", "C")
+
+        assert Prod2().apply(hg) is None
+        assert hg.has_e_edge("A", "C")
+
+    def test_marked_half_stays_marked(self):
+        """Test that a half marked by the finer neighbour keeps its mark when the base is removed."""
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "C"}), {"R": 1, "B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"C", "B"}), {"R": 0, "B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 0}))
+        hg.register_midpoint("A", "B", "C")
+
+        result = Prod2().apply(hg)
+
+        assert result is not None
+        assert not result.has_e_edge("A", "B")
+        assert result.find_e_edge("A", "C").get_parameters() == {"R": 1, "B": 0}
+        assert result.find_e_edge("C", "B").get_parameters() == {"R": 0, "B": 0}
@@ -138,4 +138,41 @@ class TestProd3(unittest.TestCase):
         result = self.prod.apply(hg)
         self.assertIsNotNone(result, "P3 should be applied on the second time")
 
-        self.assertEqual(len(result.get_edges()), initial_edges_count + 4)
\ No newline at end of file
+        self.assertEqual(len(result.get_edges()), initial_edges_count + 4)
+
+    def test_split_side_reuses_registered_midpoint(self):
+        """Test Prod3 does not create a second midpoint for an already split side"""
+        hg = Hypergraph()
+
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 0}))
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.set_vertex_parameter("B", {"x": 2, "y": 0})
+
+        self.prod.apply(hg)
+        midpoint = hg.get_midpoint("A", "B")
+        self.assertIsNotNone(midpoint)
+
+        # The neighbouring element flags the same side again
+        hg.remove_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0, "B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 0}))
+        result = self.prod.apply(hg)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.get_vertices(), {"A", "B", midpoint})
+        self.assertEqual(len(result.get_edges()), 3)
+        self.assertEqual(hg.get_midpoint("B", "A"), midpoint)
+
+
+    def test_midpoint_name_does_not_collide(self):
+        """Test Prod3 names the midpoint with a vertex name not yet in the graph"""
+        hg = Hypergraph()
+
+        hg.add_edge(Edge(EdgeType.E, frozenset({"v0", "v1"}), {"R": 1, "B": 0}))
+        hg.set_vertex_parameter("v0", {"x": 0, "y": 0})
+        hg.set_vertex_parameter("v1", {"x": 2, "y": 0})
+
+        self.prod.apply(hg)
+        midpoint = hg.get_midpoint("v0", "v1")
+
+        self.assertNotIn(midpoint, {"v0", "v1", None})
+        self.assertEqual(hg.get_vertex_parameters(midpoint), {"x": 1.0, "y": 0.0})
@@ -174,6 +174,63 @@ class TestProd4:
             for e in new_edges:
                 assert e.get_parameters().get("R") == 0
 
+    def test_registered_midpoint_is_reused(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 1}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "M"}), {"R": 0, "B": 1}))
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.set_vertex_parameter("B", {"x": 2, "y": 0})
+        hg.set_vertex_parameter("M", {"x": 1, "y": 0})
+        hg.register_midpoint("A", "B", "M")
+
+        with patch.object(Prod4, "get_new_vert") as mocked_prod:
+            result = Prod4().apply(hg)
+
+            mocked_prod.assert_not_called()
+            assert result.get_vertices() == {"A", "B", "M"}
+            e_edges = result.get_edges_of_type(EdgeType.E)
+            assert {e.get_vertices() for e in e_edges} == {
+                frozenset({"A", "M"}),
+                frozenset({"M", "B"}),
+            }
+            assert len(e_edges) == 2
+
+    def test_apply_all_splits_every_flagged_edge(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 1}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"}), {"R": 1, "B": 1}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"}), {"R": 0, "B": 1}))
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.set_vertex_parameter("B", {"x": 2, "y": 0})
+        hg.set_vertex_parameter("C", {"x": 2, "y": 2})
+        hg.set_vertex_parameter("D", {"x": 0, "y": 2})
+
+        result = Prod4().apply_all(hg)
+
+        assert result is not None
+        assert len(result.get_edges()) == 5
+        ab = result.get_midpoint("A", "B")
+        bc = result.get_midpoint("B", "C")
+        assert result.get_vertex_parameters(ab) == {"x": 1.0, "y": 0.0}
+        assert result.get_vertex_parameters(bc) == {"x": 2.0, "y": 1.0}
+        assert result.find_e_edge("A", ab).get_parameters() == {"R": 0, "B": 1}
+        assert Prod4().apply_all(result) is None
+
+
+    def test_halves_do_not_share_parameters(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 1}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"}), {"R": 1, "B": 1}))
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.set_vertex_parameter("B", {"x": 2, "y": 0})
+        hg.set_vertex_parameter("C", {"x": 2, "y": 2})
+
+        result = Prod4().apply_all(hg)
+
+        halves = result.get_edges_of_type(EdgeType.E)
+        assert len({id(e.get_parameters()) for e in halves}) == len(halves) == 4
+        halves[0].set_parameter("R", 1)
+        assert [e.get_parameters()["R"] for e in halves[1:]] == [0, 0, 0]
 
 if __name__ == "__main__":
     test = TestProd4()
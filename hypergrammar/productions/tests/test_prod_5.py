@@ -1,6 +1,7 @@
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
 from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.cycles import broken_cycle
 
 class TestProd5:
     """Test suite for Production 5."""
@@ -59,14 +60,13 @@ class TestProd5:
         result = prod5.apply(hg)
         assert result is None
     
-    def test_e_edges_match_private_method(self):
+    def test_has_e_edge(self):
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "X"})))
-        prod5 = Prod5()
-        assert prod5._e_edges_match(hg, frozenset({"A", "X"})) is True
-        assert prod5._e_edges_match(hg, frozenset({"X", "B"})) is False
+        assert hg.has_e_edge("A", "X") is True
+        assert hg.has_e_edge("X", "B") is False
     
-    def test_check_all_edges_broken(self):
+    def test_broken_cycle(self):
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "X"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"X", "B"})))
@@ -76,17 +76,32 @@ class TestProd5:
         hg.add_edge(Edge(EdgeType.E, frozenset({"Z", "D"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"D", "W"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"W", "A"})))
-        prod5 = Prod5()
         cycle = ("A", "B", "C", "D")
-        result = prod5._check_all_edges_broken(hg, cycle)
-        assert result is not False
-        assert len(result) == 4
+        result = broken_cycle(hg, cycle, cycle)
+        assert result is not None
+        assert len(result[1]) == 4
     
-    def test_get_broken_edge_other(self):
+    def test_find_midpoint(self):
         hg = Hypergraph()
         hg.add_edge(Edge(EdgeType.E, frozenset({"A", "X"})))
         hg.add_edge(Edge(EdgeType.E, frozenset({"X", "B"})))
-        prod5 = Prod5()
-        other = prod5.get_broken_edge_other(hg, "A", "B", {"A", "B"})
+        other = hg.find_midpoint("A", "B", exclude={"A", "B"})
         assert other == "X"
 
+    def test_apply_sets_central_vertex_in_the_middle(self, capsys):
+        hg = Hypergraph()
+        corners = {"A": (0, 0), "B": (2, 0), "C": (2, 2), "D": (0, 2)}
+        for name, (x, y) in corners.items():
+            hg.set_vertex_parameter(name, {"x": x, "y": y})
+        for v1, m, v2 in [("A", "X", "B"), ("B", "Y", "C"), ("C", "Z", "D"), ("D", "W", "A")]:
+            hg.add_edge(Edge(EdgeType.E, frozenset({v1, m})))
+            hg.add_edge(Edge(EdgeType.E, frozenset({m, v2})))
+        hg.add_edge(Edge(EdgeType.Q, frozenset(corners), {"R": 1}))
+
+        result = Prod5().apply(hg)
+
+        assert result.get_vertex_parameters("M0") == {"x": 1.0, "y": 1.0}
+        q_edges = result.get_edges_of_type(EdgeType.Q)
+        assert frozenset({"A", "X", "M0", "W"}) in {e.get_vertices() for e in q_edges}
+        assert capsys.readouterr().out == ""
+
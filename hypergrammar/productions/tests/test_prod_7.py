@@ -108,4 +108,56 @@ class TestProd7:
 
         prod7 = Prod7()
         result = prod7.apply(hg)
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+    def _create_pentagon(self):
+        hg = Hypergraph()
+        verts = ["v1", "v2", "v3", "v4", "v5"]
+        for i in range(5):
+            hg.add_edge(Edge(EdgeType.E, frozenset({verts[i], verts[(i + 1) % 5]}), {"R": 0, "B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"v1", "x"}), {"R": 0, "B": 0}))
+        hg.add_edge(Edge(EdgeType.P, frozenset(verts), {"R": 1}))
+        return hg
+
+    def test_apply_updates_graph_in_place(self):
+        """Test that P7 modifies the given hypergraph and leaves other edges alone."""
+        hg = self._create_pentagon()
+        other = Edge(EdgeType.E, frozenset({"v1", "x"}), {"R": 0, "B": 0})
+
+        result = Prod7().apply(hg)
+
+        assert result is hg
+        assert hg.has_edge(other)
+        assert hg.find_e_edge("v1", "v2").get_parameters() == {"R": 1, "B": 0}
+
+    def test_apply_copy_on_write(self):
+        """Test that P7 in copy-on-write mode returns a modified copy."""
+        hg = self._create_pentagon()
+        edges_before = hg.get_edges()
+
+        result = Prod7(copy_on_write=True).apply(hg)
+
+        assert result is not hg
+        assert hg.get_edges() == edges_before
+        assert result.find_e_edge("v1", "v2").get_parameters() == {"R": 1, "B": 0}
+
+    def test_apply_fails_with_chord(self):
+        """Test that P7 does not apply when an E edge joins two non-adjacent corners."""
+        hg = self._create_pentagon()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"v1", "v3"}), {"R": 0, "B": 0}))
+
+        assert Prod7().apply(hg) is None
+
+    def test_apply_uses_stored_order(self):
+        """Test that P7 marks the sides given by the element's stored order."""
+        hg = self._create_pentagon()
+        hg.remove_edge(Edge(EdgeType.P, frozenset({"v1", "v2", "v3", "v4", "v5"}), {"R": 1}))
+        order = ("v1", "v2", "v3", "v4", "v5")
+        hg.add_edge(Edge(EdgeType.P, frozenset(order), {"R": 1}, order=order))
+
+        result = Prod7().apply(hg)
+
+        assert result is hg
+        for i in range(5):
+            side = hg.find_e_edge(order[i], order[(i + 1) % 5])
+            assert side.get_parameters()["R"] == 1
@@ -305,6 +305,22 @@ class TestProd8:
         q_edges = [e for e in hg.get_edges() if e.get_type() == EdgeType.Q]
         assert len(q_edges) == 10
 
+    def test_apply_prefers_registered_midpoint(self):
+        """Test that a registered midpoint wins over another common neighbour of a side."""
+        hg = Hypergraph()
+        self._setup_valid_pentagon(hg, suffix="A")
+        hg.register_midpoint("V1_A", "V2_A", "M1_A")
+        # vertex of a neighbouring triangle, connected to both corners of the side
+        hg.add_edge(Edge(EdgeType.E, frozenset({"V1_A", "X"}), {"B": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"X", "V2_A"}), {"B": 0}))
+
+        result = Prod8().apply(hg)
+
+        assert result is not None
+        q_vertices = {e.get_vertices() for e in result.get_edges_of_type(EdgeType.Q)}
+        assert all("X" not in vertices for vertices in q_vertices)
+        assert any({"V1_A", "M1_A"} <= vertices for vertices in q_vertices)
+
 
 if __name__ == "__main__":
     test = TestProd8()
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Protocol, Any, Mapping, Optional, TYPE_CHECKING
+from typing import Protocol, Any, Callable, Iterable, Mapping, Optional, TypeVar, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from hypergrammar.edge import Edge
@@ -12,6 +14,16 @@ class RFC(Protocol):
     Implementations should provide an `is_valid(edge, hypergraph, meta)`
     method that returns a boolean: True when edge should be flagged for refinement,
     False when the refinement is not needed.
+
+    Implementations may also declare a `cost` attribute: the estimated cost of
+    one `is_valid` call, in units of one hypergraph index lookup. Productions
+    use it to decide whether to run the RFC before or after their structural
+    checks, see `check_guards`. RFCs without it cost `DEFAULT_RFC_COST`.
+
+    Implementations may also provide an `is_valid_batch(edges, hypergraph, meta)`
+    method returning a NumPy boolean mask with one entry per edge, so many
+    elements are evaluated in one vectorized call. Productions prefer it when
+    present, see `evaluate_rfc`.
     """
 
     def is_valid(
@@ -22,4 +34,78 @@ class RFC(Protocol):
     ) -> bool: ...
 
 
-__all__ = ["RFC"]
+T = TypeVar("T")
+
+# cost of an RFC that does not declare one, in index lookups
+DEFAULT_RFC_COST = 10.0
+
+
+def rfc_cost(rfc: Optional[Any]) -> float:
+    """Declared cost of `rfc`, 0 when there is no RFC to check."""
+    if rfc is None:
+        return 0.0
+    return float(getattr(rfc, "cost", DEFAULT_RFC_COST))
+
+
+def supports_batch(rfc: Optional[Any]) -> bool:
+    """Whether `rfc` implements `is_valid_batch`."""
+    return callable(getattr(rfc, "is_valid_batch", None))
+
+
+def evaluate_rfc(
+    rfc: Any,
+    edges: Iterable[Edge],
+    hypergraph: Hypergraph,
+    meta: Optional[Mapping[str, Any]] = None,
+) -> np.ndarray:
+    """Boolean mask of the `edges` accepted by `rfc`.
+
+    Uses `is_valid_batch` when the RFC implements it, otherwise calls
+    `is_valid` once per edge.
+    """
+    edges = list(edges)
+    if supports_batch(rfc):
+        mask = np.asarray(rfc.is_valid_batch(edges, hypergraph, meta), dtype=bool)
+        if mask.shape != (len(edges),):
+            raise ValueError(
+                f"is_valid_batch must return one value per edge, got shape {mask.shape} "
+                f"for {len(edges)} edges"
+            )
+        return mask
+    return np.fromiter(
+        (bool(rfc.is_valid(edge, hypergraph, meta)) for edge in edges),
+        dtype=bool,
+        count=len(edges),
+    )
+
+
+def check_guards(
+    rfc: Optional[Any],
+    accept: Callable[[], bool],
+    match: Callable[[], Optional[T]],
+    match_cost: float,
+) -> Optional[T]:
+    """Run the RFC guard `accept` and the structural guard `match` cheapest first.
+
+    Returns the result of `match`, or None when either guard fails.
+    The second guard is only run when the first one passed.
+    """
+    if rfc_cost(rfc) <= match_cost:
+        if not accept():
+            return None
+        return match()
+
+    result = match()
+    if result is None or not accept():
+        return None
+    return result
+
+
+__all__ = [
+    "RFC",
+    "DEFAULT_RFC_COST",
+    "rfc_cost",
+    "supports_batch",
+    "evaluate_rfc",
+    "check_guards",
+]
@@ -0,0 +1,153 @@
+from typing import Any, Hashable, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener
+from hypergrammar.rfc import evaluate_rfc
+
+ElementKey = tuple[EdgeType, frozenset[str]]
+
+
+def cache_token(rfc: Any) -> Optional[Hashable]:
+    """Configuration token of `rfc`, None when it does not declare `cache_token`."""
+    token = getattr(rfc, "cache_token", None)
+    return token() if callable(token) else None
+
+
+class RFCCache(HypergraphListener):
+    """Memoized RFC results of the elements of one hypergraph.
+
+    Results are keyed by element identity, its type and vertex set, so an
+    element whose parameters change (e.g. R flagged) keeps its result.
+    An entry is dropped when one of the element's vertices changes through
+    `Hypergraph.set_vertex_parameter` or `set_vertex_positions`; editing a
+    parameter dict in place is not seen. Every RFC gets its own table,
+    cleared whenever the value of its optional `cache_token()` changes,
+    so RFCs whose configuration can change (a target point, a target vertex)
+    should implement it. Calls with `meta` bypass the cache.
+    """
+
+    def __init__(self) -> None:
+        # id(rfc) -> (rfc, its token, element key -> result)
+        self._tables: dict[int, tuple[Any, Optional[Hashable], dict[ElementKey, bool]]] = {}
+        # vertex -> keys of the cached elements containing it
+        self._by_vertex: dict[str, set[ElementKey]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(len(table) for _, _, table in self._tables.values())
+
+    @staticmethod
+    def key(edge: Edge) -> ElementKey:
+        return edge.get_type(), edge.get_vertices()
+
+    def clear(self, rfc: Optional[Any] = None) -> None:
+        """Forget the results of `rfc`, or of every RFC when not given."""
+        if rfc is None:
+            self._tables.clear()
+            self._by_vertex.clear()
+            return
+        entry = self._tables.pop(id(rfc), None)
+        if entry is not None:
+            self._drop(entry[2])
+
+    def _table(self, rfc: Any) -> dict[ElementKey, bool]:
+        token = cache_token(rfc)
+        entry = self._tables.get(id(rfc))
+        if entry is None or entry[0] is not rfc or entry[1] != token:
+            if entry is not None:
+                del self._tables[id(rfc)]
+                self._drop(entry[2])
+            entry = (rfc, token, {})
+            self._tables[id(rfc)] = entry
+        return entry[2]
+
+    def _drop(self, table: dict[ElementKey, bool]) -> None:
+        """Unindex the keys of a dropped `table` that no other table holds."""
+        orphans = [
+            key for key in table
+            if not any(key in other for _, _, other in self._tables.values())
+        ]
+        self._unindex(orphans)
+
+    def _unindex(self, keys: Iterable[ElementKey]) -> None:
+        for key in keys:
+            for vertex in key[1]:
+                indexed = self._by_vertex.get(vertex)
+                if indexed is None:
+                    continue
+                indexed.discard(key)
+                if not indexed:
+                    del self._by_vertex[vertex]
+
+    def _store(self, table: dict[ElementKey, bool], edge: Edge, result: bool) -> None:
+        key = self.key(edge)
+        table[key] = result
+        for vertex in key[1]:
+            self._by_vertex.setdefault(vertex, set()).add(key)
+
+    def is_valid(
+        self,
+        rfc: Any,
+        edge: Edge,
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        if meta is not None:
+            return bool(rfc.is_valid(edge, hypergraph, meta))
+
+        table = self._table(rfc)
+        result = table.get(self.key(edge))
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = bool(rfc.is_valid(edge, hypergraph, meta))
+        self._store(table, edge, result)
+        return result
+
+    def evaluate(
+        self,
+        rfc: Any,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        """Mask of the accepted `edges`, only the uncached ones are evaluated, in one batch."""
+        if meta is not None:
+            return evaluate_rfc(rfc, edges, hypergraph, meta)
+
+        table = self._table(rfc)
+        mask = np.zeros(len(edges), dtype=bool)
+        missing = []
+        for index, edge in enumerate(edges):
+            result = table.get(self.key(edge))
+            if result is None:
+                missing.append(index)
+            else:
+                mask[index] = result
+        self.hits += len(edges) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            results = evaluate_rfc(rfc, [edges[i] for i in missing], hypergraph)
+            mask[missing] = results
+            for index, result in zip(missing, results.tolist()):
+                self._store(table, edges[index], result)
+        return mask
+
+    def vertex_changed(self, vertex: str) -> None:
+        keys = self._by_vertex.pop(vertex, None)
+        if not keys:
+            return
+        for _, _, table in self._tables.values():
+            for key in keys:
+                table.pop(key, None)
+        # the keys are gone from every table, also under their other vertices
+        self._unindex(keys)
+
+
+__all__ = ["RFCCache", "cache_token"]
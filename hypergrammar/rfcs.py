@@ -0,0 +1,245 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from hypergrammar.edge import Edge
+from hypergrammar.geometry import element_centroids, element_diameters
+from hypergrammar.hypergraph import Hypergraph
+
+
+class BatchRFC(ABC):
+    """Base of the RFCs evaluated over many elements at once.
+
+    Subclasses implement `is_valid_batch`, `is_valid` evaluates a batch of
+    one element. `cache_token` returns the configuration the results depend
+    on, see `RFCCache`.
+    """
+
+    cost = 2.0
+
+    def is_valid(
+        self,
+        edge: Edge,
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        return bool(self.is_valid_batch([edge], hypergraph, meta)[0])
+
+    @abstractmethod
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        pass
+
+    def cache_token(self) -> Hashable:
+        return None
+
+
+class VertexSetRFC(BatchRFC):
+    """Accepts the elements containing at least one of `vertices`."""
+
+    # set membership tests only
+    cost = 1.0
+
+    def __init__(self, vertices: Iterable[str] = ()) -> None:
+        self.vertices = frozenset(vertices)
+
+    def set_vertices(self, vertices: Iterable[str]) -> None:
+        self.vertices = frozenset(vertices)
+
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        vertices = self.vertices
+        return np.fromiter(
+            (not vertices.isdisjoint(edge.get_vertices()) for edge in edges),
+            dtype=bool,
+            count=len(edges),
+        )
+
+    def cache_token(self) -> Hashable:
+        return self.vertices
+
+
+class PointRadiusRFC(BatchRFC):
+    """Accepts the elements whose centroid is at most `radius` from `target_point`.
+
+    Elements with a vertex without coordinates are rejected, as is
+    everything while no target point is set.
+    """
+
+    def __init__(
+        self, target_point: Optional[tuple[float, float]] = None, radius: float = 0.6
+    ) -> None:
+        self.target_point = target_point
+        self.radius = radius
+
+    def set_target_point(self, point: Optional[tuple[float, float]]) -> None:
+        self.target_point = point
+
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        if self.target_point is None:
+            return np.zeros(len(edges), dtype=bool)
+        offset = element_centroids(hypergraph, edges) - np.asarray(self.target_point, dtype=float)
+        mask: np.ndarray = (offset ** 2).sum(axis=1) <= self.radius ** 2
+        return mask
+
+    def cache_token(self) -> Hashable:
+        return self.target_point, self.radius
+
+
+class PolygonRFC(BatchRFC):
+    """Accepts the elements whose centroid lies inside (or on) a polygon region.
+
+    `region` is a shapely geometry or a sequence of (x, y) polygon vertices.
+    Requires shapely, which is only imported when the RFC is created.
+    """
+
+    def __init__(self, region: Any) -> None:
+        self.set_region(region)
+
+    def set_region(self, region: Any) -> None:
+        import shapely  # pylint: disable=import-outside-toplevel
+
+        if not isinstance(region, shapely.Geometry):
+            region = shapely.Polygon(region)
+        shapely.prepare(region)
+        self.region = region
+
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        import shapely  # pylint: disable=import-outside-toplevel
+
+        centroids = element_centroids(hypergraph, edges)
+        inside = shapely.intersects_xy(self.region, centroids[:, 0], centroids[:, 1])
+        mask: np.ndarray = np.asarray(inside, dtype=bool) & ~np.isnan(centroids[:, 0])
+        return mask
+
+    def cache_token(self) -> Hashable:
+        wkb: bytes = self.region.wkb
+        return wkb
+
+
+class MaxDiameterRFC(BatchRFC):
+    """Accepts the elements whose diameter, the largest distance between two
+    of their vertices, exceeds `max_diameter`."""
+
+    # every pair of vertices is compared
+    cost = 4.0
+
+    def __init__(self, max_diameter: float) -> None:
+        self.max_diameter = max_diameter
+
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        diameters = element_diameters(hypergraph, edges)
+        mask: np.ndarray = np.nan_to_num(diameters, nan=-np.inf) > self.max_diameter
+        return mask
+
+    def cache_token(self) -> Hashable:
+        return self.max_diameter
+
+
+class TargetSizeRFC(BatchRFC):
+    """Accepts the elements whose diameter exceeds the target size `h` at their centroid.
+
+    `size` is either a constant or a callable `size(x, y)` taking arrays of
+    centroid coordinates and returning the target sizes, so the whole
+    batch is evaluated with one call.
+    """
+
+    cost = 5.0
+
+    def __init__(self, size: Union[float, Callable[[np.ndarray, np.ndarray], np.ndarray]]) -> None:
+        self.size = size
+
+    def target_sizes(self, centroids: np.ndarray) -> np.ndarray:
+        """Target size at each of the (n, 2) `centroids`."""
+        sizes: Union[float, np.ndarray]
+        if callable(self.size):
+            sizes = self.size(centroids[:, 0], centroids[:, 1])
+        else:
+            sizes = self.size
+        return np.broadcast_to(np.asarray(sizes, dtype=float), (len(centroids),))
+
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        diameters = element_diameters(hypergraph, edges)
+        sizes = self.target_sizes(element_centroids(hypergraph, edges))
+        mask: np.ndarray = np.nan_to_num(diameters, nan=-np.inf) > sizes
+        return mask
+
+    def cache_token(self) -> Hashable:
+        # the callable itself, its id could be reused once it is collected
+        return self.size
+
+
+class ErrorIndicatorRFC(BatchRFC):
+    """Accepts the elements where an error indicator exceeds `threshold`.
+
+    `indicator(x, y)` takes arrays of centroid coordinates and returns an
+    array with the error estimate at each of them, so the whole batch is
+    sampled with one vectorized call.
+    """
+
+    cost = 5.0
+
+    def __init__(
+        self, indicator: Callable[[np.ndarray, np.ndarray], np.ndarray], threshold: float
+    ) -> None:
+        self.indicator = indicator
+        self.threshold = threshold
+
+    def is_valid_batch(
+        self,
+        edges: Sequence[Edge],
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        centroids = element_centroids(hypergraph, edges)
+        known = ~np.isnan(centroids[:, 0])
+        mask = np.zeros(len(edges), dtype=bool)
+        if known.any():
+            errors = np.asarray(
+                self.indicator(centroids[known, 0], centroids[known, 1]), dtype=float
+            )
+            mask[known] = errors > self.threshold
+        return mask
+
+    def cache_token(self) -> Hashable:
+        return self.indicator, self.threshold
+
+
+__all__ = [
+    "BatchRFC",
+    "VertexSetRFC",
+    "PointRadiusRFC",
+    "PolygonRFC",
+    "MaxDiameterRFC",
+    "TargetSizeRFC",
+    "ErrorIndicatorRFC",
+]
@@ -0,0 +1,136 @@
+import heapq
+import time
+from typing import Any, Callable, Optional, Sequence
+
+from hypergrammar.dependencies import (
+    PRODUCTION_READS,
+    DerivationHistory,
+    EdgePattern,
+    production_reads,
+)
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener
+
+
+class _ChangeRecorder(HypergraphListener):
+    def __init__(self) -> None:
+        self.added: list[Edge] = []
+        self.removed: list[Edge] = []
+
+    def edge_added(self, edge: Edge) -> None:
+        self.added.append(edge)
+
+    def edge_removed(self, edge: Edge) -> None:
+        self.removed.append(edge)
+
+    def clear(self) -> None:
+        self.added.clear()
+        self.removed.clear()
+
+
+class WorklistScheduler:
+    """Applies productions until none of them matches, re-probing only dirty ones.
+
+    Every production starts out pending. A production that fails to apply
+    leaves the worklist and returns only when an edge it reads is added or
+    removed, so detecting the fixpoint costs O(total changes) probes instead
+    of a sweep over all productions after every rewrite.
+
+    Pending productions are tried in the order they were given, matching the
+    "restart from the first production" loops of the example drivers.
+
+    Passing a `DerivationHistory` carries failures over between runs (e.g.
+    phases and rounds of `DerivationEngine`): a production that failed in an
+    earlier run starts out pending only if a production that may enable it
+    was applied since.
+    """
+
+    def __init__(self, productions: Sequence[Any]) -> None:
+        self._productions = list(productions)
+        self._unknown: list[int] = []
+        self._readers: dict[EdgeType, list[tuple[int, EdgePattern]]] = {}
+
+        for index, production in enumerate(self._productions):
+            reads = production_reads(production)
+            if reads is None:
+                self._unknown.append(index)
+                continue
+            for pattern in reads:
+                self._readers.setdefault(pattern.edge_type, []).append((index, pattern))
+
+    def get_productions(self) -> list[Any]:
+        return list(self._productions)
+
+    def run(
+        self,
+        graph: Hypergraph,
+        max_steps: Optional[int] = None,
+        on_apply: Optional[Callable[[Any, Hypergraph], None]] = None,
+        deadline: Optional[float] = None,
+        history: Optional[DerivationHistory] = None,
+    ) -> tuple[Hypergraph, int]:
+        """Derive `graph` to a fixpoint, `max_steps` applications or the `deadline`.
+
+        `deadline` is a `time.perf_counter()` timestamp checked before every probe.
+        Returns the resulting hypergraph and the number of applied productions.
+        `on_apply(production, graph)` is called after every successful application.
+        """
+        queue = []
+        queued = [False] * len(self._productions)
+        for index, production in enumerate(self._productions):
+            if history is None or history.may_apply(production, graph):
+                queue.append(index)
+                queued[index] = True
+        steps = 0
+
+        recorder = _ChangeRecorder()
+        graph.add_listener(recorder)
+        try:
+            while queue and (max_steps is None or steps < max_steps):
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                index = heapq.heappop(queue)
+                queued[index] = False
+                production = self._productions[index]
+
+                result = production.apply(graph)
+                if result is None:
+                    if history is not None:
+                        history.record_failure(production, graph)
+                    continue
+
+                steps += 1
+                if result is not graph:
+                    # the production built a new hypergraph, its changes were not observed
+                    graph.remove_listener(recorder)
+                    graph = result
+                    graph.add_listener(recorder)
+                    dirty = set(range(len(self._productions)))
+                else:
+                    dirty = self._dirty_productions(recorder.added + recorder.removed)
+                if history is not None:
+                    history.record_application(production, graph, recorder.added)
+                recorder.clear()
+
+                for dirty_index in dirty:
+                    if not queued[dirty_index]:
+                        queued[dirty_index] = True
+                        heapq.heappush(queue, dirty_index)
+
+                if on_apply is not None:
+                    on_apply(production, graph)
+        finally:
+            graph.remove_listener(recorder)
+
+        return graph, steps
+
+    def _dirty_productions(self, changed: list[Edge]) -> set[int]:
+        dirty = set(self._unknown)
+        for edge in changed:
+            for index, pattern in self._readers.get(edge.get_type(), ()):
+                if pattern.matches(edge):
+                    dirty.add(index)
+        return dirty
+
+
+__all__ = ["EdgePattern", "PRODUCTION_READS", "production_reads", "WorklistScheduler"]
@@ -0,0 +1,76 @@
+"""Graph factories and production wrappers shared by the test modules."""
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.dependencies import production_reads, production_writes
+
+
+def create_square() -> Hypergraph:
+    """Unit square ABCD with all sides on the border."""
+    hg = Hypergraph()
+    hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0, "B": 1}))
+    hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"}), {"R": 0, "B": 1}))
+    hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"}), {"R": 0, "B": 1}))
+    hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"}), {"R": 0, "B": 1}))
+    hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0}))
+    hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+    hg.set_vertex_parameter("B", {"x": 1, "y": 0})
+    hg.set_vertex_parameter("C", {"x": 1, "y": 1})
+    hg.set_vertex_parameter("D", {"x": 0, "y": 1})
+    return hg
+
+
+def create_mesh(n):
+    """n x n unit squares with corners v{i}_{j} at (i, j), sides on the border of the mesh have B=1."""
+    hg = Hypergraph()
+    for i in range(n + 1):
+        for j in range(n + 1):
+            hg.set_vertex_parameter(f"v{i}_{j}", {"x": float(i), "y": float(j)})
+    for i in range(n + 1):
+        for j in range(n + 1):
+            if i < n:
+                border = int(j in (0, n))
+                hg.add_edge(Edge(EdgeType.E, frozenset({f"v{i}_{j}", f"v{i + 1}_{j}"}), {"R": 0, "B": border}))
+            if j < n:
+                border = int(i in (0, n))
+                hg.add_edge(Edge(EdgeType.E, frozenset({f"v{i}_{j}", f"v{i}_{j + 1}"}), {"R": 0, "B": border}))
+            if i < n and j < n:
+                corners = {f"v{i}_{j}", f"v{i + 1}_{j}", f"v{i + 1}_{j + 1}", f"v{i}_{j + 1}"}
+                hg.add_edge(Edge(EdgeType.Q, frozenset(corners), {"R": 0}))
+    return hg
+
+
+def create_hanging_node():
+    """Coarse square A-B-C-D next to a fine square A-M-X-Y, M splits the side A-B."""
+    hg = Hypergraph()
+    for a, b in [("A", "M"), ("M", "B"), ("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"),
+                 ("M", "X"), ("X", "Y"), ("Y", "A")]:
+        hg.add_edge(Edge(EdgeType.E, frozenset({a, b}), {"R": 0, "B": 0}))
+    hg.register_midpoint("A", "B", "M")
+    hg.add_edge(Edge(EdgeType.Q, frozenset("ABCD"), {"R": 0}, order=("A", "B", "C", "D")))
+    hg.add_edge(Edge(EdgeType.Q, frozenset("AMXY"), {"R": 0}, order=("A", "M", "X", "Y")))
+    return hg
+
+
+def find_element(hg, *corners):
+    [element] = [q for q in hg.get_edges_of_type(EdgeType.Q) if q.get_vertices() == frozenset(corners)]
+    return element
+
+
+def square(hg, i, j):
+    """The element of `create_mesh` with lower left corner v{i}_{j}."""
+    return find_element(hg, f"v{i}_{j}", f"v{i + 1}_{j}", f"v{i + 1}_{j + 1}", f"v{i}_{j + 1}")
+
+
+class CountingProd:
+    """Wraps a production and counts `apply` calls, keeping its read and write patterns."""
+
+    def __init__(self, production):
+        self.production = production
+        self.READS = production_reads(production)
+        self.WRITES = production_writes(production)
+        self.calls = 0
+
+    def apply(self, graph):
+        self.calls += 1
+        return self.production.apply(graph)
@@ -0,0 +1,58 @@
+import numpy as np
+
+from hypergrammar.edge import EdgeType
+from hypergrammar.adaptive import AdaptiveRefiner, refine_to_size, sweep
+from hypergrammar.geometry import element_centroids, element_diameters
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.tests.helpers import create_mesh
+
+
+class TestAdaptiveRefiner:
+    """Test suite for the target size driven refinement."""
+
+    def test_uniform_size(self):
+        hg = create_mesh(2)
+
+        result = refine_to_size(hg, 0.5)
+
+        assert result.stop_reason == "fixpoint"
+        elements = hg.get_edges_of_type(EdgeType.Q)
+        # every unit square was refined twice
+        assert len(elements) == 4 * 16
+        assert element_diameters(hg, elements).max() <= 0.5
+        assert all(q.get_parameters()["R"] == 0 for q in elements)
+
+    def test_graded_size(self):
+        hg = create_mesh(4)
+
+        def size(x, y):
+            return 0.2 + 0.4 * x
+
+        result = refine_to_size(hg, size)
+
+        elements = hg.get_edges_of_type(EdgeType.Q)
+        centroids = element_centroids(hg, elements)
+        diameters = element_diameters(hg, elements)
+        assert result.stop_reason == "fixpoint"
+        assert np.all(diameters <= size(centroids[:, 0], centroids[:, 1]))
+        # the mesh is graded, coarse elements are left on the right
+        assert diameters.max() == np.sqrt(2)
+        assert not any(e.get_parameters().get("R") for e in hg.get_edges_of_type(EdgeType.E))
+
+    def test_max_sweeps(self):
+        hg = create_mesh(1)
+
+        result = AdaptiveRefiner(0.1, max_sweeps=1).run(hg)
+
+        assert result.stop_reason == "max_sweeps"
+        assert result.sweeps == 1
+        assert result.applied["Prod5"] == 1
+        assert len(hg.get_edges_of_type(EdgeType.Q)) == 4
+
+    def test_sweep_applies_to_every_match(self):
+        hg = create_mesh(2)
+
+        assert sweep(Prod0(), hg)
+
+        assert all(q.get_parameters()["R"] == 1 for q in hg.get_edges_of_type(EdgeType.Q))
+        assert not sweep(Prod0(), hg)
@@ -0,0 +1,71 @@
+import numpy as np
+
+from hypergrammar.edge import EdgeType
+from hypergrammar.adaptive import refine_to_size
+from hypergrammar.balance import Balancer, balance
+from hypergrammar.dual import element_neighbours
+from hypergrammar.tests.helpers import create_hanging_node, create_mesh, find_element, square
+
+
+class TestBalance:
+    """Test suite for the 2:1 balance pass."""
+
+    def test_neighbours_share_a_side(self):
+        hg = create_mesh(3)
+
+        neighbours = element_neighbours(hg, square(hg, 1, 1))
+
+        assert neighbours == {square(hg, 0, 1), square(hg, 2, 1), square(hg, 1, 0), square(hg, 1, 2)}
+
+    def test_neighbours_across_hanging_node(self):
+        hg = create_hanging_node()
+        coarse = find_element(hg, "A", "B", "C", "D")
+        fine = find_element(hg, "A", "M", "X", "Y")
+
+        assert fine in element_neighbours(hg, coarse)
+        assert coarse in element_neighbours(hg, fine)
+
+    def test_flags_coarse_neighbours(self):
+        hg = create_mesh(3)
+        hg.set_element_level(square(hg, 0, 0), 3)
+        hg.set_element_level(square(hg, 1, 0), 1)
+        hg.set_element_level(square(hg, 0, 1), 1)
+
+        flagged = balance(hg)
+
+        expected = {(1, 0), (0, 1), (2, 0), (1, 1), (0, 2)}
+        assert {e.get_vertices() for e in flagged} == {square(hg, i, j).get_vertices() for i, j in expected}
+        assert all(e.get_parameters()["R"] == 1 for e in flagged)
+        assert balance(hg) == []
+
+    def test_balanced_refinement(self):
+        hg = create_mesh(4)
+
+        def size(x, y):
+            return np.where(x + y <= 1.0, 0.1, 10.0)
+
+        result = refine_to_size(hg, size, balanced=True)
+
+        assert result.stop_reason == "fixpoint"
+        for element in hg.get_edges_of_type(EdgeType.Q):
+            level = hg.get_element_level(element)
+            assert all(abs(hg.get_element_level(n) - level) <= 1 for n in element_neighbours(hg, element))
+        assert not any(q.get_parameters()["R"] for q in hg.get_edges_of_type(EdgeType.Q))
+
+    def test_balanced_refinement_seeds_later_passes(self, monkeypatch):
+        hg = create_mesh(4)
+        seeds = []
+        run = Balancer.run
+
+        def recording_run(self, graph, pass_seeds=None):
+            seeds.append(None if pass_seeds is None else list(pass_seeds))
+            return run(self, graph, pass_seeds)
+
+        monkeypatch.setattr(Balancer, "run", recording_run)
+        result = refine_to_size(hg, lambda x, y: np.where(x + y <= 1.0, 0.1, 10.0), balanced=True)
+
+        assert seeds[0] is None
+        assert len(seeds) == result.sweeps
+        for sweep_seeds in seeds[1:]:
+            assert all(e.get_parameters()["R"] == 1 for e in sweep_seeds)
+            assert len(sweep_seeds) < len(hg.get_elements_at_least(1))
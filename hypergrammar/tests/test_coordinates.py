@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from hypergrammar.coordinates import CoordinateStore
+from hypergrammar.hypergraph import Hypergraph
+
+
+class TestCoordinateStore:
+    """Test suite for the NumPy coordinate store."""
+
+    def test_set_and_get(self):
+        store = CoordinateStore(capacity=1)
+        store.set("A", 0, 0)
+        store.set("B", 2, 4)
+        store.set("A", 1, 1)
+
+        assert len(store) == 2
+        assert store.get("A") == (1.0, 1.0)
+        assert store.get("C") is None
+        np.testing.assert_array_equal(store.get_many(["B", "A"]), [[2, 4], [1, 1]])
+
+    def test_midpoints(self):
+        store = CoordinateStore()
+        store.set_many(["A", "B", "C"], np.array([[0, 0], [2, 0], [2, 2]]))
+
+        np.testing.assert_array_equal(store.midpoints(["A", "B"], ["B", "C"]), [[1, 0], [2, 1]])
+
+    def test_discarded_vertex_has_no_coordinates(self):
+        store = CoordinateStore()
+        store.set("A", 0, 0)
+        store.discard("A")
+
+        assert "A" not in store
+        with pytest.raises(KeyError):
+            store.get_many(["A"])
+
+    def test_mirrors_hypergraph_vertex_parameters(self):
+        hg = Hypergraph()
+        hg.set_vertex_parameter("A", {"x": 1, "y": 2})
+        hg.set_vertex_parameter("B", {"label": 1})
+        hg.set_vertex_positions(["C"], np.array([[3.0, 4.0]]))
+
+        store = hg.get_coordinates()
+        assert store.get("A") == (1.0, 2.0)
+        assert "B" not in store
+        assert hg.get_vertex_parameters("C") == {"x": 3.0, "y": 4.0}
+
+    def test_set_vertex_positions_keeps_other_parameters(self):
+        hg = Hypergraph()
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0, "level": 2})
+        hg.set_vertex_parameter("B", {"label": 1})
+
+        hg.set_vertex_positions(["A", "B"], np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+        assert hg.get_vertex_parameters("A") == {"x": 1.0, "y": 2.0, "level": 2}
+        assert hg.get_vertex_parameters("B") == {"label": 1, "x": 3.0, "y": 4.0}
+        assert hg.get_coordinates().get("B") == (3.0, 4.0)
+
+    def test_new_vertex_name_skips_used_names(self):
+        hg = Hypergraph()
+        hg.set_vertex_parameter("v0", {"x": 0, "y": 0})
+
+        assert hg.new_vertex_name() == "v1"
+        assert hg.new_vertex_name("M") == "M0"
+        assert hg.new_vertex_name() == "v2"
@@ -0,0 +1,131 @@
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.cycles import broken_cycle, cycle_edges, e_cycle, find_cycle
+from hypergrammar.productions.prod_5 import Prod5
+
+
+def _add_e(hg, v1, v2):
+    hg.add_edge(Edge(EdgeType.E, frozenset({v1, v2}), {"R": 0, "B": 0}))
+
+
+class TestCycles:
+    """Test suite for ordered cycle extraction."""
+
+    def test_find_cycle_orders_vertices(self):
+        adjacency = {"A": "BD", "B": "AC", "C": "BD", "D": "CA"}
+
+        assert find_cycle("ABCD", lambda v: adjacency[v]) == ("A", "B", "C", "D")
+
+    def test_find_cycle_backtracks_over_chords(self):
+        # A-C is a chord, the only Hamiltonian cycle is A-B-C-D
+        adjacency = {"A": "BCD", "B": "AC", "C": "ABD", "D": "CA"}
+
+        assert find_cycle("ABCD", lambda v: adjacency[v]) == ("A", "B", "C", "D")
+
+    def test_find_cycle_missing_side(self):
+        adjacency = {"A": "B", "B": "AC", "C": "BD", "D": "C"}
+
+        assert find_cycle("ABCD", lambda v: adjacency[v]) is None
+
+    def test_e_cycle(self):
+        hg = Hypergraph()
+        for v1, v2 in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"), ("C", "X")]:
+            _add_e(hg, v1, v2)
+
+        assert e_cycle(hg, {"A", "B", "C", "D"}) == ("A", "B", "C", "D")
+        assert e_cycle(hg, {"A", "B", "C", "X"}) is None
+
+    def test_broken_cycle_returns_midpoints_in_order(self):
+        hg = Hypergraph()
+        for v1, m, v2 in [("A", "X", "B"), ("B", "Y", "C"), ("C", "Z", "D"), ("D", "W", "A")]:
+            _add_e(hg, v1, m)
+            _add_e(hg, m, v2)
+        # unbroken triangle base on one side does not count as a midpoint
+        _add_e(hg, "A", "B")
+
+        cycle, midpoints = broken_cycle(hg, {"A", "B", "C", "D"})
+
+        assert cycle == ("A", "B", "C", "D")
+        assert midpoints == ["X", "Y", "Z", "W"]
+
+    def test_broken_cycle_requires_every_side_broken(self):
+        hg = Hypergraph()
+        for v1, m, v2 in [("A", "X", "B"), ("B", "Y", "C"), ("C", "Z", "D")]:
+            _add_e(hg, v1, m)
+            _add_e(hg, m, v2)
+        _add_e(hg, "D", "A")
+
+        assert broken_cycle(hg, {"A", "B", "C", "D"}) is None
+
+    def test_broken_cycle_skips_far_end_of_hanging_half(self):
+        hg = Hypergraph()
+        # coarse A-B-C-D with the hanging node M on A-B, the base A-B is kept
+        for v1, v2 in [("A", "M"), ("M", "B"), ("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")]:
+            _add_e(hg, v1, v2)
+        hg.register_midpoint("A", "B", "M")
+        # fine A-M-X-Y with every side but A-M split
+        for v1, m, v2 in [("M", "mMX", "X"), ("X", "mXY", "Y"), ("Y", "mYA", "A")]:
+            _add_e(hg, v1, m)
+            _add_e(hg, m, v2)
+            hg.register_midpoint(v1, v2, m)
+        hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "M", "X", "Y"}), {"R": 1}))
+        edges = hg.get_edges()
+
+        assert broken_cycle(hg, {"A", "M", "X", "Y"}) is None
+        assert Prod5().apply(hg) is None
+        assert hg.get_edges() == edges
+
+    def test_known_order_is_only_verified(self):
+        hg = Hypergraph()
+        for v1, v2 in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")]:
+            _add_e(hg, v1, v2)
+
+        assert e_cycle(hg, {"A", "B", "C", "D"}, ("B", "C", "D", "A")) == ("B", "C", "D", "A")
+        assert e_cycle(hg, {"A", "B", "C", "D"}, ("A", "C", "B", "D")) is None
+
+    def test_cycle_edges_prefers_known_edges_still_in_graph(self):
+        hg = Hypergraph()
+        for v1, v2 in [("A", "B"), ("B", "C"), ("C", "A")]:
+            _add_e(hg, v1, v2)
+        known = tuple(cycle_edges(hg, ("A", "B", "C")))
+        marked = hg.update_edge_parameters(known[0], {"R": 1})
+
+        edges = cycle_edges(hg, ("A", "B", "C"), known)
+
+        assert edges == [marked, known[1], known[2]]
+
+
+class TestElementOrder:
+    """Test suite for cyclic order stored on element hyperedges."""
+
+    def test_order_is_not_part_of_identity(self):
+        vertices = frozenset({"A", "B", "C", "D"})
+        ordered = Edge(EdgeType.Q, vertices, {"R": 0}, order=("A", "B", "C", "D"))
+        plain = Edge(EdgeType.Q, vertices, {"R": 0})
+
+        assert ordered == plain
+        assert hash(ordered) == hash(plain)
+        assert ordered.get_order() == ("A", "B", "C", "D")
+
+    def test_order_must_match_vertices(self):
+        with pytest.raises(ValueError):
+            Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), order=("A", "B", "C", "X"))
+
+    def test_broken_elements_get_order_and_boundary(self):
+        hg = Hypergraph()
+        for v1, m, v2 in [("A", "X", "B"), ("B", "Y", "C"), ("C", "Z", "D"), ("D", "W", "A")]:
+            _add_e(hg, v1, m)
+            _add_e(hg, m, v2)
+        hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 1}))
+
+        Prod5().apply(hg)
+
+        for q_edge in hg.get_edges_of_type(EdgeType.Q):
+            order = q_edge.get_order()
+            assert e_cycle(hg, q_edge.get_vertices(), order) == order
+            boundary = q_edge.get_boundary()
+            assert [e.get_vertices() for e in boundary] == [
+                frozenset({order[i], order[(i + 1) % 4]}) for i in range(4)
+            ]
@@ -0,0 +1,113 @@
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.dependencies import DependencyGraph, DerivationHistory, EdgePattern
+from hypergrammar.scheduler import WorklistScheduler
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_1 import Prod1
+from hypergrammar.productions.prod_2 import Prod2
+from hypergrammar.productions.prod_4 import Prod4
+from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.productions.prod_11 import Prod11
+from hypergrammar.tests.helpers import CountingProd
+
+
+class TestDependencyGraph:
+    """Test suite for the production dependency graph."""
+
+    def test_pattern_overlap(self):
+        assert EdgePattern(EdgeType.Q, {"R": 1}).overlaps(EdgePattern(EdgeType.Q))
+        assert EdgePattern(EdgeType.E, {"R": 0}).overlaps(EdgePattern(EdgeType.E, {"B": 0}))
+        assert not EdgePattern(EdgeType.Q, {"R": 1}).overlaps(EdgePattern(EdgeType.Q, {"R": 0}))
+        assert not EdgePattern(EdgeType.Q).overlaps(EdgePattern(EdgeType.E))
+
+    def test_known_causal_links(self):
+        prods = [Prod0(), Prod1(), Prod2(), Prod4(), Prod5(), Prod9(), Prod10(), Prod11()]
+        prod0, prod1, prod2, prod4, prod5, prod9, prod10, prod11 = prods
+        graph = DependencyGraph(prods)
+
+        # Prod0 creates Q with R=1, which Prod1 and Prod5 look for
+        assert prod1 in graph.successors(prod0)
+        assert prod5 in graph.successors(prod0)
+        # Prod1 creates E with R=1, which Prod2 and Prod4 need
+        assert prod2 in graph.successors(prod1)
+        assert prod4 in graph.successors(prod1)
+        # Prod9 enables Prod10 and Prod11
+        assert prod10 in graph.successors(prod9)
+        assert prod11 in graph.successors(prod9)
+        # nothing produces S with R=0
+        assert graph.predecessors(prod9) == []
+
+    def test_unknown_production_depends_on_everything(self):
+        class Unknown:
+            def apply(self, graph):
+                return None
+
+        unknown = Unknown()
+        prod9 = Prod9()
+        graph = DependencyGraph([unknown, prod9])
+
+        assert unknown in graph.predecessors(prod9)
+        assert prod9 in graph.predecessors(unknown)
+
+    def test_observe_widens_declared_writes(self):
+        prod9 = Prod9()
+        prod0 = Prod0()
+        graph = DependencyGraph([prod9, prod0])
+        assert prod0 not in graph.successors(prod9)
+
+        graph.observe(prod9, [Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0})])
+
+        assert prod0 in graph.successors(prod9)
+
+
+class TestDerivationHistory:
+    """Test suite for skipping productions across scheduler runs."""
+
+    def _create_graph(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"C", "D"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"D", "A"})))
+        hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0}))
+        return hg
+
+    def test_failed_production_is_skipped_in_later_runs(self):
+        hg = self._create_graph()
+        prod9 = CountingProd(Prod9())
+        prod0 = Prod0()
+        history = DerivationHistory(DependencyGraph([prod9, prod0]))
+
+        WorklistScheduler([prod9]).run(hg, history=history)
+        WorklistScheduler([prod0]).run(hg, history=history)
+        WorklistScheduler([prod9]).run(hg, history=history)
+
+        assert prod9.calls == 1
+
+    def test_production_is_retried_after_predecessor_applied(self):
+        hg = self._create_graph()
+        prod1 = CountingProd(Prod1())
+        prod0 = Prod0()
+        history = DerivationHistory(DependencyGraph([prod0, prod1]))
+
+        WorklistScheduler([prod1]).run(hg, history=history)
+        WorklistScheduler([prod0]).run(hg, history=history)
+        _, steps = WorklistScheduler([prod1]).run(hg, history=history)
+
+        # failed, retried and applied, then probed once more after its own change
+        assert prod1.calls == 3
+        assert steps == 1
+
+    def test_external_change_resets_failures(self):
+        hg = Hypergraph()
+        prod9 = CountingProd(Prod9())
+        history = DerivationHistory(DependencyGraph([prod9]))
+
+        WorklistScheduler([prod9]).run(hg, history=history)
+        hg.add_edge(Edge(EdgeType.S, frozenset({f"v{i}" for i in range(6)}), {"R": 0}))
+        _, steps = WorklistScheduler([prod9]).run(hg, history=history)
+
+        assert prod9.calls == 3
+        assert steps == 1
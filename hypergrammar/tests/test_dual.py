@@ -0,0 +1,64 @@
+import numpy as np
+
+from hypergrammar.edge import EdgeType
+from hypergrammar.adaptive import refine_to_size
+from hypergrammar.dual import DualGraph
+from hypergrammar.tests.helpers import create_hanging_node, create_mesh, find_element, square
+
+
+class TestDualGraph:
+    """Test suite for the incrementally maintained element adjacency."""
+
+    def test_grid_adjacency(self):
+        hg = create_mesh(3)
+
+        dual = hg.get_dual_graph()
+
+        assert len(dual) == 9
+        assert dual.degree(square(hg, 1, 1)) == 4
+        assert dual.degree(square(hg, 0, 0)) == 2
+        assert set(hg.get_element_neighbours(square(hg, 0, 0))) == {square(hg, 1, 0), square(hg, 0, 1)}
+
+    def test_hanging_node_adjacency(self):
+        hg = create_hanging_node()
+        coarse = find_element(hg, "A", "B", "C", "D")
+        fine = find_element(hg, "A", "M", "X", "Y")
+
+        assert hg.get_element_neighbours(coarse) == [fine]
+        assert hg.get_element_neighbours(fine) == [coarse]
+
+    def test_follows_changes(self):
+        hg = create_mesh(2)
+        dual = hg.get_dual_graph()
+        element = square(hg, 0, 0)
+
+        flagged = hg.update_edge_parameters(element, {"R": 1})
+        assert flagged in dual
+        assert element not in dual
+        assert flagged in hg.get_element_neighbours(square(hg, 1, 0))
+
+        hg.remove_edge(flagged)
+        assert dual.degree(square(hg, 1, 0)) == 1
+        assert dual.neighbours(flagged) == []
+
+    def test_midpoint_registered_after_elements(self):
+        hg = create_hanging_node()
+        hg.unregister_midpoint("A", "B")
+        dual = hg.get_dual_graph()
+        coarse = find_element(hg, "A", "B", "C", "D")
+        assert dual.neighbours(coarse) == []
+
+        hg.register_midpoint("A", "B", "M")
+
+        assert dual.neighbours(coarse) == [find_element(hg, "A", "M", "X", "Y")]
+
+    def test_matches_rebuild_after_refinement(self):
+        hg = create_mesh(3)
+        dual = hg.get_dual_graph()
+
+        refine_to_size(hg, lambda x, y: np.where(x + y <= 1.0, 0.2, 10.0))
+
+        rebuilt = DualGraph(hg)
+        assert len(dual) == len(rebuilt) == len(hg.get_edges_of_type(EdgeType.Q))
+        for element in hg.get_edges_of_type(EdgeType.Q):
+            assert set(dual.neighbours(element)) == set(rebuilt.neighbours(element))
@@ -0,0 +1,103 @@
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.engine import DerivationEngine, DerivationHook, Phase, default_phases
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_1 import Prod1
+from hypergrammar.productions.prod_4 import Prod4
+from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.tests.helpers import create_square
+
+
+class CornerRFC:
+    """Accepts elements containing vertex A."""
+
+    def is_valid(self, edge, hypergraph, meta=None):
+        return "A" in edge.get_vertices()
+
+
+class RecordingHook(DerivationHook):
+    def __init__(self):
+        self.events = []
+
+    def phase_started(self, phase, graph):
+        self.events.append(("start", phase.name))
+
+    def production_applied(self, step, phase, production, graph):
+        self.events.append((step, production.__class__.__name__))
+
+    def phase_finished(self, phase, graph, steps):
+        self.events.append(("finish", phase.name, steps))
+
+
+class TestDerivationEngine:
+    """Test suite for the derivation engine."""
+
+    def test_single_round_refines_square(self):
+        hg = create_square()
+        phases = [
+            Phase("refining", [Prod0(rfc=CornerRFC())]),
+            Phase("modifying", [Prod1(), Prod4(), Prod5()]),
+        ]
+
+        result = DerivationEngine(phases, max_rounds=1).run(hg)
+
+        assert result.rounds == 1
+        assert result.stop_reason == "max_rounds"
+        assert result.applied == {"Prod0": 1, "Prod1": 1, "Prod4": 4, "Prod5": 1}
+        q_edges = [e for e in result.graph.get_edges() if e.get_type() == EdgeType.Q]
+        assert len(q_edges) == 4
+
+    def test_rounds_repeat_until_fixpoint(self):
+        hg = create_square()
+        # each round refines the Q element in the corner A once more
+        result = DerivationEngine(default_phases(CornerRFC()), max_rounds=3).run(hg)
+
+        assert result.rounds == 3
+        assert result.applied["Prod5"] == 3
+        q_edges = [e for e in result.graph.get_edges() if e.get_type() == EdgeType.Q]
+        assert len(q_edges) == 10
+
+    def test_stops_at_fixpoint(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+
+        result = DerivationEngine(default_phases()).run(hg)
+
+        assert result.stop_reason == "fixpoint"
+        assert result.steps == 0
+        assert result.rounds == 1
+
+    def test_max_steps_budget(self):
+        hg = create_square()
+
+        result = DerivationEngine(default_phases(CornerRFC()), max_steps=3).run(hg)
+
+        assert result.steps == 3
+        assert result.stop_reason == "max_steps"
+
+    def test_time_budget(self):
+        hg = create_square()
+
+        result = DerivationEngine(default_phases(CornerRFC()), time_budget=0.0).run(hg)
+
+        assert result.steps == 0
+        assert result.stop_reason == "time_budget"
+
+    def test_hooks_are_called(self):
+        hg = create_square()
+        hook = RecordingHook()
+        phases = [
+            Phase("refining", [Prod0(rfc=CornerRFC())]),
+            Phase("modifying", [Prod1()]),
+        ]
+
+        DerivationEngine(phases, max_rounds=1, hooks=[hook]).run(hg)
+
+        assert hook.events == [
+            ("start", "refining"),
+            (1, "Prod0"),
+            ("finish", "refining", 1),
+            ("start", "modifying"),
+            (2, "Prod1"),
+            ("finish", "modifying", 1),
+        ]
@@ -0,0 +1,87 @@
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.geometry import SpatialIndex, default_cell_size
+from hypergrammar.tests.helpers import create_mesh
+
+
+class TestSpatialIndex:
+    """Test suite for the grid index over edge centroids."""
+
+    def test_elements_within(self):
+        hg = create_mesh(4)
+
+        found = hg.elements_within((1.5, 1.5), 0.1, EdgeType.Q)
+
+        assert found == [
+            q for q in hg.get_edges_of_type(EdgeType.Q)
+            if q.get_vertices() == frozenset({"v1_1", "v2_1", "v2_2", "v1_2"})
+        ]
+        # E edges are indexed by their midpoint
+        assert {frozenset(e.get_vertices()) for e in hg.elements_within((1.5, 1.0), 0.01)} == {
+            frozenset({"v1_1", "v2_1"})
+        }
+
+    def test_elements_in_box_matches_brute_force(self):
+        hg = create_mesh(6)
+        index = hg.get_spatial_index(cell_size=0.7)
+
+        found = set(index.elements_in_box(0.9, 1.2, 3.6, 4.5))
+
+        expected = set()
+        for edge in hg.get_edges():
+            x = sum(hg.get_vertex_parameters(v)["x"] for v in edge.get_vertices()) / len(edge.get_vertices())
+            y = sum(hg.get_vertex_parameters(v)["y"] for v in edge.get_vertices()) / len(edge.get_vertices())
+            if 0.9 <= x <= 3.6 and 1.2 <= y <= 4.5:
+                expected.add(edge)
+        assert found == expected
+        assert len(index) == len(hg.get_edges())
+
+    def test_follows_changes(self):
+        hg = create_mesh(2)
+        index = hg.get_spatial_index()
+        q = hg.elements_within((0.5, 0.5), 0.1, EdgeType.Q)[0]
+
+        flagged = hg.update_edge_parameters(q, {"R": 1})
+        assert hg.elements_within((0.5, 0.5), 0.1, EdgeType.Q) == [flagged]
+        assert q not in index
+
+        hg.set_vertex_parameter("v0_0", {"x": -4.0, "y": -4.0})
+        assert hg.elements_within((0.5, 0.5), 0.1, EdgeType.Q) == []
+        assert index.centroid(flagged) == pytest.approx((-0.5, -0.5))
+
+    def test_vertices_without_coordinates(self):
+        hg = Hypergraph()
+        edge = Edge(EdgeType.E, frozenset({"A", "B"}))
+        hg.add_edge(edge)
+        index = SpatialIndex(hg)
+        hg.add_listener(index)
+        hg.set_vertex_parameter("A", {"x": 0.0, "y": 0.0})
+
+        assert edge not in index
+
+        hg.set_vertex_parameter("B", {"x": 2.0, "y": 0.0})
+
+        assert index.elements_within((1.0, 0.0), 0.1) == [edge]
+
+    def test_default_cell_size_follows_element_size(self):
+        hg = create_mesh(4)
+        for vertex in list(hg.get_vertices()):
+            x, y = hg.get_coordinates().get(vertex)
+            hg.set_vertex_parameter(vertex, {"x": x / 8, "y": y / 8})
+
+        assert default_cell_size(hg) == pytest.approx(0.125)
+        assert hg.get_spatial_index().get_cell_size() == pytest.approx(0.125)
+
+    def test_default_cell_size_without_edges(self):
+        hg = Hypergraph()
+        assert default_cell_size(hg) == 1.0
+
+        for i in range(4):
+            hg.set_vertex_parameter(f"v{i}", {"x": 3.0 * i, "y": 0.0})
+        assert default_cell_size(hg) == pytest.approx(4.5)
+
+    def test_invalid_cell_size(self):
+        with pytest.raises(ValueError):
+            SpatialIndex(Hypergraph(), cell_size=0)
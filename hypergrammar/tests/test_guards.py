@@ -0,0 +1,176 @@
+import numpy as np
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.rfc import DEFAULT_RFC_COST, check_guards, evaluate_rfc, rfc_cost
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.i_prod import FIRST_RFC_BATCH
+from hypergrammar.productions.prod_4 import Prod4
+
+
+class RecordingRFC:
+    """Accepts nothing and records the elements it was asked about."""
+
+    def __init__(self, cost=None):
+        if cost is not None:
+            self.cost = cost
+        self.calls = []
+
+    def is_valid(self, edge, hypergraph, meta=None):
+        self.calls.append(edge)
+        return False
+
+
+class TestGuardOrdering:
+    """Test suite for cost based ordering of RFC and structural checks."""
+
+    def test_rfc_cost(self):
+        assert rfc_cost(None) == 0.0
+        assert rfc_cost(RecordingRFC()) == DEFAULT_RFC_COST
+        assert rfc_cost(RecordingRFC(cost=2)) == 2.0
+
+    def test_cheap_rfc_runs_first(self):
+        calls = []
+
+        result = check_guards(
+            RecordingRFC(cost=1),
+            lambda: calls.append("rfc") or False,
+            lambda: calls.append("match") or "cycle",
+            match_cost=5,
+        )
+
+        assert result is None
+        assert calls == ["rfc"]
+
+    def test_expensive_rfc_runs_after_match(self):
+        calls = []
+
+        result = check_guards(
+            RecordingRFC(cost=50),
+            lambda: calls.append("rfc") or True,
+            lambda: calls.append("match") or "cycle",
+            match_cost=5,
+        )
+
+        assert result == "cycle"
+        assert calls == ["match", "rfc"]
+
+    def test_expensive_rfc_skipped_on_structural_mismatch(self):
+        hg = Hypergraph()
+        # no E edges, the Q element is not a valid quadrilateral
+        hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0}))
+        rfc = RecordingRFC(cost=1000)
+
+        assert Prod0(rfc=rfc).apply(hg) is None
+        assert rfc.calls == []
+
+    def test_cheap_rfc_is_asked_first(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0}))
+        rfc = RecordingRFC(cost=0.5)
+
+        assert Prod0(rfc=rfc).apply(hg) is None
+        assert len(rfc.calls) == 1
+
+
+class BatchRFC:
+    """Accepts the elements containing `vertex`, one batch call at a time."""
+
+    def __init__(self, vertex):
+        self.vertex = vertex
+        self.batches = []
+
+    def is_valid(self, edge, hypergraph, meta=None):
+        raise AssertionError("is_valid_batch should be preferred")
+
+    def is_valid_batch(self, edges, hypergraph, meta=None):
+        self.batches.append(list(edges))
+        return np.array([self.vertex in edge.get_vertices() for edge in edges], dtype=bool)
+
+
+class TestBatchRFC:
+    """Test suite for RFCs evaluated over many elements at once."""
+
+    def _create_quads(self, count):
+        hg = Hypergraph()
+        for n in range(count):
+            corners = [f"v{n}_{i}" for i in range(4)]
+            for i in range(4):
+                hg.add_edge(Edge(EdgeType.E, frozenset({corners[i], corners[(i + 1) % 4]})))
+            hg.add_edge(Edge(EdgeType.Q, frozenset(corners), {"R": 0}))
+        return hg
+
+    def test_evaluate_falls_back_to_is_valid(self):
+        hg = Hypergraph()
+        edges = [Edge(EdgeType.E, frozenset({"A", "B"})), Edge(EdgeType.E, frozenset({"B", "C"}))]
+        rfc = RecordingRFC()
+
+        mask = evaluate_rfc(rfc, edges, hg)
+
+        assert mask.dtype == bool
+        assert mask.tolist() == [False, False]
+        assert rfc.calls == edges
+
+    def test_evaluate_checks_mask_shape(self):
+        class BrokenRFC:
+            def is_valid_batch(self, edges, hypergraph, meta=None):
+                return np.ones(len(edges) + 1, dtype=bool)
+
+        with pytest.raises(ValueError):
+            evaluate_rfc(BrokenRFC(), [Edge(EdgeType.E, frozenset({"A", "B"}))], Hypergraph())
+
+    def test_production_prefers_batch(self):
+        hg = self._create_quads(5)
+        rfc = BatchRFC("v3_0")
+
+        result = Prod0(rfc=rfc).apply(hg)
+
+        assert result is not None
+        assert len(rfc.batches) == 1
+        assert len(rfc.batches[0]) == 5
+        [flagged] = [q for q in result.get_edges_of_type(EdgeType.Q) if q.get_parameters()["R"] == 1]
+        assert "v3_0" in flagged.get_vertices()
+        assert Prod0(rfc=rfc).apply(hg) is None
+
+    def test_apply_stops_after_first_accepted_batch(self):
+        hg = self._create_quads(100)
+
+        class AcceptAll(BatchRFC):
+            def is_valid_batch(self, edges, hypergraph, meta=None):
+                self.batches.append(list(edges))
+                return np.ones(len(edges), dtype=bool)
+
+        rfc = AcceptAll("")
+        assert Prod0(rfc=rfc).apply(hg) is not None
+        assert [len(batch) for batch in rfc.batches] == [FIRST_RFC_BATCH]
+
+        rfc.batches.clear()
+        assert Prod0(rfc=rfc).apply_all(hg) is not None
+        assert sum(len(batch) for batch in rfc.batches) == 99
+        assert len(rfc.batches[1]) == 2 * FIRST_RFC_BATCH
+
+    def test_hypergraph_rfc_batch(self):
+        hg = self._create_quads(3)
+        hg.set_rfc(BatchRFC("v1_2"))
+        quads = hg.get_edges_of_type(EdgeType.Q)
+
+        mask = hg.edges_rfc_are_valid(quads)
+
+        assert mask.tolist() == ["v1_2" in q.get_vertices() for q in quads]
+        assert Hypergraph().edges_rfc_are_valid(quads) is None
+
+    def test_prod4_apply_all_uses_batch(self):
+        hg = Hypergraph()
+        for v1, v2, x in (("A", "B", 0.0), ("C", "D", 2.0)):
+            hg.set_vertex_parameter(v1, {"x": x, "y": 0.0})
+            hg.set_vertex_parameter(v2, {"x": x + 1, "y": 0.0})
+            hg.add_edge(Edge(EdgeType.E, frozenset({v1, v2}), {"R": 1, "B": 1}))
+        rfc = BatchRFC("C")
+
+        result = Prod4(rfc=rfc).apply_all(hg)
+
+        assert result is not None
+        assert len(rfc.batches) == 1
+        assert result.has_e_edge("A", "B")
+        assert not result.has_e_edge("C", "D")
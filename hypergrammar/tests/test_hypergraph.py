@@ -0,0 +1,168 @@
+from hypergrammar.hypergraph import Hypergraph, HypergraphListener
+from hypergrammar.edge import Edge, EdgeType
+
+
+class RecordingListener(HypergraphListener):
+    def __init__(self):
+        self.events = []
+
+    def edge_added(self, edge):
+        self.events.append(("added", edge))
+
+    def edge_removed(self, edge):
+        self.events.append(("removed", edge))
+
+    def vertex_changed(self, vertex):
+        self.events.append(("vertex", vertex))
+
+
+class TestHypergraph:
+    """Test suite for Hypergraph change notifications and indexes."""
+
+    def test_listener_receives_changes(self):
+        hg = Hypergraph()
+        listener = RecordingListener()
+        hg.add_listener(listener)
+        edge = Edge(EdgeType.E, frozenset({"A", "B"}))
+
+        hg.add_edge(edge)
+        hg.add_edge(edge)
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.remove_edge(edge)
+        hg.remove_edge(edge)
+
+        assert listener.events == [("added", edge), ("vertex", "A"), ("removed", edge)]
+        assert hg.get_version() == 3
+
+    def test_edges_by_type(self):
+        hg = Hypergraph()
+        e_edge = Edge(EdgeType.E, frozenset({"A", "B"}))
+        q_edge = Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0})
+        hg.add_edge(e_edge)
+        hg.add_edge(q_edge)
+
+        assert hg.get_edges_of_type(EdgeType.E) == [e_edge]
+        assert hg.get_edges_of_type(EdgeType.Q) == [q_edge]
+        assert hg.get_edges_of_type(EdgeType.S) == []
+        assert hg.get_edges() == frozenset({e_edge, q_edge})
+
+    def test_incidence_and_neighbours(self):
+        hg = Hypergraph()
+        ab = Edge(EdgeType.E, frozenset({"A", "B"}))
+        ac = Edge(EdgeType.E, frozenset({"A", "C"}))
+        q_edge = Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0})
+        hg.add_edge(ab)
+        hg.add_edge(ac)
+        hg.add_edge(q_edge)
+
+        assert set(hg.get_incident_edges("A")) == {ab, ac, q_edge}
+        assert set(hg.get_incident_edges("A", EdgeType.E)) == {ab, ac}
+        assert hg.get_neighbours("A") == {"B", "C"}
+        assert hg.get_neighbours("D") == set()
+
+        hg.remove_edge(ac)
+
+        assert hg.get_neighbours("A") == {"B"}
+        assert hg.get_incident_edges("C") == [q_edge]
+
+    def test_pair_lookup(self):
+        hg = Hypergraph()
+        ab = Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0})
+        hg.add_edge(ab)
+
+        assert hg.find_e_edge("B", "A") == ab
+        assert hg.has_e_edge("A", "B")
+        assert hg.find_e_edge("A", "C") is None
+
+        hg.remove_edge(ab)
+
+        assert not hg.has_e_edge("A", "B")
+
+    def test_get_vertices(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+        hg.set_vertex_parameter("C", {"x": 0, "y": 0})
+
+        assert hg.get_vertices() == {"A", "B", "C"}
+
+    def test_midpoint_registry(self):
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "M"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"M", "B"})))
+        hg.register_midpoint("A", "B", "M")
+
+        assert hg.get_midpoint("B", "A") == "M"
+        assert hg.get_midpoint_parent("M") == frozenset({"A", "B"})
+        assert hg.find_midpoint("A", "B") == "M"
+
+        hg.unregister_midpoint("A", "B")
+
+        assert hg.get_midpoint("A", "B") is None
+        assert hg.get_midpoint_parent("M") is None
+        # unregistered splits are still found through the adjacency
+        assert hg.find_midpoint("A", "B") == "M"
+        assert hg.find_midpoint("A", "B", exclude={"M"}) is None
+
+    def test_update_edge_parameters(self):
+        hg = Hypergraph()
+        edge = Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0, "B": 1})
+        hg.add_edge(edge)
+
+        new_edge = hg.update_edge_parameters(edge, {"R": 1})
+
+        assert new_edge.get_parameters() == {"R": 1, "B": 1}
+        assert edge.get_parameters() == {"R": 0, "B": 1}
+        assert hg.get_edges() == frozenset({new_edge})
+        assert hg.update_edge_parameters(new_edge, {"R": 1}) is new_edge
+
+    def test_copy_is_independent(self):
+        hg = Hypergraph()
+        edge = Edge(EdgeType.E, frozenset({"A", "B"}))
+        hg.add_edge(edge)
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.register_midpoint("A", "C", "B")
+
+        copied = hg.copy()
+        assert copied.get_midpoint("A", "C") == "B"
+        copied.remove_edge(edge)
+        copied.get_vertex_parameters("A")["x"] = 5
+
+        assert hg.has_edge(edge)
+        assert hg.get_vertex_parameters("A") == {"x": 0, "y": 0}
+
+    def test_find_midpoint_skips_far_end_of_half(self):
+        hg = Hypergraph()
+        # A-C-B split with the base A-B kept next to the hanging node C
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "C"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"C", "B"})))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+        hg.register_midpoint("A", "B", "C")
+
+        assert hg.find_midpoint("A", "B") == "C"
+        assert hg.find_midpoint("A", "C") is None
+
+    def test_element_levels(self):
+        hg = Hypergraph()
+        coarse = Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0})
+        fine = Edge(EdgeType.Q, frozenset({"A", "B", "E", "F"}), {"R": 0})
+        finer = Edge(EdgeType.Q, frozenset({"A", "G", "H", "I"}), {"R": 0})
+        for edge in (coarse, fine, finer):
+            hg.add_edge(edge)
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+        hg.set_element_level(fine, 1)
+        hg.set_element_level(finer, 2)
+
+        assert hg.get_element_level(coarse) == 0
+        assert hg.get_max_level() == 2
+        assert hg.get_elements_at_level(0) == [coarse]
+        assert set(hg.get_elements_at_least(1)) == {fine, finer}
+        assert len(hg.get_elements_at_least(0)) == 3
+
+        flagged = hg.update_edge_parameters(fine, {"R": 1})
+        assert hg.get_element_level(flagged) == 1
+        assert set(hg.get_elements_at_least(1)) == {flagged, finer}
+
+        hg.remove_edge(finer)
+        assert hg.get_elements_at_least(2) == []
+        assert hg.get_max_level() == 1
+        assert hg.copy().get_elements_at_least(1) == [flagged]
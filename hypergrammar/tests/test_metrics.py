@@ -0,0 +1,77 @@
+import numpy as np
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.adaptive import refine_to_size
+from hypergrammar.coordinates import CoordinateStore
+from hypergrammar.metrics import cycle_metrics, element_cycle, element_metrics, mesh_quality
+from hypergrammar.tests.helpers import create_hanging_node, create_mesh
+
+
+class TestMetrics:
+    """Test suite for the vectorized element quality metrics."""
+
+    def test_cycle_metrics(self):
+        store = CoordinateStore()
+        for vertex, (x, y) in {"A": (0, 0), "B": (2, 0), "C": (2, 1), "D": (0, 1), "E": (1, 2)}.items():
+            store.set(vertex, x, y)
+
+        metrics = cycle_metrics(store, [("A", "B", "C", "D"), ("D", "C", "E"), ("A", "B", "C", "E", "D")])
+
+        np.testing.assert_allclose(metrics["area"], [2.0, 1.0, 3.0])
+        np.testing.assert_allclose(metrics["diameter"][:2], [np.sqrt(5), 2.0])
+        np.testing.assert_allclose(metrics["min_angle"][:2], [np.pi / 2, np.pi / 4])
+        np.testing.assert_allclose(metrics["aspect_ratio"][:2], [2.0, np.sqrt(2)])
+        np.testing.assert_allclose(metrics["centroid"][0], [1.0, 0.5])
+        np.testing.assert_allclose(metrics["centroid"][1], [1.0, 4 / 3])
+
+    def test_min_angle_of_non_convex_cycles(self):
+        store = CoordinateStore()
+        corners = {
+            "A": (0, 0), "B": (4, 0), "C": (1, 1), "D": (0, 4),
+            "P": (0, 0), "Q": (3, 0), "R": (3, 3), "S": (2, 3),
+            "T": (1.5, 0.5), "U": (1, 3), "V": (0, 3),
+        }
+        for vertex, (x, y) in corners.items():
+            store.set(vertex, x, y)
+
+        # C and T are reflex corners, either orientation of the cycle; the notch
+        # at T is narrow enough that its supplement would be the smallest angle
+        cycles = [
+            ("A", "B", "C", "D"), ("D", "C", "B", "A"), ("P", "Q", "R", "S", "T", "U", "V"),
+        ]
+        metrics = cycle_metrics(store, cycles)
+
+        np.testing.assert_allclose(metrics["min_angle"][:2], np.arctan2(1, 3))
+        np.testing.assert_allclose(metrics["min_angle"][2], np.pi / 2)
+
+    def test_missing_coordinates(self):
+        store = CoordinateStore()
+        store.set("A", 0, 0)
+
+        metrics = cycle_metrics(store, [("A", "B", "C", "D"), ()])
+
+        assert np.isnan(metrics["area"]).all()
+        assert np.isnan(metrics["centroid"]).all()
+
+    def test_cycle_across_hanging_node(self):
+        hg = create_hanging_node()
+        hg.remove_edge(hg.find_e_edge("A", "B"))
+        element = Edge(EdgeType.Q, frozenset("ABCD"))
+        hg.add_edge(element)
+
+        assert element_cycle(hg, element) in {("A", "B", "C", "D"), ("A", "D", "C", "B")}
+
+    def test_refined_mesh(self):
+        hg = create_mesh(3)
+        refine_to_size(hg, lambda x, y: np.where(x + y <= 1.0, 0.2, 10.0), balanced=True)
+
+        quality = mesh_quality(hg)
+
+        assert len(quality) == len(hg.get_edges_of_type(EdgeType.Q))
+        assert np.isclose(quality.area.sum(), 9.0)
+        np.testing.assert_allclose(quality.min_angle, np.pi / 2)
+        np.testing.assert_allclose(quality.aspect_ratio, 1.0)
+        np.testing.assert_allclose(quality.diameter, np.sqrt(2 * quality.area))
+        first = element_metrics(hg, quality.elements[:1])
+        np.testing.assert_allclose(first.centroid, quality.centroid[:1])
@@ -0,0 +1,144 @@
+import numpy as np
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.rfc_cache import RFCCache
+from hypergrammar.productions.prod_0 import Prod0
+
+
+class CountingRFC:
+    """Accepts the elements lying left of `limit`, counting evaluations."""
+
+    def __init__(self, limit=1.0):
+        self.limit = limit
+        self.calls = 0
+
+    def is_valid(self, edge, hypergraph, meta=None):
+        self.calls += 1
+        return all(hypergraph.get_vertex_parameters(v)["x"] < self.limit for v in edge.get_vertices())
+
+    def cache_token(self):
+        return self.limit
+
+
+class BatchCountingRFC(CountingRFC):
+    def __init__(self, limit=1.0):
+        super().__init__(limit)
+        self.batch_sizes = []
+
+    def is_valid_batch(self, edges, hypergraph, meta=None):
+        self.batch_sizes.append(len(edges))
+        return np.array([CountingRFC.is_valid(self, e, hypergraph) for e in edges], dtype=bool)
+
+
+def create_graph():
+    hg = Hypergraph()
+    for v, x in (("A", 0.0), ("B", 0.5), ("C", 2.0)):
+        hg.set_vertex_parameter(v, {"x": x, "y": 0.0})
+    hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+    hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"})))
+    hg.set_rfc_cache(RFCCache())
+    return hg
+
+
+class TestRFCCache:
+    """Test suite for memoized RFC results."""
+
+    def test_results_are_memoized(self):
+        hg = create_graph()
+        rfc = CountingRFC()
+        hg.set_rfc(rfc)
+        ab = hg.find_e_edge("A", "B")
+
+        assert hg.edge_rfc_is_valid(ab) is True
+        assert hg.edge_rfc_is_valid(ab) is True
+        assert rfc.calls == 1
+
+        # changed parameters keep the identity of the element
+        flagged = hg.update_edge_parameters(ab, {"R": 1})
+        assert hg.edge_rfc_is_valid(flagged) is True
+        assert rfc.calls == 1
+        assert hg.get_rfc_cache().hits == 2
+
+    def test_vertex_move_invalidates_incident_elements(self):
+        hg = create_graph()
+        rfc = CountingRFC()
+        hg.set_rfc(rfc)
+        ab = hg.find_e_edge("A", "B")
+        bc = hg.find_e_edge("B", "C")
+        hg.edge_rfc_is_valid(ab)
+        hg.edge_rfc_is_valid(bc)
+
+        hg.set_vertex_parameter("A", {"x": 3.0, "y": 0.0})
+
+        assert hg.edge_rfc_is_valid(ab) is False
+        assert hg.edge_rfc_is_valid(bc) is False
+        assert rfc.calls == 3
+
+    def test_configuration_change_invalidates(self):
+        hg = create_graph()
+        rfc = CountingRFC()
+        hg.set_rfc(rfc)
+        bc = hg.find_e_edge("B", "C")
+        assert hg.edge_rfc_is_valid(bc) is False
+
+        rfc.limit = 5.0
+
+        assert hg.edge_rfc_is_valid(bc) is True
+        assert rfc.calls == 2
+
+    def test_dropped_results_are_unindexed(self):
+        hg = create_graph()
+        cache = hg.get_rfc_cache()
+        rfc = CountingRFC()
+        ab = hg.find_e_edge("A", "B")
+        bc = hg.find_e_edge("B", "C")
+        hg.edges_rfc_are_valid([ab, bc], rfc=rfc)
+
+        # a new configuration drops the old table with its reverse index
+        rfc.limit = 5.0
+        hg.edges_rfc_are_valid([ab], rfc=rfc)
+        assert cache._by_vertex == {"A": {cache.key(ab)}, "B": {cache.key(ab)}}
+
+        hg.set_vertex_parameter("A", {"x": 0.0, "y": 1.0})
+        assert cache._by_vertex == {}
+
+        hg.edges_rfc_are_valid([ab, bc], rfc=rfc)
+        cache.clear(rfc)
+        assert cache._by_vertex == {}
+
+    def test_set_rfc_clears_results(self):
+        hg = create_graph()
+        rfc = CountingRFC()
+        hg.set_rfc(rfc)
+        hg.edge_rfc_is_valid(hg.find_e_edge("A", "B"))
+
+        hg.set_rfc(CountingRFC())
+
+        assert len(hg.get_rfc_cache()) == 0
+
+    def test_batch_evaluates_only_missing(self):
+        hg = create_graph()
+        rfc = BatchCountingRFC()
+        edges = [hg.find_e_edge("A", "B"), hg.find_e_edge("B", "C")]
+        hg.edges_rfc_are_valid(edges[:1], rfc=rfc)
+
+        mask = hg.edges_rfc_are_valid(edges, rfc=rfc)
+
+        assert mask.tolist() == [True, False]
+        assert rfc.batch_sizes == [1, 1]
+
+    def test_productions_share_cached_results(self):
+        hg = Hypergraph()
+        for v, x, y in (("A", 2, 0), ("B", 3, 0), ("C", 3, 1), ("D", 2, 1)):
+            hg.set_vertex_parameter(v, {"x": x, "y": y})
+        for v1, v2 in (("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")):
+            hg.add_edge(Edge(EdgeType.E, frozenset({v1, v2})))
+        hg.add_edge(Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0}))
+        hg.set_rfc_cache(RFCCache())
+        rfc = CountingRFC()
+
+        for _ in range(3):
+            assert Prod0(rfc=rfc).apply(hg) is None
+
+        assert rfc.calls == 1
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.geometry import element_centroids, element_diameters
+from hypergrammar.rfc import evaluate_rfc
+from hypergrammar.rfcs import (
+    BatchRFC,
+    ErrorIndicatorRFC,
+    MaxDiameterRFC,
+    PointRadiusRFC,
+    PolygonRFC,
+    TargetSizeRFC,
+    VertexSetRFC,
+)
+from hypergrammar.productions.prod_0 import Prod0
+
+
+def create_graph():
+    """Unit square ABCD, a 1 x 2 rectangle DCEF above it and an edge to a vertex without coordinates."""
+    hg = Hypergraph()
+    for v, x, y in (("A", 0, 0), ("B", 1, 0), ("C", 1, 1), ("D", 0, 1), ("E", 1, 3), ("F", 0, 3)):
+        hg.set_vertex_parameter(v, {"x": float(x), "y": float(y)})
+    square = Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0})
+    rectangle = Edge(EdgeType.Q, frozenset({"D", "C", "E", "F"}), {"R": 0})
+    unknown = Edge(EdgeType.E, frozenset({"A", "X"}))
+    for edge in (square, rectangle, unknown):
+        hg.add_edge(edge)
+    return hg, [square, rectangle, unknown]
+
+
+class TestElementGeometry:
+    """Test suite for the batched element centroids and diameters."""
+
+    def test_centroids(self):
+        hg, edges = create_graph()
+
+        centroids = element_centroids(hg, edges)
+
+        assert centroids[:2].tolist() == [[0.5, 0.5], [0.5, 2.0]]
+        assert np.isnan(centroids[2]).all()
+
+    def test_diameters(self):
+        hg, edges = create_graph()
+
+        diameters = element_diameters(hg, edges)
+
+        assert diameters[:2] == pytest.approx([np.sqrt(2), np.sqrt(5)])
+        assert np.isnan(diameters[2])
+
+
+class TestRFCLibrary:
+    """Test suite for the built-in batch RFCs."""
+
+    def test_vertex_set(self):
+        hg, edges = create_graph()
+        rfc = VertexSetRFC({"E"})
+
+        assert rfc.is_valid_batch(edges, hg).tolist() == [False, True, False]
+        assert rfc.is_valid(edges[1], hg)
+
+    def test_point_radius(self):
+        hg, edges = create_graph()
+        rfc = PointRadiusRFC((0.5, 0.4), radius=0.2)
+
+        assert rfc.is_valid_batch(edges, hg).tolist() == [True, False, False]
+
+        old_token = rfc.cache_token()
+        rfc.set_target_point(None)
+        assert rfc.cache_token() != old_token
+        assert not rfc.is_valid_batch(edges, hg).any()
+
+    def test_polygon(self):
+        hg, edges = create_graph()
+        rfc = PolygonRFC([(0, 1.5), (2, 1.5), (2, 4), (0, 4)])
+
+        assert rfc.is_valid_batch(edges, hg).tolist() == [False, True, False]
+
+    def test_max_diameter(self):
+        hg, edges = create_graph()
+
+        assert MaxDiameterRFC(2.0).is_valid_batch(edges, hg).tolist() == [False, True, False]
+
+    def test_error_indicator(self):
+        hg, edges = create_graph()
+        samples = []
+
+        def indicator(x, y):
+            samples.append(len(x))
+            return y
+
+        rfc = ErrorIndicatorRFC(indicator, threshold=1.0)
+
+        assert rfc.is_valid_batch(edges, hg).tolist() == [False, True, False]
+        assert samples == [2]
+
+    def test_batch_rfc_is_abstract(self):
+        with pytest.raises(TypeError):
+            BatchRFC()
+
+    def test_cache_token_holds_the_callable(self):
+        def indicator(x, y):
+            return y
+
+        def size(x, y):
+            return x
+
+        assert ErrorIndicatorRFC(indicator, threshold=1.0).cache_token() == (indicator, 1.0)
+        assert TargetSizeRFC(size).cache_token() is size
+        assert TargetSizeRFC(0.5).cache_token() == 0.5
+
+    def test_used_by_productions(self):
+        hg, edges = create_graph()
+        for v1, v2 in (("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"), ("C", "E"), ("E", "F"), ("F", "D")):
+            hg.add_edge(Edge(EdgeType.E, frozenset({v1, v2})))
+
+        result = Prod0(rfc=MaxDiameterRFC(2.0)).apply(hg)
+
+        assert result is not None
+        [flagged] = [q for q in result.get_edges_of_type(EdgeType.Q) if q.get_parameters()["R"] == 1]
+        assert flagged.get_vertices() == edges[1].get_vertices()
+        assert evaluate_rfc(VertexSetRFC({"A"}), edges, hg).tolist() == [True, False, True]
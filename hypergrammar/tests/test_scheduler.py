@@ -0,0 +1,96 @@
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_1 import Prod1
+from hypergrammar.productions.prod_2 import Prod2
+from hypergrammar.productions.prod_3 import Prod3
+from hypergrammar.productions.prod_4 import Prod4
+from hypergrammar.productions.prod_5 import Prod5
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.scheduler import EdgePattern, WorklistScheduler
+from hypergrammar.tests.helpers import CountingProd, create_square
+
+
+class OriginalSquareRFC:
+    """Accepts only the initial square, so the derivation terminates."""
+
+    def is_valid(self, edge, hypergraph, meta=None):
+        return edge.get_vertices() == frozenset({"A", "B", "C", "D"})
+
+
+class TestWorklistScheduler:
+    """Test suite for the dirty-set worklist scheduler."""
+
+    def test_edge_pattern_matches_type_and_parameters(self):
+        pattern = EdgePattern(EdgeType.Q, {"R": 1})
+
+        assert pattern.matches(Edge(EdgeType.Q, frozenset({"A"}), {"R": 1}))
+        assert not pattern.matches(Edge(EdgeType.Q, frozenset({"A"}), {"R": 0}))
+        assert not pattern.matches(Edge(EdgeType.E, frozenset({"A"}), {"R": 1}))
+
+    def test_run_refines_square_to_fixpoint(self):
+        hg = create_square()
+        scheduler = WorklistScheduler([Prod0(rfc=OriginalSquareRFC()), Prod1(), Prod4(), Prod5()])
+
+        result, steps = scheduler.run(hg)
+
+        # Prod0, Prod1, four boundary splits and Prod5
+        assert steps == 7
+        q_edges = [e for e in result.get_edges() if e.get_type() == EdgeType.Q]
+        assert len(q_edges) == 4
+        e_edges = [e for e in result.get_edges() if e.get_type() == EdgeType.E]
+        assert len(e_edges) == 12
+
+    def test_failed_production_is_not_reprobed_after_unrelated_change(self):
+        hg = create_square()
+        # S edge is never touched by the quad productions
+        hg.add_edge(Edge(EdgeType.S, frozenset({"S1", "S2", "S3", "S4", "S5", "S6"}), {"R": 1}))
+        prod9 = CountingProd(Prod9())
+        scheduler = WorklistScheduler([prod9, Prod0(rfc=OriginalSquareRFC()), Prod1(), Prod4(), Prod5()])
+
+        scheduler.run(hg)
+
+        assert prod9.calls == 1
+
+    def test_run_respects_max_steps(self):
+        hg = create_square()
+        scheduler = WorklistScheduler([Prod0(rfc=OriginalSquareRFC()), Prod1(), Prod4(), Prod5()])
+
+        _, steps = scheduler.run(hg, max_steps=2)
+
+        assert steps == 2
+        q_edges = [e for e in hg.get_edges() if e.get_type() == EdgeType.Q]
+        assert q_edges[0].get_parameters()["R"] == 1
+
+    def test_run_calls_on_apply_hook(self):
+        hg = create_square()
+        applied = []
+        scheduler = WorklistScheduler([Prod0(rfc=OriginalSquareRFC()), Prod1()])
+
+        scheduler.run(hg, on_apply=lambda prod, graph: applied.append(type(prod)))
+
+        assert applied == [Prod0, Prod1]
+
+    def test_unknown_production_is_reprobed_after_every_change(self):
+        hg = create_square()
+
+        class NeverProd:
+            def apply(self, graph):
+                return None
+        never = CountingProd(NeverProd())
+        never.READS = None
+        scheduler = WorklistScheduler([never, Prod0(rfc=OriginalSquareRFC()), Prod1()])
+
+        scheduler.run(hg)
+
+        # initial probe plus one after each of the two rewrites
+        assert never.calls == 3
+
+    def test_scheduler_detaches_from_graph(self):
+        hg = create_square()
+        scheduler = WorklistScheduler(
+            [Prod0(rfc=OriginalSquareRFC()), Prod1(), Prod2(), Prod3(), Prod4(), Prod5()]
+        )
+
+        scheduler.run(hg)
+
+        assert not hg._listeners
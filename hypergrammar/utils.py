@@ -1,4 +1,6 @@
 import uuid
+from typing import Callable
+
 from hypergrammar.edge import Edge
 
 
@@ -12,6 +14,26 @@ def generate_vertex_name() -> str:
     return str(uuid.uuid4())[:id_len]
 
 
+class NameAllocator:
+    """Generates vertex names `<prefix><n>` from a counter.
+
+    Names for which `is_taken` returns True are skipped, so the allocator
+    can be used on graphs that already contain such names.
+    """
+
+    def __init__(self, prefix: str, is_taken: Callable[[str], bool]) -> None:
+        self._prefix = prefix
+        self._is_taken = is_taken
+        self._next = 0
+
+    def allocate(self) -> str:
+        while True:
+            name = f"{self._prefix}{self._next}"
+            self._next += 1
+            if not self._is_taken(name):
+                return name
+
+
 def get_edge_color(edge: Edge) -> str:
     if edge.parameters.get("R") == 1 and edge.parameters.get("B") == 1:
         return "purple"